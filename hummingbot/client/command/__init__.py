@@ -11,6 +11,7 @@ from .import_command import ImportCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
 from .previous_strategy_command import PreviousCommand
+from .profile_command import ProfileCommand
 from .rate_command import RateCommand
 from .silly_commands import SillyCommands
 from .start_command import StartCommand
@@ -32,6 +33,7 @@ __all__ = [
     OrderBookCommand,
     PMMScriptCommand,
     PreviousCommand,
+    ProfileCommand,
     RateCommand,
     SillyCommands,
     StartCommand,
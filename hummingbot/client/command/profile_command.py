@@ -0,0 +1,52 @@
+import os
+import time
+from typing import TYPE_CHECKING
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.clock_profiler import ClockProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                option: str = None):
+        if self.clock is None:
+            self.notify("\n This command can only be used while a strategy is running")
+            return
+        if option == "start":
+            self.clock.profiler = ClockProfiler()
+            self.notify("\n Clock profiling started.")
+        elif self.clock.profiler is None:
+            self.notify("\n Clock profiling is not running. Use `profile start` to start it.")
+        elif option == "stop":
+            self.clock.profiler = None
+            self.notify("\n Clock profiling stopped.")
+        elif option == "export":
+            self.export_profile()
+        else:
+            self.show_profile()
+
+    def show_profile(self,  # type: HummingbotApplication
+                     ):
+        profiler: ClockProfiler = self.clock.profiler
+        lines = [f"\n  Tick size: {self.clock.tick_size} s, overruns: {profiler.overruns}, "
+                 f"missed ticks: {profiler.missed_ticks}"]
+        df_str = format_df_for_printout(profiler.durations_df().round(3), max_col_width=40)
+        lines.extend(["    " + line for line in df_str.split("\n")])
+        self.notify("\n".join(lines))
+
+    def export_profile(self,  # type: HummingbotApplication
+                       ):
+        path = global_config_map["log_file_path"].value
+        if path is None:
+            path = DEFAULT_LOG_FILE_PATH
+        file_path = os.path.join(path, f"clock_profile_{int(time.time())}.json")
+        try:
+            self.clock.profiler.export(file_path)
+            self.notify(f"Successfully exported the clock profile to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting the clock profile to {path}: {e}")
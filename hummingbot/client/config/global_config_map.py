@@ -227,6 +227,13 @@ main_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    "db_write_behind":
+        ConfigVar(key="db_write_behind",
+                  prompt="Would you like to write the trades database records in the background? (Yes/No) >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False,
+                  validator=validate_bool),
     PMM_SCRIPT_ENABLED_KEY:
         ConfigVar(key=PMM_SCRIPT_ENABLED_KEY,
                   prompt="Would you like to enable PMM script feature? (Yes/No) >>> ",
@@ -300,6 +300,7 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=global_config_map.get("db_write_behind").value or False,
         )
         self.markets_recorder.start()
 
@@ -72,9 +72,10 @@ class PerformanceMetrics:
     async def create(cls,
                      trading_pair: str,
                      trades: List[Any],
-                     current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+                     current_balances: Dict[str, Decimal],
+                     current_price: Optional[Decimal] = None) -> 'PerformanceMetrics':
         performance = PerformanceMetrics()
-        await performance._initialize_metrics(trading_pair, trades, current_balances)
+        await performance._initialize_metrics(trading_pair, trades, current_balances, current_price)
         return performance
 
     @staticmethod
@@ -273,12 +274,14 @@ class PerformanceMetrics:
     async def _initialize_metrics(self,
                                   trading_pair: str,
                                   trades: List[Any],
-                                  current_balances: Dict[str, Decimal]):
+                                  current_balances: Dict[str, Decimal],
+                                  current_price: Optional[Decimal] = None):
         """
         Calculates PnL, fees, Return % and etc...
         :param trading_pair: the trading market to get performance metrics
         :param trades: the list of TradeFill or Trade object
         :param current_balances: current user account balance
+        :param current_price: the current price of the trading pair, if None it is taken from the rate oracle
         """
 
         base, quote = split_hb_trading_pair(trading_pair)
@@ -293,10 +296,12 @@ class PerformanceMetrics:
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
-        self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
+        self.cur_price = current_price
+        if self.cur_price is None:
+            self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
             self.cur_price = Decimal(str(trades[-1].price))
+        self.start_price = Decimal(str(trades[0].price)) if len(trades) > 0 else self.cur_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -43,6 +43,7 @@ class HummingbotCompleter(Completer):
         self._connect_option_completer = WordCompleter(CONNECT_OPTIONS, ignore_case=True)
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
+        self._profile_completer = WordCompleter(["start", "stop", "export"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
         self._gateway_completer = WordCompleter(["create", "config", "connect", "connector-tokens", "generate-certs", "status", "test-connection", "start", "stop"], ignore_case=True)
         self._gateway_connect_completer = WordCompleter(GATEWAY_CONNECTORS, ignore_case=True)
@@ -149,6 +150,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return "export" in text_before_cursor
 
+    def _complete_profile_options(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def _complete_balance_options(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("balance ")
@@ -276,6 +281,10 @@ class HummingbotCompleter(Completer):
             for c in self._export_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_profile_options(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_balance_limit_exchanges(document):
             for c in self._connect_option_completer.get_completions(document, complete_event):
                 yield c
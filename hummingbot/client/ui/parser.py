@@ -138,6 +138,11 @@ def load_parser(hummingbot, command_tabs) -> [ThrowingArgumentParser, Any]:
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    profile_parser = subparsers.add_parser("profile", help="Show or export the clock tick statistics")
+    profile_parser.add_argument("option", nargs="?", choices=("start", "stop", "export"), default=None,
+                                help="Start, stop or export the clock profiling")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -4,6 +4,7 @@ from collections import defaultdict
 from decimal import Decimal
 from typing import Callable, Dict, Optional
 
+from bidict import bidict
 from cachetools import TTLCache
 
 from hummingbot.connector.connector_base import ConnectorBase
@@ -53,6 +54,9 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        # Client order id <-> exchange order id of the active and cached orders. The entries of orders that left the
+        # cache are removed when they are found in a lookup, or when the index grows too much
+        self._exchange_order_ids: bidict = bidict()
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -88,11 +92,15 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        order.set_exchange_order_id_listener(self._index_exchange_order_id)
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            if len(self._exchange_order_ids) > len(self._in_flight_orders) + 2 * self.MAX_CACHE_SIZE:
+                self._remove_expired_exchange_order_ids()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -115,15 +123,40 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if client_order_id is not None:
+            found_order = self._fetch_active_or_cached_order(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            indexed_client_order_id = self._exchange_order_ids.inverse.get(exchange_order_id)
+            if indexed_client_order_id is not None:
+                found_order = self._fetch_active_or_cached_order(indexed_client_order_id)
+                if found_order is None:
+                    # The order is no longer in the cache
+                    del self._exchange_order_ids[indexed_client_order_id]
 
         return found_order
 
+    def fetch_exchange_order_id(self, client_order_id: str) -> Optional[str]:
+        """
+        Returns the exchange order id of an active or cached order, None if the order doesn't have it yet
+        """
+        return self._exchange_order_ids.get(client_order_id)
+
+    def _fetch_active_or_cached_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        order = self._in_flight_orders.get(client_order_id)
+        if order is None:
+            order = self._cached_orders.get(client_order_id)
+        return order
+
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._exchange_order_ids.forceput(order.client_order_id, order.exchange_order_id)
+
+    def _remove_expired_exchange_order_ids(self):
+        expired_client_order_ids = [client_order_id for client_order_id in self._exchange_order_ids
+                                    if self._fetch_active_or_cached_order(client_order_id) is None]
+        for client_order_id in expired_client_order_ids:
+            del self._exchange_order_ids[client_order_id]
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
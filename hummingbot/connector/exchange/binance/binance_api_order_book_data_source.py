@@ -68,10 +68,13 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Subscribes to the trade events and diff orders events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
+        await self._subscribe_trading_pairs_channels(ws, self._trading_pairs)
+
+    async def _subscribe_trading_pairs_channels(self, ws: WSAssistant, trading_pairs: List[str]):
         try:
             trade_params = []
             depth_params = []
-            for trading_pair in self._trading_pairs:
+            for trading_pair in trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
                 trade_params.append(f"{symbol.lower()}@trade")
                 depth_params.append(f"{symbol.lower()}@depth@100ms")
@@ -37,6 +37,10 @@ TIME_IN_FORCE_GTC = 'GTC'  # Good till cancelled
 TIME_IN_FORCE_IOC = 'IOC'  # Immediate or cancel
 TIME_IN_FORCE_FOK = 'FOK'  # Fill or kill
 
+# Error codes
+TIMESTAMP_RELATED_ERROR_CODE = -1021
+TIMESTAMP_RELATED_ERROR_MESSAGE = "Timestamp for this request"
+
 # Rate Limit Type
 REQUEST_WEIGHT = "REQUEST_WEIGHT"
 ORDERS = "ORDERS"
@@ -113,6 +113,11 @@ class BinanceExchange(ExchangePyBase):
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
+        error_description = str(request_exception)
+        return (str(CONSTANTS.TIMESTAMP_RELATED_ERROR_CODE) in error_description
+                and CONSTANTS.TIMESTAMP_RELATED_ERROR_MESSAGE in error_description)
+
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         return web_utils.build_api_factory(
             throttler=self._throttler,
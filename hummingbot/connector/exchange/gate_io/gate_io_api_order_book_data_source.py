@@ -121,8 +121,11 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         :param ws: the websocket assistant used to connect to the exchange
         """
+        await self._subscribe_trading_pairs_channels(ws, self._trading_pairs)
+
+    async def _subscribe_trading_pairs_channels(self, ws: WSAssistant, trading_pairs: List[str]):
         try:
-            for trading_pair in self._trading_pairs:
+            for trading_pair in trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
 
                 trades_payload = {
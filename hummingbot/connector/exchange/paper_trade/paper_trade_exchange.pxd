@@ -31,6 +31,7 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        dict _limit_order_prices
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
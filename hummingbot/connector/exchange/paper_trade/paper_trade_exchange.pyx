@@ -159,6 +159,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
+        self._limit_order_prices = {}
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
@@ -274,8 +275,9 @@ cdef class PaperTradeExchange(ExchangeBase):
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
+        _on_hold_balances = self.on_hold_balances
         for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+            _available_balances[trading_pair_str] -= _on_hold_balances[trading_pair_str]
         return _available_balances
 
     # </editor-fold>
@@ -343,6 +345,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            self._limit_order_prices[order_id] = quantized_price
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -401,6 +404,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            self._limit_order_prices[order_id] = quantized_price
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -612,6 +616,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self._limit_order_prices.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -960,13 +965,23 @@ cdef class PaperTradeExchange(ExchangeBase):
                 return []
 
             limit_orders_collection_ptr = address(deref(map_it).second)
-            orders_it = limit_orders_collection_ptr.begin()
-            while orders_it != limit_orders_collection_ptr.end():
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                if (not cancel_all and limit_order_cid == client_order_id) or cancel_all:
+            if cancel_all:
+                orders_it = limit_orders_collection_ptr.begin()
+                while orders_it != limit_orders_collection_ptr.end():
+                    process_order_its.push_back(orders_it)
+                    inc(orders_it)
+            elif client_order_id in self._limit_order_prices:
+                # The orders are sorted by price and client order id, so the order is found without a scan
+                price = self._limit_order_prices[client_order_id]
+                orders_it = limit_orders_collection_ptr.find(CPPLimitOrder(client_order_id.encode("utf8"),
+                                                                           cpp_trading_pair,
+                                                                           False,
+                                                                           b"",
+                                                                           b"",
+                                                                           <PyObject *> price,
+                                                                           <PyObject *> s_decimal_0))
+                if orders_it != limit_orders_collection_ptr.end():
                     process_order_its.push_back(orders_it)
-                inc(orders_it)
 
             for orders_it in process_order_its:
                 limit_order_ptr = address(deref(orders_it))
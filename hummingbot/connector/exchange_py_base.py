@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
@@ -54,6 +53,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._trading_fees_polling_task = None
+        self._time_resynchronization_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(self.rate_limits_rules)
@@ -68,7 +68,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            concurrent_bootstrap=True))
 
         # init UserStream Data Source and Tracker
         self._userstream_ds = self._create_user_stream_data_source()
@@ -725,14 +726,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         Performs all required operation to keep the connector updated and synchronized with the exchange.
         It contains the backup logic to update status using API requests in case the main update source
         (the user stream data source websocket) fails.
-        It also updates the time synchronizer. This is necessary because the exchange requires
-        the time of the client to be the same as the time in the exchange.
+        It also updates the time synchronizer when a synchronization is due. This is necessary because the exchange
+        requires the time of the client to be the same as the time in the exchange.
         Executes when the _poll_notifier event is enabled by the `tick` function.
         """
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                if self._time_synchronizer.is_sync_required:
+                    await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
                 await self._status_polling_loop_fetch_updates()
@@ -819,15 +821,47 @@ class ExchangePyBase(ExchangeBase, ABC):
         else:
             url = self.web_utils.public_rest_url(path_url, domain=self.domain)
 
-        return await rest_assistant.execute_request(
-            url=url,
-            params=params,
-            data=data,
-            method=method,
-            is_auth_required=is_auth_required,
-            return_err=return_err,
-            throttler_limit_id=limit_id if limit_id else path_url,
-        )
+        try:
+            return await rest_assistant.execute_request(
+                url=url,
+                params=params,
+                data=data,
+                method=method,
+                is_auth_required=is_auth_required,
+                return_err=return_err,
+                throttler_limit_id=limit_id if limit_id else path_url,
+            )
+        except IOError as request_exception:
+            if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
+                # The exchange rejected the request timestamp, the server time has to be synchronized again
+                try:
+                    await self._resynchronize_time()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as synchronization_exception:
+                    raise request_exception from synchronization_exception
+            raise
+
+    async def _resynchronize_time(self):
+        """
+        Discards the time offset samples and synchronizes the time with the server again. The requests rejected
+        concurrently because of their timestamp wait for the same synchronization instead of starting their own.
+        """
+        if self._time_resynchronization_task is None or self._time_resynchronization_task.done():
+            self._time_synchronizer.clear_time_offset_ms_samples()
+            self._time_resynchronization_task = asyncio.ensure_future(self._update_time_synchronizer())
+        # Shielded, so a cancelled request does not cancel the synchronization the other requests wait for
+        await asyncio.shield(self._time_resynchronization_task)
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
+        """
+        Checks if a request failed because the exchange rejected the request timestamp. Connectors for exchanges that
+        report those errors should override this method, to synchronize the time with the server immediately.
+
+        :param request_exception: the exception raised by the request
+        :return: True if the error is caused by the request timestamp, False otherwise
+        """
+        return False
 
     async def _status_polling_loop_fetch_updates(self):
         """
@@ -842,7 +876,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_balances()
         if not self.real_time_balance_update:
             # This is only required for exchanges that do not provide balance update notifications through websocket
-            self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
+            # Copy on write: the copies of orders that did not change since the last snapshot are reused
+            previous_snapshot = self._in_flight_orders_snapshot
+            self._in_flight_orders_snapshot = {
+                client_order_id: order.snapshot(previous_snapshot.get(client_order_id))
+                for client_order_id, order in self.in_flight_orders.items()}
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     # Methods tied to specific API data formats
@@ -1,4 +1,3 @@
-import copy
 from decimal import Decimal
 from typing import Any, Dict, Optional, Tuple
 
@@ -13,6 +12,8 @@ s_decimal_0 = Decimal("0")
 
 
 class GatewayInFlightOrder(InFlightOrder):
+    __slots__ = ("_gas_price", "_nonce", "_cancel_tx_hash", "fee_asset")
+
     def __init__(
         self,
         client_order_id: str,
@@ -76,27 +77,7 @@ class GatewayInFlightOrder(InFlightOrder):
 
     @property
     def attributes(self) -> Tuple[Any]:
-        return copy.deepcopy(
-            (
-                self.client_order_id,
-                self.trading_pair,
-                self.order_type,
-                self.trade_type,
-                self.price,
-                self.amount,
-                self.exchange_order_id,
-                self.current_state,
-                self.leverage,
-                self.position,
-                self.executed_amount_base,
-                self.executed_amount_quote,
-                self.creation_timestamp,
-                self.last_update_timestamp,
-                self.nonce,
-                self.gas_price,
-                self.cancel_tx_hash,
-            )
-        )
+        return super().attributes + (self.nonce, self.gas_price, self.cancel_tx_hash)
 
     @property
     def is_done(self) -> bool:
@@ -1,10 +1,13 @@
 import asyncio
+import csv
+import logging
 import os.path
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -26,8 +29,10 @@ from hummingbot.core.event.events import (
     RangePositionInitiatedEvent,
     RangePositionUpdatedEvent,
     SellOrderCompletedEvent,
-    SellOrderCreatedEvent
+    SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -37,18 +42,89 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
+# A pending write receives the session of the transaction it runs in, and returns True if the market states have to be
+# saved after it, together with the trade fills to append to the trades CSV file once the transaction is committed.
+RecordWriter = Callable[[Session], Tuple[bool, List[TradeFill]]]
+
+
+class TradesCsvWriter:
+    """
+    Appends trade rows to a CSV file that is kept open, with buffered writes. The header of an existing file is
+    checked once when the file is opened, if it doesn't match the file is moved aside and a new one is started.
+    """
+
+    def __init__(self, csv_path: str, field_names: Tuple[str, ...]):
+        self._csv_path: str = csv_path
+        self._field_names: Tuple[str, ...] = field_names
+        self._lock: threading.Lock = threading.Lock()
+
+        if os.path.exists(csv_path) and not self._csv_matches_header(csv_path, field_names):
+            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        write_header: bool = not os.path.exists(csv_path)
+        self._file: TextIO = open(csv_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(field_names)
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @property
+    def field_names(self) -> Tuple[str, ...]:
+        return self._field_names
+
+    @staticmethod
+    def _csv_matches_header(file_path: str, header: tuple) -> bool:
+        with open(file_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return first_row is not None and tuple(first_row) == header
+
+    def write_row(self, row: Tuple[Any, ...]):
+        with self._lock:
+            self._writer.writerow(row)
+
+    def flush(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
 
 class MarketsRecorder:
+    MAX_PENDING_WRITES: int = 1000
+    CSV_FLUSH_INTERVAL: float = 5.0
+    _mr_logger: Optional[HummingbotLogger] = None
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False):
+        """
+        :param sql: the connection manager of the trades database
+        :param markets: the connectors whose events are recorded
+        :param config_file_path: the strategy config file the records belong to
+        :param strategy_name: the strategy the records belong to
+        :param write_behind: if True the records are queued and written in grouped transactions by a background
+        worker, instead of being written synchronously when each event is received. The queued records are written
+        when the recorder is stopped.
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -57,6 +133,15 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind: bool = write_behind
+        self._pending_writes: List[Tuple[ConnectorBase, RecordWriter]] = []
+        self._pending_writes_event: asyncio.Event = asyncio.Event()
+        self._write_lock: threading.Lock = threading.Lock()
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        self._write_behind_task: Optional[asyncio.Task] = None
+        self._csv_writers: Dict[str, TradesCsvWriter] = {}
+        self._csv_writers_lock: threading.Lock = threading.Lock()
+        self._csv_flush_task: Optional[asyncio.Task] = None
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -110,15 +195,160 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def pending_writes_count(self) -> int:
+        return len(self._pending_writes)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._write_behind and self._write_behind_task is None:
+            # A single worker thread, so the batches are written in order
+            self._write_executor = ThreadPoolExecutor(max_workers=1)
+            self._write_behind_task = safe_ensure_future(self._write_behind_loop())
+        if self._csv_flush_task is None:
+            self._csv_flush_task = safe_ensure_future(self._csv_flush_loop())
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._write_behind_task is not None:
+            self._write_behind_task.cancel()
+            self._write_behind_task = None
+        # Write what is still queued. The write lock makes it wait for a batch being written by the worker.
+        self.flush()
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+        if self._csv_flush_task is not None:
+            self._csv_flush_task.cancel()
+            self._csv_flush_task = None
+        self.close_csv_writers()
+
+    def flush(self):
+        """
+        Writes all the queued records synchronously, in a single transaction.
+        """
+        if len(self._pending_writes) > 0:
+            writes, market_states = self._take_pending_writes()
+            self._write_records(writes, market_states)
+
+    def flush_csv_writers(self):
+        with self._csv_writers_lock:
+            csv_writers = list(self._csv_writers.values())
+        for csv_writer in csv_writers:
+            csv_writer.flush()
+
+    def close_csv_writers(self):
+        with self._csv_writers_lock:
+            csv_writers = list(self._csv_writers.values())
+            self._csv_writers.clear()
+        for csv_writer in csv_writers:
+            csv_writer.close()
+
+    async def _csv_flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.CSV_FLUSH_INTERVAL)
+                self.flush_csv_writers()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error flushing the trades CSV files.", exc_info=True)
+
+    async def _write_behind_loop(self):
+        while True:
+            try:
+                await self._pending_writes_event.wait()
+                self._pending_writes_event.clear()
+                if len(self._pending_writes) == 0:
+                    continue
+                writes, market_states = self._take_pending_writes()
+                await self._ev_loop.run_in_executor(self._write_executor,
+                                                    self._write_records,
+                                                    writes,
+                                                    market_states)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error writing market records.", exc_info=True)
+
+    def _record(self, market: ConnectorBase, writer: RecordWriter):
+        """
+        Writes the records of an event, in its own transaction or queued for the write-behind worker.
+        """
+        if not self._write_behind:
+            self._write_records([(market, writer)], {})
+            return
+
+        self._pending_writes.append((market, writer))
+        if len(self._pending_writes) >= self.MAX_PENDING_WRITES:
+            # The queue is bounded, the events producing records faster than the worker can write them wait here
+            self.flush()
+        else:
+            self._pending_writes_event.set()
+
+    def _take_pending_writes(self) -> Tuple[List[Tuple[ConnectorBase, RecordWriter]],
+                                            Dict[ConnectorBase, Tuple[Any, int]]]:
+        """
+        Takes the queued writes, together with the current tracking states of their markets. The states are read
+        here in the event loop thread, once per batch instead of once per record.
+        """
+        writes = self._pending_writes
+        self._pending_writes = []
+        timestamp: int = self.db_timestamp
+        market_states = {market: (market.tracking_states, timestamp) for market, _ in writes}
+        return writes, market_states
+
+    def _write_records(self,
+                       writes: List[Tuple[ConnectorBase, RecordWriter]],
+                       market_states: Dict[ConnectorBase, Tuple[Any, int]]):
+        """
+        Writes a batch of records in a single transaction. If the transaction fails the records are written again one
+        per transaction, so a failing record does not discard the rest of the batch.
+        """
+        with self._write_lock:
+            if len(writes) == 1:
+                self._write_records_transaction(writes, market_states)
+                return
+            try:
+                self._write_records_transaction(writes, market_states)
+            except Exception:
+                self.logger().warning("Error writing a batch of market records. Writing them one at a time.",
+                                      exc_info=True)
+                for write in writes:
+                    try:
+                        self._write_records_transaction([write], market_states)
+                    except Exception:
+                        self.logger().error("Unexpected error writing market records.", exc_info=True)
+
+    def _write_records_transaction(self,
+                                   writes: List[Tuple[ConnectorBase, RecordWriter]],
+                                   market_states: Dict[ConnectorBase, Tuple[Any, int]]):
+        with self._sql_manager.get_new_session() as session:
+            trades: List[TradeFill] = []
+            with session.begin():
+                markets_to_save: List[ConnectorBase] = []
+                for market, writer in writes:
+                    save_market_states, written_trades = writer(session)
+                    trades.extend(written_trades)
+                    if save_market_states and market not in markets_to_save:
+                        markets_to_save.append(market)
+                for market in markets_to_save:
+                    if market in market_states:
+                        saved_state, timestamp = market_states[market]
+                        self._save_market_state(market, saved_state, timestamp, session)
+                    else:
+                        self.save_market_states(self._config_file_path, market, session=session)
+            # The trades are only exported once committed, a transaction that fails (and is retried) adds no CSV rows
+            for trade in trades:
+                self.append_to_csv(trade)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -149,17 +379,25 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+        self._save_market_state(market, market.tracking_states, self.db_timestamp, session, config_file_path)
+
+    def _save_market_state(self,
+                           market: ConnectorBase,
+                           saved_state: Any,
+                           timestamp: int,
+                           session: Session,
+                           config_file_path: Optional[str] = None):
+        config_file_path = config_file_path or self._config_file_path
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -192,31 +430,32 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        def write_order_creation(session: Session) -> Tuple[bool, List[TradeFill]]:
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market.display_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            return True, []
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(market, write_order_creation)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -231,47 +470,46 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        def write_order_fill(session: Session) -> Tuple[bool, List[TradeFill]]:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market.display_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=Decimal(
+                    evt.price) if evt.price == evt.price else Decimal(0),
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            return True, [trade_fill_record]
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._record(market, write_order_fill)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -283,24 +521,31 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write_funding_payment(session: Session) -> Tuple[bool, List[TradeFill]]:
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+            return False, []
+
+        self._record(market, write_funding_payment)
+
+    def _get_csv_writer(self, csv_path: str, field_names: Tuple[str, ...]) -> TradesCsvWriter:
+        with self._csv_writers_lock:
+            csv_writer: Optional[TradesCsvWriter] = self._csv_writers.get(csv_path)
+            if csv_writer is None or csv_writer.field_names != field_names:
+                if csv_writer is not None:
+                    csv_writer.close()
+                csv_writer = TradesCsvWriter(csv_path, field_names)
+                self._csv_writers[csv_path] = csv_writer
+            return csv_writer
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -311,19 +556,13 @@ class MarketsRecorder:
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
+        age = time.strftime('%H:%M:%S', time.gmtime(
+            int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)))) if (
+            trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        self._get_csv_writer(csv_path, field_names).write_row(field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -341,18 +580,20 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write_order_status(session: Session) -> Tuple[bool, List[TradeFill]]:
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                return True, []
+            return False, []
+
+        self._record(market, write_order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -388,24 +629,25 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
-                                                     config_file_path=self._config_file_path,
-                                                     strategy=self._strategy_name,
-                                                     tx_hash=evt.tx_hash,
-                                                     connector=connector.display_name,
-                                                     trading_pair=evt.trading_pair,
-                                                     fee_tier=str(evt.fee_tier),
-                                                     lower_price=float(evt.lower_price),
-                                                     upper_price=float(evt.upper_price),
-                                                     base_amount=float(evt.base_amount),
-                                                     quote_amount=float(evt.quote_amount),
-                                                     status=evt.status,
-                                                     creation_timestamp=timestamp,
-                                                     last_update_timestamp=timestamp)
-                session.add(r_pos)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write_range_position(session: Session) -> Tuple[bool, List[TradeFill]]:
+            r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
+                                                 config_file_path=self._config_file_path,
+                                                 strategy=self._strategy_name,
+                                                 tx_hash=evt.tx_hash,
+                                                 connector=connector.display_name,
+                                                 trading_pair=evt.trading_pair,
+                                                 fee_tier=str(evt.fee_tier),
+                                                 lower_price=float(evt.lower_price),
+                                                 upper_price=float(evt.upper_price),
+                                                 base_amount=float(evt.base_amount),
+                                                 quote_amount=float(evt.quote_amount),
+                                                 status=evt.status,
+                                                 creation_timestamp=timestamp,
+                                                 last_update_timestamp=timestamp)
+            session.add(r_pos)
+            return True, []
+
+        self._record(connector, write_range_position)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -417,18 +659,20 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-                    RangePosition.hb_id == evt.hb_id).one_or_none()
-                if rp_record is not None:
-                    rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                         timestamp=timestamp,
-                                                                         tx_hash=evt.tx_hash,
-                                                                         token_id=evt.token_id,
-                                                                         base_amount=float(evt.base_amount),
-                                                                         quote_amount=float(evt.quote_amount),
-                                                                         status=evt.status,
-                                                                         )
-                    session.add(rp_update)
-                    self.save_market_states(self._config_file_path, connector, session=session)
+        def write_range_position_update(session: Session) -> Tuple[bool, List[TradeFill]]:
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                                     timestamp=timestamp,
+                                                                     tx_hash=evt.tx_hash,
+                                                                     token_id=evt.token_id,
+                                                                     base_amount=float(evt.base_amount),
+                                                                     quote_amount=float(evt.quote_amount),
+                                                                     status=evt.status,
+                                                                     )
+                session.add(rp_update)
+                return True, []
+            return False, []
+
+        self._record(connector, write_range_position_update)
@@ -3,7 +3,7 @@ import logging
 import statistics
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 from hummingbot.logger import HummingbotLogger
 
@@ -14,13 +14,25 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+
+    The synchronizer is adaptive: every time a new offset sample is within the expected measurement noise of the
+    current offset (based on the round trip time of the requests) the interval until the next synchronization is
+    doubled, up to MAX_SYNC_INTERVAL. When the offset drifts the interval goes back to MIN_SYNC_INTERVAL. Use
+    `is_sync_required` to check if a new synchronization is due.
     """
 
     NaN = float("nan")
+    MIN_SYNC_INTERVAL = 5.0
+    MAX_SYNC_INTERVAL = 600.0
+    MIN_OFFSET_TOLERANCE_MS = 20.0
     _logger = None
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._round_trip_time_ms: Deque[float] = deque(maxlen=5)
+        self._median_time_offset_ms: Optional[float] = None
+        self._sync_interval: float = self.MIN_SYNC_INTERVAL
+        self._last_sync_time: Optional[float] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -30,15 +42,43 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
+        if self._median_time_offset_ms is None:
             return (self._time() - self._current_seconds_counter()) * 1e3
-        return statistics.median(self._time_offset_ms)
+        return self._median_time_offset_ms
+
+    @property
+    def sync_interval(self) -> float:
+        """
+        Seconds between synchronizations with the server time, based on the stability of the offset
+        """
+        return self._sync_interval
 
-    def add_time_offset_ms_sample(self, offset: float):
+    @property
+    def is_sync_required(self) -> bool:
+        """
+        True if the synchronizer has no samples or the sync interval has passed since the last synchronization
+        """
+        return (self._median_time_offset_ms is None
+                or self._last_sync_time is None
+                or self._current_seconds_counter() - self._last_sync_time >= self._sync_interval)
+
+    def add_time_offset_ms_sample(self, offset: float, round_trip_time_ms: Optional[float] = None):
+        if self._median_time_offset_ms is not None:
+            if abs(offset - self._median_time_offset_ms) <= self._offset_tolerance_ms(round_trip_time_ms):
+                self._sync_interval = min(self._sync_interval * 2, self.MAX_SYNC_INTERVAL)
+            else:
+                self._sync_interval = self.MIN_SYNC_INTERVAL
         self._time_offset_ms.append(offset)
+        if round_trip_time_ms is not None:
+            self._round_trip_time_ms.append(round_trip_time_ms)
+        self._median_time_offset_ms = statistics.median(self._time_offset_ms)
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._round_trip_time_ms.clear()
+        self._median_time_offset_ms = None
+        self._sync_interval = self.MIN_SYNC_INTERVAL
+        self._last_sync_time = None
 
     def time(self) -> float:
         """
@@ -60,7 +100,8 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
-            self.add_time_offset_ms_sample(time_offset_ms)
+            self.add_time_offset_ms_sample(time_offset_ms, round_trip_time_ms=local_after_ms - local_before_ms)
+            self._last_sync_time = local_after_ms * 1e-3
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -80,6 +121,16 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _offset_tolerance_ms(self, round_trip_time_ms: Optional[float]) -> float:
+        # A sample's offset can be wrong by up to half the round trip time of its request, and the round trip time
+        # itself varies between requests
+        tolerance = self.MIN_OFFSET_TOLERANCE_MS
+        if round_trip_time_ms is not None:
+            tolerance = max(tolerance, round_trip_time_ms / 2)
+        if len(self._round_trip_time_ms) > 1:
+            tolerance = max(tolerance, 2 * statistics.pstdev(self._round_trip_time_ms))
+        return tolerance
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
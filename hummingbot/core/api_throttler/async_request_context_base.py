@@ -4,24 +4,31 @@ import time
 
 from abc import ABC, abstractmethod
 from typing import (
+    Dict,
     List,
+    Optional,
     Tuple,
 )
 
 from hummingbot.core.api_throttler.data_types import (
     RateLimit,
     TaskLog,
+    TaskLogWindow,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
+# Added to the calculated wait time to make sure the blocking task logs are expired when the waiter wakes up
+WAKEUP_TOLERANCE = 0.001
 
 
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
     It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+    Requests that have to wait are queued (FIFO) in the windows of all their related limits. The first waiter of the
+    queues sleeps until the oldest blocking task logs expire, and each request leaving the queues wakes up the next one.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -34,7 +41,7 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: Dict[str, TaskLogWindow],
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
@@ -43,52 +50,136 @@ class AsyncRequestContextBase(ABC):
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param task_logs: Shared task log windows, by limit_id
         :param rate_limit: The RateLimit associated with this API Request
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check when the expiration of the logged tasks can not free
+        enough capacity for the request
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: Dict[str, TaskLogWindow] = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
 
+    def task_log_window(self, rate_limit: RateLimit) -> TaskLogWindow:
+        """
+        Returns the shared task log window of a RateLimit, creating it if it does not exist yet
+        :param rate_limit: The RateLimit associated with the window
+        """
+        window = self._task_logs.get(rate_limit.limit_id)
+        if window is None:
+            window = TaskLogWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            self._task_logs[rate_limit.limit_id] = window
+        return window
+
     def flush(self):
         """
-        Remove task logs that have passed rate limit periods
+        Remove task logs that have passed rate limit periods from the windows of the related limits
         :return:
         """
         now: float = time.time()
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: float = now - task.timestamp
-            if elapsed > task_limit.time_interval + (task_limit.time_interval * self._safety_margin_pct):
-                self._task_logs.remove(task)
+        for rate_limit, _ in self._related_limits:
+            self.task_log_window(rate_limit).flush(now)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def time_until_within_capacity(self) -> float:
+        """
+        Calculates how long it will take for the logged tasks to expire and free enough capacity for this request
+        :return: The time in seconds
+        """
+        now: float = time.time()
+        delay: float = 0.0
+        for rate_limit, weight in self._related_limits:
+            window: TaskLogWindow = self.task_log_window(rate_limit)
+            excess: int = window.capacity_used + weight - rate_limit.limit
+            if excess > 0:
+                release_time: Optional[float] = window.time_until_released(excess, now)
+                delay = max(delay, self._retry_interval if release_time is None else release_time)
+        return delay
+
+    def _is_next_in_queue(self, wakeup_event: Optional[asyncio.Event]) -> bool:
+        for rate_limit, _ in self._related_limits:
+            waiters = self.task_log_window(rate_limit).waiters
+            if len(waiters) > 0 and waiters[0] is not wakeup_event:
+                return False
+        return True
+
+    def _enqueue(self, wakeup_event: asyncio.Event):
+        for rate_limit, _ in self._related_limits:
+            self.task_log_window(rate_limit).waiters.append(wakeup_event)
+
+    def _dequeue(self, wakeup_event: asyncio.Event):
+        for rate_limit, _ in self._related_limits:
+            waiters = self.task_log_window(rate_limit).waiters
+            was_first: bool = len(waiters) > 0 and waiters[0] is wakeup_event
+            try:
+                waiters.remove(wakeup_event)
+            except ValueError:
+                continue
+            if was_first and len(waiters) > 0:
+                waiters[0].set()
+
+    def _log_task(self):
+        now = time.time()
+        # Each related limit is represented as it own individual TaskLog
+        if self._rate_limit is not None:
+            self.task_log_window(self._rate_limit).append(TaskLog(timestamp=now,
+                                                                  rate_limit=self._rate_limit,
+                                                                  weight=self._rate_limit.weight))
+        for limit, weight in self._related_limits:
+            task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
+            self.task_log_window(limit).append(task)
+
+    def _record_wait_time(self, wait_time: float):
+        for rate_limit, _ in self._related_limits:
+            self.task_log_window(rate_limit).wait_time_histogram.add(wait_time)
+
+    @staticmethod
+    async def _wait_for_wakeup(wakeup_event: asyncio.Event, delay: Optional[float]):
+        """
+        Waits until the event is set, or until the delay passes if one is specified
+        """
+        timer_handle: Optional[asyncio.TimerHandle] = None
+        if delay is not None:
+            timer_handle = asyncio.get_event_loop().call_later(delay + WAKEUP_TOLERANCE, wakeup_event.set)
+        try:
+            await wakeup_event.wait()
+        finally:
+            wakeup_event.clear()
+            if timer_handle is not None:
+                timer_handle.cancel()
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-            for limit, weight in self._related_limits:
-                task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                self._task_logs.append(task)
+        wait_start: float = time.time()
+        wakeup_event: Optional[asyncio.Event] = None
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
+
+                    if self._is_next_in_queue(wakeup_event) and self.within_capacity():
+                        self._log_task()
+                        break
+
+                    if wakeup_event is None:
+                        wakeup_event = asyncio.Event()
+                        self._enqueue(wakeup_event)
+                    # Only the first request in the queues waits for capacity. The others are woken up by the
+                    # requests in front of them when they leave the queues.
+                    delay: Optional[float] = (self.time_until_within_capacity()
+                                              if self._is_next_in_queue(wakeup_event)
+                                              else None)
+                await self._wait_for_wakeup(wakeup_event, delay)
+        finally:
+            if wakeup_event is not None:
+                self._dequeue(wakeup_event)
+        self._record_wait_time(time.time() - wait_start)
 
     async def __aenter__(self):
         await self.acquire()
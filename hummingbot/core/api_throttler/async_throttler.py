@@ -22,10 +22,9 @@ class AsyncRequestContext(AsyncRequestContextBase):
         if len(self._related_limits) > 0:
             now: float = time.time()
             for rate_limit, weight in self._related_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
+                window = self.task_log_window(rate_limit)
+                window.flush(now)
+                capacity_used: int = window.capacity_used
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
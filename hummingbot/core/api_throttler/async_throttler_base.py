@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLogWindow, WaitTimeHistogram
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -32,7 +32,8 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between capacity checks when the expiration of the logged tasks can not free enough
+        capacity for a request.
         :param safety_margin: Percentage of limit to be added as a safety margin when calculating capacity to ensure calls are within the limit.
         """
         from hummingbot.client.config.global_config_map import global_config_map  # avoids chance of circular import
@@ -53,13 +54,16 @@ class AsyncThrottlerBase(ABC):
             for limit in self._rate_limits
         }
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
-
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
+        # Windows of TaskLog, by limit_id, used to determine the API requests within a set time window.
+        self._task_logs: Dict[str, TaskLogWindow] = {
+            limit.limit_id: TaskLogWindow(rate_limit=limit, safety_margin_pct=self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
@@ -76,6 +80,23 @@ class AsyncThrottlerBase(ABC):
 
         return rate_limit, related_limits
 
+    def get_queue_depth(self, limit_id: str) -> int:
+        """
+        :param limit_id: the limit_id of a RateLimit
+        :return: The number of requests currently waiting for capacity in the specified limit
+        """
+        window: Optional[TaskLogWindow] = self._task_logs.get(limit_id)
+        return 0 if window is None else len(window.waiters)
+
+    def get_wait_time_histogram(self, limit_id: str) -> Optional[WaitTimeHistogram]:
+        """
+        :param limit_id: the limit_id of a RateLimit
+        :return: The histogram of the time the requests consuming the specified limit waited for capacity, or None
+        if there is no RateLimit with that limit_id
+        """
+        window: Optional[TaskLogWindow] = self._task_logs.get(limit_id)
+        return None if window is None else window.wait_time_histogram
+
     @abstractmethod
     def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,7 +1,12 @@
+import asyncio
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
 from typing import (
+    Deque,
     List,
     Optional,
+    Tuple,
 )
 
 DEFAULT_PATH = ""
@@ -54,3 +59,96 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class WaitTimeHistogram:
+    """
+    Histogram of the time (in seconds) requests had to wait for capacity before being executed.
+    bucket_counts[i] is the number of waits lower or equal than BUCKET_BOUNDS[i]; the last bucket counts the waits
+    longer than all the bounds.
+    """
+
+    BUCKET_BOUNDS: Tuple[float, ...] = (0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+    def __init__(self):
+        self.bucket_counts: List[int] = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count: int = 0
+        self.total_wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+
+    def __repr__(self):
+        return f"count: {self.count}, mean: {self.mean_wait_time:.6f}, max: {self.max_wait_time:.6f}, " \
+               f"buckets: {self.buckets}"
+
+    @property
+    def mean_wait_time(self) -> float:
+        return self.total_wait_time / self.count if self.count > 0 else 0.0
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        :return: The (upper bound, count) pairs of the histogram. The upper bound of the last bucket is infinite
+        """
+        return list(zip(self.BUCKET_BOUNDS + (float("inf"),), self.bucket_counts))
+
+    def add(self, wait_time: float):
+        self.bucket_counts[bisect_left(self.BUCKET_BOUNDS, wait_time)] += 1
+        self.count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+class TaskLogWindow:
+    """
+    Sliding window with the TaskLogs registered for a single RateLimit.
+    The logs are kept in the order they were registered, together with the running sum of their weights, so the used
+    capacity is available in constant time and expired logs are always removed from the left end.
+    The window also keeps the FIFO queue of the requests waiting for capacity and the histogram of their wait times.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        :param rate_limit: The RateLimit the logs in the window belong to
+        :param safety_margin_pct: Percentage of the time interval added to the window length
+        """
+        self.rate_limit: RateLimit = rate_limit
+        self.task_logs: Deque[TaskLog] = deque()
+        self.capacity_used: int = 0
+        self.waiters: Deque[asyncio.Event] = deque()
+        self.wait_time_histogram: WaitTimeHistogram = WaitTimeHistogram()
+        self._safety_margin_pct: float = safety_margin_pct
+
+    def __len__(self) -> int:
+        return len(self.task_logs)
+
+    @property
+    def window_length(self) -> float:
+        return self.rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def append(self, task_log: TaskLog):
+        self.task_logs.append(task_log)
+        self.capacity_used += task_log.weight
+
+    def flush(self, now: float):
+        """
+        Removes the task logs that have passed the window length
+        :param now: The current timestamp
+        """
+        window_length = self.window_length
+        task_logs = self.task_logs
+        while task_logs and now - task_logs[0].timestamp > window_length:
+            self.capacity_used -= task_logs.popleft().weight
+
+    def time_until_released(self, weight: int, now: float) -> Optional[float]:
+        """
+        Calculates the time until the expiration of the oldest task logs frees the requested weight
+        :param weight: The capacity to be freed
+        :param now: The current timestamp
+        :return: The time in seconds, or None if the logs in the window can not free that much capacity
+        """
+        released: int = 0
+        for task_log in self.task_logs:
+            released += task_log.weight
+            if released >= weight:
+                return max(0.0, task_log.timestamp + self.window_length - now)
+        return None
@@ -0,0 +1,156 @@
+import asyncio
+import math
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.backtest.backtest_order_book_tracker import BacktestOrderBookTracker
+from hummingbot.core.backtest.backtest_paper_trade_exchange import BacktestPaperTradeExchange
+from hummingbot.core.backtest.market_data import load_market_data
+from hummingbot.core.backtest.market_data_replayer import MarketDataReplayer
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+s_decimal_0 = Decimal("0")
+
+StrategyFactory = Callable[[List[MarketTradingPairTuple]], StrategyBase]
+
+
+class BacktestEngine:
+    """
+    Runs a strategy on a paper trade exchange fed with recorded market data, with a backtest clock.
+
+    The clock is ticked as fast as possible from the first to the last recorded message (or the configured start and
+    end times). On each tick the recorded messages up to the tick timestamp are applied to the order books, then the
+    exchange matches its resting orders and the strategy is ticked. Nothing is requested from the network, the
+    performance of each trading pair is measured with the last mid price of its replayed order book.
+    """
+
+    def __init__(self,
+                 exchange_name: str,
+                 market_data_paths: Dict[str, str],
+                 strategy_factory: StrategyFactory,
+                 balances: Dict[str, Decimal],
+                 tick_size: float = 1.0,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None):
+        """
+        :param exchange_name: the exchange the market data was recorded from, used to apply its trading fees
+        :param market_data_paths: the path of the recorded market data file of each trading pair
+        :param strategy_factory: a function creating the strategy to run from the markets of the backtest
+        :param balances: the initial balance of each asset
+        :param tick_size: the clock tick size in seconds
+        :param start_time: the timestamp to start the backtest at, by default the first recorded message
+        :param end_time: the timestamp to end the backtest at, by default the last recorded message
+        """
+        self._exchange_name = exchange_name
+        self._market_data_paths = market_data_paths
+        self._strategy_factory = strategy_factory
+        self._balances = balances
+        self._tick_size = tick_size
+        self._start_time = start_time
+        self._end_time = end_time
+        self._exchange: Optional[BacktestPaperTradeExchange] = None
+        self._strategy: Optional[StrategyBase] = None
+        self._fill_logger: Optional[EventLogger] = None
+
+    @property
+    def exchange(self) -> Optional[BacktestPaperTradeExchange]:
+        return self._exchange
+
+    @property
+    def strategy(self) -> Optional[StrategyBase]:
+        return self._strategy
+
+    @property
+    def trades(self) -> List[Trade]:
+        """
+        The trades filled by the exchange during the backtest, sorted by timestamp
+        """
+        if self._fill_logger is None:
+            return []
+        return sorted([Trade(event.trading_pair,
+                             event.trade_type,
+                             event.price,
+                             event.amount,
+                             event.order_type,
+                             self._exchange.display_name,
+                             event.timestamp,
+                             event.trade_fee)
+                       for event in self._fill_logger.event_log
+                       if isinstance(event, OrderFilledEvent)],
+                      key=lambda trade: trade.timestamp)
+
+    def run(self) -> Dict[str, PerformanceMetrics]:
+        """
+        Replays the market data and runs the strategy on it. It must not be called from a running event loop.
+
+        :return: the performance metrics of each trading pair
+        """
+        trading_pairs: List[str] = list(self._market_data_paths.keys())
+        order_book_tracker = BacktestOrderBookTracker(trading_pairs=trading_pairs)
+        replayer = MarketDataReplayer(
+            order_book_tracker,
+            {trading_pair: load_market_data(path) for trading_pair, path in self._market_data_paths.items()})
+
+        self._exchange = BacktestPaperTradeExchange(order_book_tracker,
+                                                    ExchangeBase,
+                                                    exchange_name=self._exchange_name)
+        for asset, balance in self._balances.items():
+            self._exchange.set_balance(asset, balance)
+        self._fill_logger = EventLogger()
+        self._exchange.add_listener(MarketEvent.OrderFilled, self._fill_logger)
+
+        market_infos: List[MarketTradingPairTuple] = [
+            MarketTradingPairTuple(self._exchange, trading_pair, *self._exchange.split_trading_pair(trading_pair))
+            for trading_pair in trading_pairs]
+        self._strategy = self._strategy_factory(market_infos)
+
+        start_time = self._start_time if self._start_time is not None else replayer.start_timestamp
+        end_time = self._end_time if self._end_time is not None else replayer.end_timestamp
+        if start_time is None or end_time is None:
+            raise ValueError("There is no market data to backtest on.")
+
+        clock = Clock(ClockMode.BACKTEST, tick_size=self._tick_size, start_time=start_time, end_time=end_time)
+        # The order books are updated first, so the exchange and the strategy see the data of the current tick
+        clock.add_iterator(replayer)
+        clock.add_iterator(self._exchange)
+        clock.add_iterator(self._strategy)
+        clock.backtest()
+        for iterator in clock.child_iterators:
+            iterator.stop(clock)
+
+        return asyncio.get_event_loop().run_until_complete(self._performance_metrics(trading_pairs))
+
+    async def _performance_metrics(self, trading_pairs: List[str]) -> Dict[str, PerformanceMetrics]:
+        trades: List[Trade] = self.trades
+        balances: Dict[str, Decimal] = self._exchange.get_all_balances()
+        metrics: Dict[str, PerformanceMetrics] = {}
+        for trading_pair in trading_pairs:
+            pair_trades = [trade for trade in trades if trade.trading_pair == trading_pair]
+            metrics[trading_pair] = await PerformanceMetrics.create(trading_pair,
+                                                                    pair_trades,
+                                                                    balances,
+                                                                    current_price=self._last_price(trading_pair))
+        return metrics
+
+    def _last_price(self, trading_pair: str) -> Decimal:
+        """
+        The mid price of the replayed order book, or its last trade price if one side of the book is empty. The
+        price is never requested from the network, it is 0 if there was no market data for the trading pair.
+        """
+        order_book = self._exchange.order_books.get(trading_pair)
+        if order_book is None:
+            return s_decimal_0
+        try:
+            return Decimal(str((order_book.get_price(True) + order_book.get_price(False)) / 2))
+        except EnvironmentError:
+            if math.isnan(order_book.last_trade_price):
+                return s_decimal_0
+            return Decimal(str(order_book.last_trade_price))
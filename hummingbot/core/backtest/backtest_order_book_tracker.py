@@ -0,0 +1,60 @@
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class BacktestOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source for order books that are updated from recorded market data. It never connects to the exchange.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self._order_books: Dict[str, OrderBook] = {}
+
+    def add_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+
+    async def get_last_traded_prices(self,
+                                     trading_pairs: List[str],
+                                     domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._order_books[trading_pair].last_trade_price
+                for trading_pair in trading_pairs
+                if trading_pair in self._order_books}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self._order_books[trading_pair]
+
+
+class BacktestOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker for order books replayed from recorded market data. The order books are created by the replay
+    when the first snapshot of each trading pair is found, and the tracker is ready once all of them exist.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=BacktestOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+
+    @property
+    def ready(self) -> bool:
+        return all(trading_pair in self._order_books for trading_pair in self._trading_pairs)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def create_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        Creates the order book of a trading pair with the order book create function of the data source
+
+        :param trading_pair: the trading pair
+        :return: the new order book
+        """
+        order_book: OrderBook = self._data_source.order_book_create_function()
+        self._data_source.add_order_book(trading_pair, order_book)
+        self._order_books[trading_pair] = order_book
+        return order_book
@@ -0,0 +1,4 @@
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+
+cdef class BacktestPaperTradeExchange(PaperTradeExchange):
+    pass
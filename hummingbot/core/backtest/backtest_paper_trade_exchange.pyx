@@ -0,0 +1,19 @@
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.time_iterator cimport TimeIterator
+
+
+cdef class BacktestPaperTradeExchange(PaperTradeExchange):
+    """
+    Paper trade exchange for backtests. The order books are replayed from recorded data, so the exchange never checks
+    the network and is connected for as long as the clock runs.
+    """
+
+    cdef c_start(self, Clock clock, double timestamp):
+        TimeIterator.c_start(self, clock, timestamp)
+        self._network_status = NetworkStatus.CONNECTED
+
+    cdef c_stop(self, Clock clock):
+        TimeIterator.c_stop(self, clock)
+        self._network_status = NetworkStatus.STOPPED
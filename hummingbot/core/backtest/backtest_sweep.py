@@ -0,0 +1,149 @@
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.backtest.backtest_engine import BacktestEngine
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+from hummingbot.strategy.strategy_base import StrategyBase
+
+# Creates a strategy from the markets of the backtest and the keyword arguments of one configuration. It has to be a
+# module level function, so it can be sent to the worker processes.
+ConfigurableStrategyFactory = Callable[..., StrategyBase]
+
+METRICS_COLUMNS = ["total_pnl", "return_pct", "trade_pnl", "fee_in_quote", "num_trades", "num_buys", "num_sells",
+                   "tot_vol_quote", "cur_value", "hold_value"]
+
+
+def pure_market_making_strategy(market_infos: List[MarketTradingPairTuple], **config) -> PureMarketMakingStrategy:
+    """
+    Creates a pure market making strategy on the first market of the backtest
+
+    :param market_infos: the markets of the backtest
+    :param config: the PureMarketMakingStrategy.init_params keyword arguments (e.g. bid_spread, ask_spread,
+    order_amount, order_levels, inventory_skew_enabled, inventory_target_base_pct), spreads as fractions
+    """
+    strategy = PureMarketMakingStrategy()
+    strategy.init_params(market_infos[0], **config)
+    return strategy
+
+
+class BacktestSweep:
+    """
+    Backtests every combination of a parameter grid applied to a strategy configuration template, in parallel.
+
+    Each configuration is run by a BacktestEngine in a worker process. The workers memory map the same market data
+    files, so the data is loaded once by the operating system and shared by all the processes, and only the
+    configurations and the resulting performance metrics are sent between processes.
+    """
+
+    def __init__(self,
+                 exchange_name: str,
+                 market_data_paths: Dict[str, str],
+                 strategy_factory: ConfigurableStrategyFactory,
+                 config_template: Dict[str, Any],
+                 parameter_grid: Dict[str, List[Any]],
+                 balances: Dict[str, Decimal],
+                 tick_size: float = 1.0,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 max_workers: Optional[int] = None):
+        """
+        :param exchange_name: the exchange the market data was recorded from, used to apply its trading fees
+        :param market_data_paths: the path of the recorded market data file of each trading pair
+        :param strategy_factory: a module level function creating the strategy from the markets of the backtest and
+        the keyword arguments of a configuration (e.g. pure_market_making_strategy)
+        :param config_template: the keyword arguments shared by all the configurations
+        :param parameter_grid: the values to test for each parameter, they override the template values
+        :param balances: the initial balance of each asset
+        :param tick_size: the clock tick size in seconds
+        :param start_time: the timestamp to start the backtests at, by default the first recorded message
+        :param end_time: the timestamp to end the backtests at, by default the last recorded message
+        :param max_workers: the number of worker processes, by default the number of CPUs. With 1 the backtests
+        are run in the current process.
+        """
+        self._exchange_name = exchange_name
+        self._market_data_paths = market_data_paths
+        self._strategy_factory = strategy_factory
+        self._config_template = config_template
+        self._parameter_grid = parameter_grid
+        self._balances = balances
+        self._tick_size = tick_size
+        self._start_time = start_time
+        self._end_time = end_time
+        self._max_workers = max_workers
+        self._results: List[Tuple[Dict[str, Any], Dict[str, PerformanceMetrics]]] = []
+
+    @property
+    def configs(self) -> List[Dict[str, Any]]:
+        """
+        The configuration of each backtest, the template updated with one combination of the grid values
+        """
+        parameters = list(self._parameter_grid.keys())
+        return [{**self._config_template, **dict(zip(parameters, values))}
+                for values in itertools.product(*self._parameter_grid.values())]
+
+    @property
+    def results(self) -> List[Tuple[Dict[str, Any], Dict[str, PerformanceMetrics]]]:
+        """
+        The configuration and the performance metrics of each trading pair of every backtest, in configuration order
+        """
+        return self._results
+
+    def run(self, rank_by: str = "total_pnl") -> pd.DataFrame:
+        """
+        Runs all the backtests. It must not be called from a running event loop when max_workers is 1.
+
+        :param rank_by: the PerformanceMetrics attribute to rank the results by, in descending order
+        :return: the swept parameters and the performance metrics of each configuration and trading pair, best first
+        """
+        configs = self.configs
+        if self._max_workers == 1:
+            metrics = [self._run_config(config) for config in configs]
+        else:
+            with ProcessPoolExecutor(max_workers=self._max_workers, initializer=_init_worker) as executor:
+                metrics = list(executor.map(self._run_config, configs))
+        self._results = list(zip(configs, metrics))
+        return self.ranked_table(rank_by)
+
+    def ranked_table(self, rank_by: str = "total_pnl") -> pd.DataFrame:
+        """
+        :param rank_by: the PerformanceMetrics attribute to rank the results by, in descending order
+        :return: the swept parameters and the performance metrics of each configuration and trading pair, best first
+        """
+        parameters = list(self._parameter_grid.keys())
+        columns = list(dict.fromkeys(parameters + ["trading_pair", rank_by] + METRICS_COLUMNS))
+        rows = []
+        for config, pairs_metrics in self._results:
+            for trading_pair, metrics in pairs_metrics.items():
+                row = {parameter: config[parameter] for parameter in parameters}
+                row["trading_pair"] = trading_pair
+                row.update({column: getattr(metrics, column) for column in columns[len(parameters) + 1:]})
+                rows.append(row)
+        table = pd.DataFrame(rows, columns=columns)
+        return table.sort_values(by=rank_by, ascending=False, kind="stable").reset_index(drop=True)
+
+    def _run_config(self, config: Dict[str, Any]) -> Dict[str, PerformanceMetrics]:
+        engine = BacktestEngine(exchange_name=self._exchange_name,
+                                market_data_paths=self._market_data_paths,
+                                strategy_factory=functools.partial(self._strategy_factory, **config),
+                                balances=self._balances,
+                                tick_size=self._tick_size,
+                                start_time=self._start_time,
+                                end_time=self._end_time)
+        metrics = engine.run()
+        for pair_metrics in metrics.values():
+            # The default dict of the fees can't be pickled
+            pair_metrics.fees = dict(pair_metrics.fees)
+        return metrics
+
+
+def _init_worker():
+    # A forked worker inherits the event loop of the parent process, which could be running
+    asyncio.set_event_loop(asyncio.new_event_loop())
@@ -0,0 +1,107 @@
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+# Recorded market data is stored as a flat file of fixed size records, so it can be appended to while recording and
+# memory mapped while replaying. Each record is one price level of a snapshot or a diff, or one trade:
+#  - timestamp: UNIX timestamp of the message
+#  - message_type: the OrderBookMessageType value of the message
+#  - side: TradeType.BUY value for bid levels and buy trades, TradeType.SELL value for ask levels and sell trades
+#  - price, amount and update_id of the level or trade
+# The levels of one snapshot or diff message are consecutive records with the same timestamp, message type and
+# update id.
+MARKET_DATA_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("message_type", np.float64),
+    ("side", np.float64),
+    ("price", np.float64),
+    ("amount", np.float64),
+    ("update_id", np.float64),
+])
+
+SNAPSHOT_MESSAGE_TYPE = float(OrderBookMessageType.SNAPSHOT.value)
+DIFF_MESSAGE_TYPE = float(OrderBookMessageType.DIFF.value)
+TRADE_MESSAGE_TYPE = float(OrderBookMessageType.TRADE.value)
+BUY_SIDE = float(TradeType.BUY.value)
+SELL_SIDE = float(TradeType.SELL.value)
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def market_data_file_path(directory: str, trading_pair: str, timestamp: float) -> str:
+    """
+    Path of the file with the market data recorded for a trading pair on the (UTC) day of a timestamp
+
+    :param directory: the market data directory
+    :param trading_pair: the trading pair
+    :param timestamp: any UNIX timestamp of the day
+    :return: the path of the file
+    """
+    day: str = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+    return os.path.join(directory, trading_pair, f"{day}.dat")
+
+
+def message_records(message: OrderBookMessage) -> np.ndarray:
+    """
+    Converts an order book message to MARKET_DATA_DTYPE records
+
+    :param message: a snapshot, diff or trade message
+    :return: the records of the message, one per price level for snapshots and diffs
+    """
+    if message.type is OrderBookMessageType.TRADE:
+        records = np.empty(1, dtype=MARKET_DATA_DTYPE)
+        records["message_type"] = TRADE_MESSAGE_TYPE
+        records["side"] = (SELL_SIDE
+                           if message.content["trade_type"] == float(TradeType.SELL.value)
+                           else BUY_SIDE)
+        records["price"] = float(message.content["price"])
+        records["amount"] = float(message.content["amount"])
+    else:
+        bids = message.bids
+        asks = message.asks
+        records = np.empty(len(bids) + len(asks), dtype=MARKET_DATA_DTYPE)
+        records["message_type"] = float(message.type.value)
+        records["side"][:len(bids)] = BUY_SIDE
+        records["side"][len(bids):] = SELL_SIDE
+        records["price"] = [row.price for row in bids] + [row.price for row in asks]
+        records["amount"] = [row.amount for row in bids] + [row.amount for row in asks]
+    records["timestamp"] = message.timestamp
+    records["update_id"] = message.update_id
+    return records
+
+
+def load_market_data(path: str) -> np.ndarray:
+    """
+    Memory maps a recorded market data file as a read only array of MARKET_DATA_DTYPE records
+
+    :param path: the path of the file
+    :return: the records of the file
+    """
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=MARKET_DATA_DTYPE)
+    return np.memmap(path, dtype=MARKET_DATA_DTYPE, mode="r")
+
+
+def message_starts(records: np.ndarray) -> np.ndarray:
+    """
+    Finds the index of the first record of each message. Every trade is a message by itself, the levels of a snapshot
+    or a diff are grouped while the timestamp, message type and update id don't change.
+
+    :param records: an array of MARKET_DATA_DTYPE records
+    :return: the indexes of the first record of each message, in ascending order
+    """
+    if len(records) == 0:
+        return np.empty(0, dtype=np.int64)
+    timestamps = records["timestamp"]
+    message_types = records["message_type"]
+    update_ids = records["update_id"]
+    is_start = np.empty(len(records), dtype=bool)
+    is_start[0] = True
+    is_start[1:] = ((timestamps[1:] != timestamps[:-1])
+                    | (message_types[1:] != message_types[:-1])
+                    | (update_ids[1:] != update_ids[:-1])
+                    | (message_types[1:] == TRADE_MESSAGE_TYPE))
+    return np.flatnonzero(is_start)
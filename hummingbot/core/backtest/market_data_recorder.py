@@ -0,0 +1,172 @@
+import logging
+import os
+import queue
+import threading
+import time
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.backtest.market_data import SECONDS_PER_DAY, market_data_file_path, message_records
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataRecorder:
+    """
+    Records the order book messages processed by an order book tracker in market data files, one file per trading
+    pair and (UTC) day, that can be replayed by the backtest engine.
+
+    Recording never blocks the tracker. The messages are queued and converted and written by a background thread.
+    When the queue is full the message is dropped and the next message of its trading pair is recorded as a snapshot
+    of the order book, so the recorded data stays consistent. Every file also starts with a snapshot.
+    """
+    MAX_QUEUE_SIZE: int = 100000
+    FLUSH_INTERVAL: float = 1.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, directory: str, max_queue_size: int = MAX_QUEUE_SIZE, flush_interval: float = FLUSH_INTERVAL):
+        """
+        :param directory: the directory to write the market data files to
+        :param max_queue_size: the maximum number of messages waiting to be written
+        :param flush_interval: the maximum time in seconds the written records are buffered before going to disk
+        """
+        self._directory = directory
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._recorded_days: Dict[str, int] = {}
+        self._pairs_to_resync: Set[str] = set()
+        self._dropped_messages: int = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def dropped_messages(self) -> int:
+        """
+        Number of messages not recorded because the queue was full
+        """
+        return self._dropped_messages
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.is_running:
+            self._thread = threading.Thread(target=self._write_loop, name="MarketDataRecorder", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread after it writes all the queued messages
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._recorded_days.clear()
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: Optional[float] = None):
+        """
+        Records the current state of an order book as a snapshot
+
+        :param trading_pair: the trading pair of the order book
+        :param order_book: the order book
+        :param timestamp: the timestamp of the snapshot, the current time by default
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        snapshot: OrderBookMessage = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": update_id,
+                "bids": [(row.price, row.amount) for row in order_book.bid_entries()],
+                "asks": [(row.price, row.amount) for row in order_book.ask_entries()],
+            },
+            timestamp)
+        if self._enqueue(trading_pair, snapshot):
+            self._recorded_days[trading_pair] = int(timestamp // SECONDS_PER_DAY)
+            self._pairs_to_resync.discard(trading_pair)
+
+    def record_message(self, message: OrderBookMessage, order_book: OrderBook):
+        """
+        Records a message after it was applied to its order book. If the message is the first one of a new day, or a
+        previous message could not be recorded, the order book is recorded as a snapshot instead.
+
+        :param message: the snapshot, diff or trade message
+        :param order_book: the order book the message was applied to
+        """
+        trading_pair: str = message.trading_pair
+        day: int = int(message.timestamp // SECONDS_PER_DAY)
+        if self._recorded_days.get(trading_pair) != day or trading_pair in self._pairs_to_resync:
+            self.record_order_book(trading_pair, order_book, message.timestamp)
+            if message.type is not OrderBookMessageType.TRADE:
+                # The snapshot already includes the message
+                return
+        self._enqueue(trading_pair, message)
+
+    def _enqueue(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except queue.Full:
+            if self._dropped_messages == 0:
+                self.logger().warning("The market data recorder can't keep up with the order book messages. Dropped "
+                                      "messages are replaced with order book snapshots.")
+            self._dropped_messages += 1
+            self._pairs_to_resync.add(trading_pair)
+            return False
+
+    def _write_loop(self):
+        files: Dict[str, BinaryIO] = {}
+        buffered_records: Dict[Tuple[str, str], List[np.ndarray]] = {}
+        last_flush: float = time.monotonic()
+        running: bool = True
+        try:
+            while running:
+                try:
+                    message: Optional[OrderBookMessage] = self._queue.get(timeout=self._flush_interval)
+                    if message is None:
+                        running = False
+                    else:
+                        path: str = market_data_file_path(self._directory, message.trading_pair, message.timestamp)
+                        buffered_records.setdefault((message.trading_pair, path), []).append(
+                            message_records(message))
+                except queue.Empty:
+                    pass
+                except Exception:
+                    self.logger().error("Unexpected error converting an order book message.", exc_info=True)
+
+                if not running or time.monotonic() - last_flush >= self._flush_interval:
+                    self._write_records(files, buffered_records)
+                    buffered_records.clear()
+                    last_flush = time.monotonic()
+        finally:
+            for file in files.values():
+                file.close()
+
+    def _write_records(self, files: Dict[str, BinaryIO], buffered_records: Dict[Tuple[str, str], List[np.ndarray]]):
+        for (trading_pair, path), records in buffered_records.items():
+            try:
+                file: Optional[BinaryIO] = files.get(trading_pair)
+                if file is None or file.name != path:
+                    if file is not None:
+                        file.close()
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    file = open(path, "ab")
+                    files[trading_pair] = file
+                file.write(np.concatenate(records).tobytes())
+                file.flush()
+            except Exception:
+                self.logger().error(f"Unexpected error writing market data for {trading_pair}.", exc_info=True)
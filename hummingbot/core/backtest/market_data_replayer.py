@@ -0,0 +1,115 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from hummingbot.core.backtest.backtest_order_book_tracker import BacktestOrderBookTracker
+from hummingbot.core.backtest.market_data import (
+    BUY_SIDE,
+    DIFF_MESSAGE_TYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_MESSAGE_TYPE,
+    message_starts,
+)
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class MarketDataReplayer(PyTimeIterator):
+    """
+    Applies recorded market data to the order books of a backtest order book tracker. On every tick all the messages
+    recorded up to the tick timestamp are applied, snapshots and diffs through the numpy order book paths and trades
+    as order book trade events.
+
+    The replayer has to be added to the clock before the exchange and the strategy, so they see the order books
+    already updated when they are ticked.
+    """
+
+    def __init__(self, order_book_tracker: BacktestOrderBookTracker, market_data: Dict[str, np.ndarray]):
+        """
+        :param order_book_tracker: the tracker of the order books to update
+        :param market_data: MARKET_DATA_DTYPE records of each trading pair, sorted by timestamp
+        """
+        super().__init__()
+        self._order_book_tracker = order_book_tracker
+        self._market_data = market_data
+        self._message_starts: Dict[str, np.ndarray] = {}
+        self._message_timestamps: Dict[str, np.ndarray] = {}
+        self._next_messages: Dict[str, int] = {}
+        for trading_pair, records in market_data.items():
+            starts = message_starts(records)
+            self._message_starts[trading_pair] = np.append(starts, len(records))
+            self._message_timestamps[trading_pair] = np.asarray(records["timestamp"][starts])
+            self._next_messages[trading_pair] = 0
+
+    @property
+    def start_timestamp(self) -> Optional[float]:
+        """
+        Timestamp of the first recorded message, None if there is no data
+        """
+        timestamps = [timestamps[0] for timestamps in self._message_timestamps.values() if len(timestamps) > 0]
+        return float(min(timestamps)) if len(timestamps) > 0 else None
+
+    @property
+    def end_timestamp(self) -> Optional[float]:
+        """
+        Timestamp of the last recorded message, None if there is no data
+        """
+        timestamps = [timestamps[-1] for timestamps in self._message_timestamps.values() if len(timestamps) > 0]
+        return float(max(timestamps)) if len(timestamps) > 0 else None
+
+    @property
+    def finished(self) -> bool:
+        return all(self._next_messages[trading_pair] == len(timestamps)
+                   for trading_pair, timestamps in self._message_timestamps.items())
+
+    def tick(self, timestamp: float):
+        for trading_pair in self._market_data:
+            self.replay_until(trading_pair, timestamp)
+
+    def replay_until(self, trading_pair: str, timestamp: float):
+        """
+        Applies the messages of a trading pair recorded up to (and including) a timestamp
+
+        :param trading_pair: the trading pair
+        :param timestamp: the timestamp of the last message to apply
+        """
+        records: np.ndarray = self._market_data[trading_pair]
+        starts: np.ndarray = self._message_starts[trading_pair]
+        first_message: int = self._next_messages[trading_pair]
+        last_message: int = int(np.searchsorted(self._message_timestamps[trading_pair], timestamp, side="right"))
+
+        for message in range(first_message, last_message):
+            self._apply_message(trading_pair, records[starts[message]:starts[message + 1]])
+        self._next_messages[trading_pair] = max(first_message, last_message)
+
+    def _apply_message(self, trading_pair: str, message_records: np.ndarray):
+        message_type: float = message_records["message_type"][0]
+        order_book: Optional[OrderBook] = self._order_book_tracker.order_books.get(trading_pair)
+
+        if message_type == SNAPSHOT_MESSAGE_TYPE:
+            if order_book is None:
+                order_book = self._order_book_tracker.create_order_book(trading_pair)
+            bids, asks = self._levels(message_records)
+            order_book.apply_numpy_snapshot(bids, asks)
+        elif order_book is None:
+            # Diffs and trades can't be applied until the first snapshot is received
+            return
+        elif message_type == DIFF_MESSAGE_TYPE:
+            bids, asks = self._levels(message_records)
+            order_book.apply_numpy_diffs(bids, asks)
+        elif message_type == TRADE_MESSAGE_TYPE:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=float(message_records["timestamp"][0]),
+                type=TradeType.BUY if message_records["side"][0] == BUY_SIDE else TradeType.SELL,
+                price=float(message_records["price"][0]),
+                amount=float(message_records["amount"][0]),
+            ))
+
+    @staticmethod
+    def _levels(message_records: np.ndarray):
+        levels = np.column_stack((message_records["price"], message_records["amount"], message_records["update_id"]))
+        is_bid = message_records["side"] == BUY_SIDE
+        return np.ascontiguousarray(levels[is_bid]), np.ascontiguousarray(levels[~is_bid])
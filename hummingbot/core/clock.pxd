@@ -10,3 +10,4 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _profiler
@@ -3,8 +3,9 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
@@ -36,6 +37,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +59,17 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def profiler(self) -> Optional[ClockProfiler]:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional[ClockProfiler]):
+        """
+        Sets the profiler recording the tick statistics, or None (the default) to stop profiling
+        """
+        self._profiler = profiler
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +103,10 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double wakeup_time = 0
+            double tick_start = 0
+            double iterator_tick_start = 0
+            object profiler
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -111,10 +128,16 @@ cdef class Clock:
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                profiler = self._profiler
+                if profiler is not None:
+                    wakeup_time = time.time()
+                    tick_start = time.perf_counter()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +145,24 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
+
+                if profiler is not None:
+                    profiler.record_clock_tick(next_tick_time,
+                                               wakeup_time,
+                                               time.perf_counter() - tick_start,
+                                               self._tick_size)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double iterator_tick_start = 0
+            object profiler = self._profiler
 
         if not self._started:
             for ci in self._child_iterators:
@@ -141,12 +175,16 @@ cdef class Clock:
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
         except StopIteration:
             return
         finally:
@@ -0,0 +1,122 @@
+import json
+import math
+from typing import TYPE_CHECKING, Any, Dict
+
+import pandas as pd
+
+from hummingbot.core.utils.duration_histogram import DurationHistogram
+
+if TYPE_CHECKING:
+    # Imported for the annotations only, clock.pyx imports this module
+    from hummingbot.core.time_iterator import TimeIterator
+
+
+class ClockProfiler:
+    """
+    Tick statistics of a clock. When a profiler is set on a clock it records:
+     - the duration of each tick of every child iterator
+     - the duration of every clock tick (all the child iterators)
+     - the event loop lag, between the scheduled tick time and the time the clock woke up to run it
+     - the overruns, ticks that finished after the next tick was due
+     - the missed ticks, skipped because a previous tick was still running at their scheduled time
+    Only the iterator tick durations are recorded in backtest mode.
+    """
+
+    def __init__(self):
+        self._iterator_durations: Dict["TimeIterator", DurationHistogram] = {}
+        self._tick_durations: DurationHistogram = DurationHistogram()
+        self._event_loop_lags: DurationHistogram = DurationHistogram()
+        self._overruns: int = 0
+        self._missed_ticks: int = 0
+        self._last_scheduled_time: float = math.nan
+
+    @property
+    def iterator_durations(self) -> Dict[str, DurationHistogram]:
+        """
+        The tick duration histogram of each child iterator, by iterator name
+        """
+        names: Dict[str, DurationHistogram] = {}
+        for iterator, histogram in self._iterator_durations.items():
+            name = self._iterator_name(iterator)
+            if name in names:
+                name = f"{name} ({id(iterator):x})"
+            names[name] = histogram
+        return names
+
+    @property
+    def tick_durations(self) -> DurationHistogram:
+        return self._tick_durations
+
+    @property
+    def event_loop_lags(self) -> DurationHistogram:
+        return self._event_loop_lags
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def missed_ticks(self) -> int:
+        return self._missed_ticks
+
+    def record_iterator_tick(self, iterator: "TimeIterator", duration: float):
+        histogram = self._iterator_durations.get(iterator)
+        if histogram is None:
+            histogram = self._iterator_durations[iterator] = DurationHistogram()
+        histogram.record(duration)
+
+    def record_clock_tick(self, scheduled_time: float, wakeup_time: float, duration: float, tick_size: float):
+        """
+        :param scheduled_time: the timestamp the tick was scheduled at
+        :param wakeup_time: the timestamp the clock started running the tick
+        :param duration: the time in seconds taken by all the child iterators
+        :param tick_size: the tick size of the clock
+        """
+        self._tick_durations.record(duration)
+        self._event_loop_lags.record(max(wakeup_time - scheduled_time, 0.0))
+        if wakeup_time + duration > scheduled_time + tick_size:
+            self._overruns += 1
+        if not math.isnan(self._last_scheduled_time):
+            self._missed_ticks += max(round((scheduled_time - self._last_scheduled_time) / tick_size) - 1, 0)
+        self._last_scheduled_time = scheduled_time
+
+    def durations_df(self) -> pd.DataFrame:
+        """
+        :return: a summary of the tick durations of each iterator and of the clock, and of the event loop lag, in
+        milliseconds
+        """
+        rows = [(name, histogram) for name, histogram in self.iterator_durations.items()]
+        rows.append(("Clock tick", self._tick_durations))
+        rows.append(("Event loop lag", self._event_loop_lags))
+        return pd.DataFrame(
+            data=[[name,
+                   histogram.count,
+                   histogram.mean * 1e3,
+                   histogram.percentile(50) * 1e3,
+                   histogram.percentile(99) * 1e3,
+                   histogram.max * 1e3]
+                  for name, histogram in rows],
+            columns=["Iterator", "Ticks", "Mean (ms)", "p50 (ms)", "p99 (ms)", "Max (ms)"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "overruns": self._overruns,
+            "missed_ticks": self._missed_ticks,
+            "tick_durations": self._tick_durations.to_dict(),
+            "event_loop_lags": self._event_loop_lags.to_dict(),
+            "iterator_durations": {name: histogram.to_dict() for name, histogram in self.iterator_durations.items()},
+        }
+
+    def export(self, path: str):
+        """
+        Writes the statistics to a JSON file
+
+        :param path: the path of the file
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @staticmethod
+    def _iterator_name(iterator: "TimeIterator") -> str:
+        name = getattr(iterator, "display_name", None)
+        return name if isinstance(name, str) else type(iterator).__name__
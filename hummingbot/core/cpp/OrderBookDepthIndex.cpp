@@ -0,0 +1,225 @@
+#include "OrderBookDepthIndex.h"
+#include <cmath>
+
+OrderBookDepthIndex::OrderBookDepthIndex() : OrderBookDepthIndex(false) {
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(bool descending) {
+    this->descending = descending;
+    this->root = nullptr;
+    this->levels = 0;
+    this->randomState = 2463534242u;
+}
+
+OrderBookDepthIndex::~OrderBookDepthIndex() {
+    deleteNodes(this->root);
+}
+
+double OrderBookDepthIndex::keyFor(double price) const {
+    return this->descending ? -price : price;
+}
+
+uint32_t OrderBookDepthIndex::nextPriority() {
+    // xorshift32
+    uint32_t x = this->randomState;
+    x ^= x << 13;
+    x ^= x >> 17;
+    x ^= x << 5;
+    this->randomState = x;
+    return x;
+}
+
+void OrderBookDepthIndex::update(Node *node) {
+    node->amountSum = node->amount;
+    node->quoteAmountSum = node->amount * node->price;
+    if (node->left != nullptr) {
+        node->amountSum += node->left->amountSum;
+        node->quoteAmountSum += node->left->quoteAmountSum;
+    }
+    if (node->right != nullptr) {
+        node->amountSum += node->right->amountSum;
+        node->quoteAmountSum += node->right->quoteAmountSum;
+    }
+}
+
+OrderBookDepthIndex::Node *OrderBookDepthIndex::merge(Node *left, Node *right) {
+    if (left == nullptr) {
+        return right;
+    }
+    if (right == nullptr) {
+        return left;
+    }
+    if (left->priority > right->priority) {
+        left->right = merge(left->right, right);
+        update(left);
+        return left;
+    }
+    right->left = merge(left, right->left);
+    update(right);
+    return right;
+}
+
+void OrderBookDepthIndex::split(Node *node, double key, bool keyToLeft, Node *&left, Node *&right) {
+    if (node == nullptr) {
+        left = right = nullptr;
+        return;
+    }
+    bool goesLeft = keyToLeft ? node->key <= key : node->key < key;
+    if (goesLeft) {
+        split(node->right, key, keyToLeft, node->right, right);
+        left = node;
+    } else {
+        split(node->left, key, keyToLeft, left, node->left);
+        right = node;
+    }
+    update(node);
+}
+
+size_t OrderBookDepthIndex::countNodes(Node *node) {
+    if (node == nullptr) {
+        return 0;
+    }
+    return 1 + countNodes(node->left) + countNodes(node->right);
+}
+
+void OrderBookDepthIndex::deleteNodes(Node *node) {
+    if (node == nullptr) {
+        return;
+    }
+    deleteNodes(node->left);
+    deleteNodes(node->right);
+    delete node;
+}
+
+void OrderBookDepthIndex::setLevel(double price, double amount) {
+    double key = this->keyFor(price);
+    Node *left;
+    Node *middle;
+    Node *right;
+    split(this->root, key, false, left, middle);
+    split(middle, key, true, middle, right);
+    if (middle == nullptr) {
+        middle = new Node{key, price, amount, 0, 0, this->nextPriority(), nullptr, nullptr};
+        this->levels++;
+    } else {
+        middle->price = price;
+        middle->amount = amount;
+    }
+    update(middle);
+    this->root = merge(merge(left, middle), right);
+}
+
+void OrderBookDepthIndex::removeLevel(double price) {
+    double key = this->keyFor(price);
+    Node *left;
+    Node *middle;
+    Node *right;
+    split(this->root, key, false, left, middle);
+    split(middle, key, true, middle, right);
+    if (middle != nullptr) {
+        this->levels -= countNodes(middle);
+        deleteNodes(middle);
+    }
+    this->root = merge(left, right);
+}
+
+void OrderBookDepthIndex::removeLevelsBefore(double price) {
+    Node *left;
+    Node *right;
+    split(this->root, this->keyFor(price), false, left, right);
+    this->levels -= countNodes(left);
+    deleteNodes(left);
+    this->root = right;
+}
+
+void OrderBookDepthIndex::clear() {
+    deleteNodes(this->root);
+    this->root = nullptr;
+    this->levels = 0;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book) {
+    this->clear();
+    // The levels are appended in index order, so each merge only walks the right spine of the treap.
+    if (this->descending) {
+        for (std::set<OrderBookEntry>::reverse_iterator it = book.rbegin(); it != book.rend(); ++it) {
+            Node *node = new Node{this->keyFor(it->getPrice()), it->getPrice(), it->getAmount(), 0, 0,
+                                  this->nextPriority(), nullptr, nullptr};
+            update(node);
+            this->root = merge(this->root, node);
+        }
+    } else {
+        for (std::set<OrderBookEntry>::iterator it = book.begin(); it != book.end(); ++it) {
+            Node *node = new Node{this->keyFor(it->getPrice()), it->getPrice(), it->getAmount(), 0, 0,
+                                  this->nextPriority(), nullptr, nullptr};
+            update(node);
+            this->root = merge(this->root, node);
+        }
+    }
+    this->levels = book.size();
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->levels;
+}
+
+DepthIndexResult OrderBookDepthIndex::findVolume(double volume) const {
+    DepthIndexResult result = {false, NAN, 0, 0, 0};
+    Node *node = this->root;
+    double cumulativeAmount = 0;
+    double cumulativeQuoteAmount = 0;
+
+    while (node != nullptr) {
+        if (node->left != nullptr) {
+            if (cumulativeAmount + node->left->amountSum >= volume) {
+                node = node->left;
+                continue;
+            }
+            cumulativeAmount += node->left->amountSum;
+            cumulativeQuoteAmount += node->left->quoteAmountSum;
+        }
+        if (cumulativeAmount + node->amount >= volume) {
+            result.found = true;
+            result.price = node->price;
+            result.amount = node->amount;
+            break;
+        }
+        cumulativeAmount += node->amount;
+        cumulativeQuoteAmount += node->amount * node->price;
+        node = node->right;
+    }
+
+    result.cumulativeAmount = cumulativeAmount;
+    result.cumulativeQuoteAmount = cumulativeQuoteAmount;
+    return result;
+}
+
+DepthIndexResult OrderBookDepthIndex::findPrice(double price) const {
+    DepthIndexResult result = {false, NAN, 0, 0, 0};
+    Node *node = this->root;
+    double key = this->keyFor(price);
+    double cumulativeAmount = 0;
+    double cumulativeQuoteAmount = 0;
+
+    while (node != nullptr) {
+        if (node->key <= key) {
+            // The node and its left subtree are all within the price
+            if (node->left != nullptr) {
+                cumulativeAmount += node->left->amountSum;
+                cumulativeQuoteAmount += node->left->quoteAmountSum;
+            }
+            result.found = true;
+            result.price = node->price;
+            result.amount = node->amount;
+            result.cumulativeAmount = cumulativeAmount;
+            result.cumulativeQuoteAmount = cumulativeQuoteAmount;
+            cumulativeAmount += node->amount;
+            cumulativeQuoteAmount += node->amount * node->price;
+            node = node->right;
+        } else {
+            node = node->left;
+        }
+    }
+
+    return result;
+}
@@ -0,0 +1,75 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stdint.h>
+#include <set>
+#include "OrderBookEntry.h"
+
+// Result of a depth index lookup.
+//  - found: true if a level satisfying the lookup exists.
+//  - price: price of the level found, NaN if no level was found.
+//  - amount: amount of the level found, 0 if no level was found.
+//  - cumulativeAmount / cumulativeQuoteAmount: sums of amount and amount * price of the levels that come before the
+//    level found. If no level is found findVolume returns the sums of all the levels, and findPrice returns 0.
+struct DepthIndexResult {
+    bool found;
+    double price;
+    double amount;
+    double cumulativeAmount;
+    double cumulativeQuoteAmount;
+};
+
+// Cumulative volume index over one side of an order book.
+//
+// The levels are kept in a treap ordered from the top of the book (ascending prices for asks, descending prices for
+// bids), where every node also stores the sums of amount and amount * price of its subtree. Updating a level and
+// looking up the level where a cumulative volume is reached are O(log n) operations.
+class OrderBookDepthIndex {
+    struct Node {
+        double key;
+        double price;
+        double amount;
+        double amountSum;
+        double quoteAmountSum;
+        uint32_t priority;
+        Node *left;
+        Node *right;
+    };
+
+    bool descending;
+    Node *root;
+    size_t levels;
+    uint32_t randomState;
+
+    double keyFor(double price) const;
+    uint32_t nextPriority();
+    static void update(Node *node);
+    static Node *merge(Node *left, Node *right);
+    static void split(Node *node, double key, bool keyToLeft, Node *&left, Node *&right);
+    static size_t countNodes(Node *node);
+    static void deleteNodes(Node *node);
+
+    public:
+        OrderBookDepthIndex();
+        OrderBookDepthIndex(bool descending);
+        OrderBookDepthIndex(const OrderBookDepthIndex &other) = delete;
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other) = delete;
+        ~OrderBookDepthIndex();
+
+        // Sets the amount of a price level, adding the level if it is not in the index.
+        void setLevel(double price, double amount);
+        void removeLevel(double price);
+        // Removes the levels closer to the top of the book than the price (e.g. asks cheaper than the price).
+        void removeLevelsBefore(double price);
+        void clear();
+        // Rebuilds the index from all the entries of one side of an order book.
+        void rebuild(const std::set<OrderBookEntry> &book);
+        size_t size() const;
+
+        // Finds the first level, from the top of the book, where the cumulative amount reaches the volume.
+        DepthIndexResult findVolume(double volume) const;
+        // Finds the last level, from the top of the book, that is not past the price.
+        DepthIndexResult findPrice(double price) const;
+};
+
+#endif
@@ -0,0 +1,25 @@
+# distutils: language=c++
+
+from libcpp cimport bool as cppbool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    ctypedef struct DepthIndexResult:
+        cppbool found
+        double price
+        double amount
+        double cumulativeAmount
+        double cumulativeQuoteAmount
+
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        OrderBookDepthIndex(cppbool descending)
+        void setLevel(double price, double amount)
+        void removeLevel(double price)
+        void removeLevelsBefore(double price)
+        void clear()
+        void rebuild(const set[OrderBookEntry] &book)
+        size_t size() const
+        DepthIndexResult findVolume(double volume) const
+        DepthIndexResult findPrice(double price) const
@@ -1,8 +1,14 @@
 # distutils: language=c++
+from libcpp.vector cimport vector
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy, double max_volume, double max_price)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -1,7 +1,7 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import Iterator, List
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -9,18 +9,27 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries, and the
+    depth queries to run on those composite entries instead of the C++ order book sets
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
 
+    def enable_depth_index(self):
+        # The depth index is built from the original entries, it would ignore the recorded fills
+        raise TypeError("Composite order books do not support the depth index, their depth queries account for the "
+                        "recorded fills.")
+
     @property
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
@@ -192,3 +201,69 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    def simulate_buy(self, amount: float) -> List[OrderBookRow]:
+        amount_left = amount
+        retval = []
+        for ask_entry in self.ask_entries():
+            if ask_entry.amount < amount_left:
+                retval.append(ask_entry)
+                amount_left -= ask_entry.amount
+            else:
+                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
+                amount_left = 0.0
+                break
+        return retval
+
+    def simulate_sell(self, amount: float) -> List[OrderBookRow]:
+        amount_left = amount
+        retval = []
+        for bid_entry in self.bid_entries():
+            if bid_entry.amount < amount_left:
+                retval.append(bid_entry)
+                amount_left -= bid_entry.amount
+            else:
+                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
+                amount_left = 0.0
+                break
+        return retval
+
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy, double max_volume, double max_price):
+        cdef:
+            vector[OrderBookEntry] entries
+            double cumulative_volume = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (is_buy and order_book_row.price > max_price) or (not is_buy and order_book_row.price < max_price):
+                break
+            entries.push_back(OrderBookEntry(order_book_row.price, order_book_row.amount, order_book_row.update_id))
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= max_volume:
+                break
+        return entries
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
@@ -4,7 +4,7 @@ import math
 import typing
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, NamedTuple, Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -84,6 +84,36 @@ class TradeUpdate(NamedTuple):
 
 
 class InFlightOrder:
+    """
+    An order being tracked by a connector.
+
+    The class uses slots to keep its instances small, since connectors can track hundreds of orders. The asyncio
+    events and the fills dictionary are only created when they are first used.
+    """
+    __slots__ = (
+        "client_order_id",
+        "creation_timestamp",
+        "trading_pair",
+        "order_type",
+        "trade_type",
+        "price",
+        "amount",
+        "exchange_order_id",
+        "current_state",
+        "leverage",
+        "position",
+        "executed_amount_base",
+        "executed_amount_quote",
+        "last_update_timestamp",
+        "_order_fills",
+        "_exchange_order_id_update_event",
+        "_exchange_order_id_updated",
+        "_completely_filled_event",
+        "_completely_filled",
+        "_exchange_order_id_listener",
+        "__weakref__",
+    )
+
     def __init__(
             self,
             client_order_id: str,
@@ -115,37 +145,75 @@ class InFlightOrder:
 
         self.last_update_timestamp: float = creation_timestamp
 
-        self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
+        self._order_fills: Optional[Dict[str, TradeUpdate]] = None  # Dict[trade_id, TradeUpdate]
 
-        self.exchange_order_id_update_event = asyncio.Event()
-        if self.exchange_order_id:
-            self.exchange_order_id_update_event.set()
-        self.completely_filled_event = asyncio.Event()
+        self._exchange_order_id_update_event: Optional[asyncio.Event] = None
+        self._exchange_order_id_updated: bool = bool(exchange_order_id)
+        self._completely_filled_event: Optional[asyncio.Event] = None
+        self._completely_filled: bool = False
+        self._exchange_order_id_listener: Optional[Callable[["InFlightOrder"], None]] = None
 
     @property
     def attributes(self) -> Tuple[Any]:
-        return copy.deepcopy(
-            (
-                self.client_order_id,
-                self.trading_pair,
-                self.order_type,
-                self.trade_type,
-                self.price,
-                self.amount,
-                self.exchange_order_id,
-                self.current_state,
-                self.leverage,
-                self.position,
-                self.executed_amount_base,
-                self.executed_amount_quote,
-                self.creation_timestamp,
-                self.last_update_timestamp,
-            )
+        # All the attributes are immutable values, so the tuple can be shared without copying them
+        return (
+            self.client_order_id,
+            self.trading_pair,
+            self.order_type,
+            self.trade_type,
+            self.price,
+            self.amount,
+            self.exchange_order_id,
+            self.current_state,
+            self.leverage,
+            self.position,
+            self.executed_amount_base,
+            self.executed_amount_quote,
+            self.creation_timestamp,
+            self.last_update_timestamp,
         )
 
     def __eq__(self, other: object) -> bool:
         return type(self) is type(other) and self.attributes == other.attributes
 
+    @property
+    def order_fills(self) -> Dict[str, TradeUpdate]:
+        if self._order_fills is None:
+            self._order_fills = {}
+        return self._order_fills
+
+    @property
+    def exchange_order_id_update_event(self) -> asyncio.Event:
+        if self._exchange_order_id_update_event is None:
+            self._exchange_order_id_update_event = asyncio.Event()
+            if self._exchange_order_id_updated:
+                self._exchange_order_id_update_event.set()
+        return self._exchange_order_id_update_event
+
+    @exchange_order_id_update_event.setter
+    def exchange_order_id_update_event(self, event: asyncio.Event):
+        self._exchange_order_id_update_event = event
+
+    @property
+    def completely_filled_event(self) -> asyncio.Event:
+        if self._completely_filled_event is None:
+            self._completely_filled_event = asyncio.Event()
+            if self._completely_filled:
+                self._completely_filled_event.set()
+        return self._completely_filled_event
+
+    def snapshot(self, previous_snapshot: Optional["InFlightOrder"] = None) -> "InFlightOrder":
+        """
+        Returns a shallow copy of the order, reusing the previous snapshot if the order has not changed since it was
+        taken.
+
+        :param previous_snapshot: the last snapshot taken of this order, if any
+        :return: a copy of the order with its current state
+        """
+        if previous_snapshot is not None and previous_snapshot == self:
+            return previous_snapshot
+        return copy.copy(self)
+
     @property
     def base_asset(self):
         return self.trading_pair.split("-")[0]
@@ -200,7 +268,7 @@ class InFlightOrder:
     def average_executed_price(self) -> Optional[Decimal]:
         executed_value: Decimal = s_decimal_0
         total_base_amount: Decimal = s_decimal_0
-        for order_fill in self.order_fills.values():
+        for order_fill in (self._order_fills or {}).values():
             executed_value += order_fill.fill_price * order_fill.fill_base_amount
             total_base_amount += order_fill.fill_base_amount
         if executed_value == s_decimal_0 or total_base_amount == s_decimal_0:
@@ -229,9 +297,10 @@ class InFlightOrder:
         )
         order.executed_amount_base = Decimal(data["executed_amount_base"])
         order.executed_amount_quote = Decimal(data["executed_amount_quote"])
-        order.order_fills.update({key: TradeUpdate.from_json(value)
-                                  for key, value
-                                  in data.get("order_fills", {}).items()})
+        if data.get("order_fills"):
+            order.order_fills.update({key: TradeUpdate.from_json(value)
+                                      for key, value
+                                      in data["order_fills"].items()})
 
         order.check_filled_condition()
 
@@ -256,7 +325,7 @@ class InFlightOrder:
             "leverage": str(self.leverage),
             "position": self.position.value,
             "creation_timestamp": self.creation_timestamp,
-            "order_fills": {key: fill.to_json() for key, fill in self.order_fills.items()}
+            "order_fills": {key: fill.to_json() for key, fill in (self._order_fills or {}).items()}
         }
 
     def to_limit_order(self) -> LimitOrder:
@@ -278,7 +347,17 @@ class InFlightOrder:
 
     def update_exchange_order_id(self, exchange_order_id: str):
         self.exchange_order_id = exchange_order_id
-        self.exchange_order_id_update_event.set()
+        self._exchange_order_id_updated = True
+        if self._exchange_order_id_update_event is not None:
+            self._exchange_order_id_update_event.set()
+        if self._exchange_order_id_listener is not None:
+            self._exchange_order_id_listener(self)
+
+    def set_exchange_order_id_listener(self, listener: Optional[Callable[["InFlightOrder"], None]]):
+        """
+        Sets the function to call with the order every time its exchange order id is updated
+        """
+        self._exchange_order_id_listener = listener
 
     async def get_exchange_order_id(self):
         if self.exchange_order_id is None:
@@ -294,7 +373,7 @@ class InFlightOrder:
         :return: the cumulative fee paid for all partial fills in the specified token
         """
         total_fee_in_token = Decimal("0")
-        for trade_update in self.order_fills.values():
+        for trade_update in (self._order_fills or {}).values():
             total_fee_in_token += trade_update.fee.fee_amount_in_token(
                 trading_pair=trade_update.trading_pair,
                 price=trade_update.fill_price,
@@ -335,7 +414,7 @@ class InFlightOrder:
         """
         trade_id: str = trade_update.trade_id
 
-        if (trade_id in self.order_fills
+        if ((self._order_fills is not None and trade_id in self._order_fills)
                 or (self.client_order_id != trade_update.client_order_id
                     and self.exchange_order_id != trade_update.exchange_order_id)):
             return False
@@ -352,7 +431,9 @@ class InFlightOrder:
 
     def check_filled_condition(self):
         if (abs(self.amount) - self.executed_amount_base).quantize(Decimal('1e-8')) <= 0:
-            self.completely_filled_event.set()
+            self._completely_filled = True
+            if self._completely_filled_event is not None:
+                self._completely_filled_event.set()
 
     async def wait_until_completely_filled(self):
         await self.completely_filled_event.wait()
@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp hummingbot/core/cpp/OrderBookDepthIndex.cpp
 import bisect
 import logging
 import time
@@ -15,6 +15,9 @@ import numpy as np
 import pandas as pd
 from aiokafka import ConsumerRecord
 
+from cpython.float cimport PyFloat_AS_DOUBLE
+from cpython.ref cimport PyObject
+from libc.math cimport INFINITY, isnan
 from cython.operator cimport(
     address as ref,
     dereference as deref,
@@ -24,6 +27,7 @@ from cython.operator cimport(
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.OrderBookDepthIndex cimport DepthIndexResult
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
@@ -33,10 +37,28 @@ from hummingbot.core.event.events import (
 
 cimport numpy as np
 
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8(object unicode) except NULL
+    double PyOS_string_to_double(const char *s, char **endptr, PyObject *overflow_exception) except? -1.0
+
 ob_logger = None
 NaN = float("nan")
 
 
+cdef inline double c_level_value(object value) except? -1.0:
+    # Exchanges send the prices and amounts as strings or JSON numbers, parse them without creating float objects
+    if type(value) is str:
+        return PyOS_string_to_double(PyUnicode_AsUTF8(value), NULL, NULL)
+    if type(value) is float:
+        return PyFloat_AS_DOUBLE(value)
+    return float(value)
+
+
+cdef c_append_raw_levels(object levels, int64_t update_id, vector[OrderBookEntry] *entries):
+    for level in levels:
+        entries.push_back(OrderBookEntry(c_level_value(level[0]), c_level_value(level[1]), update_id))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -47,15 +69,61 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
+        """
+        :param dex: True if the overlapping entries have to be truncated with the DEX rules
+        :param depth_index: True to keep a cumulative depth index of the book, that makes the price/volume queries
+        O(log n) instead of linear scans from the top of the book at the cost of slower updates
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._snapshot_timestamp = float("NaN")
         self._best_bid = self._best_ask = float("NaN")
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        if depth_index:
+            self.enable_depth_index()
+
+    def __dealloc__(self):
+        del self._bid_depth_index
+        del self._ask_depth_index
+
+    @property
+    def has_depth_index(self) -> bool:
+        return self._bid_depth_index != NULL
+
+    def enable_depth_index(self):
+        """
+        Starts keeping a cumulative depth index of the book, built from its current content
+        """
+        if self._bid_depth_index == NULL:
+            self._bid_depth_index = new OrderBookDepthIndex(True)
+            self._ask_depth_index = new OrderBookDepthIndex(False)
+            deref(self._bid_depth_index).rebuild(self._bid_book)
+            deref(self._ask_depth_index).rebuild(self._ask_book)
+
+    def disable_depth_index(self):
+        del self._bid_depth_index
+        del self._ask_depth_index
+        self._bid_depth_index = NULL
+        self._ask_depth_index = NULL
+
+    cdef c_truncate_depth_indices(self):
+        """
+        Removes from the depth indices the levels that are no longer in the books after truncating the overlapping
+        entries. Those are always levels better than the current top of the book.
+        """
+        if self._bid_book.empty():
+            deref(self._bid_depth_index).clear()
+        else:
+            deref(self._bid_depth_index).removeLevelsBefore(deref(self._bid_book.rbegin()).getPrice())
+        if self._ask_book.empty():
+            deref(self._ask_depth_index).clear()
+        else:
+            deref(self._ask_depth_index).removeLevelsBefore(deref(self._ask_book.begin()).getPrice())
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -81,8 +149,22 @@ cdef class OrderBook(PubSub):
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
 
+        if self._bid_depth_index != NULL:
+            for bid in bids:
+                if bid.getAmount() > 0:
+                    deref(self._bid_depth_index).setLevel(bid.getPrice(), bid.getAmount())
+                else:
+                    deref(self._bid_depth_index).removeLevel(bid.getPrice())
+            for ask in asks:
+                if ask.getAmount() > 0:
+                    deref(self._ask_depth_index).setLevel(ask.getPrice(), ask.getAmount())
+                else:
+                    deref(self._ask_depth_index).removeLevel(ask.getPrice())
+
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if self._bid_depth_index != NULL:
+            self.c_truncate_depth_indices()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -134,6 +216,10 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        if self._bid_depth_index != NULL:
+            deref(self._bid_depth_index).rebuild(self._bid_book)
+            deref(self._ask_depth_index).rebuild(self._ask_book)
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
@@ -170,6 +256,13 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def snapshot_timestamp(self) -> Optional[float]:
+        """
+        The timestamp of the last snapshot message applied with apply_snapshot_message, None if there is none
+        """
+        return None if isnan(self._snapshot_timestamp) else self._snapshot_timestamp
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -188,6 +281,60 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: List[List], asks: List[List], update_id: int):
+        """
+        Applies diff levels as received from the exchange, without building OrderBookRow instances.
+
+        :param bids: the bid levels, [price, amount, ...] lists with string or numeric values, extra values are ignored
+        :param asks: the ask levels, in the same format as the bids
+        :param update_id: the update id of the diff
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_raw_levels(bids, update_id, &cpp_bids)
+        c_append_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_message(self, diff: OrderBookMessage):
+        """
+        Applies a diff message, from its raw exchange levels when the message holds them (see OrderBookMessage.raw_bids)
+        """
+        raw_bids = diff.raw_bids
+        raw_asks = diff.raw_asks
+        if raw_bids is not None and raw_asks is not None:
+            self.apply_raw_diffs(raw_bids, raw_asks, diff.update_id)
+        else:
+            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+    def apply_diff_messages(self, diffs: List[OrderBookMessage]):
+        """
+        Applies several diff messages, in order, with a single c_apply_diffs call. The levels of all the diffs are
+        applied in their order, so the last update of each level is the one left in the book.
+
+        :param diffs: the diff messages, ordered by update id
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id = self._last_diff_uid
+            int64_t update_id
+
+        for diff in diffs:
+            update_id = diff.update_id
+            raw_bids = diff.raw_bids
+            raw_asks = diff.raw_asks
+            if raw_bids is not None and raw_asks is not None:
+                c_append_raw_levels(raw_bids, update_id, &cpp_bids)
+                c_append_raw_levels(raw_asks, update_id, &cpp_asks)
+            else:
+                for row in diff.bids:
+                    cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+                for row in diff.asks:
+                    cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            last_update_id = update_id
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -198,6 +345,34 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_snapshot(self, bids: List[List], asks: List[List], update_id: int):
+        """
+        Applies snapshot levels as received from the exchange, without building OrderBookRow instances.
+
+        :param bids: the bid levels, [price, amount, ...] lists with string or numeric values, extra values are ignored
+        :param asks: the ask levels, in the same format as the bids
+        :param update_id: the update id of the snapshot
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_raw_levels(bids, update_id, &cpp_bids)
+        c_append_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_snapshot_message(self, snapshot: OrderBookMessage):
+        """
+        Applies a snapshot message, from its raw exchange levels when the message holds them (see
+        OrderBookMessage.raw_bids)
+        """
+        raw_bids = snapshot.raw_bids
+        raw_asks = snapshot.raw_asks
+        if raw_bids is not None and raw_asks is not None:
+            self.apply_raw_snapshot(raw_bids, raw_asks, snapshot.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self._snapshot_timestamp = snapshot.timestamp if snapshot.timestamp is not None else float("NaN")
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -282,31 +457,39 @@ cdef class OrderBook(PubSub):
             inc(it)
 
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
+        cdef:
+            double amount_left = amount
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            OrderBookEntry entry
         retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
+        while it != self._ask_book.end():
+            entry = deref(it)
+            if entry.getAmount() < amount_left:
+                retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                amount_left -= entry.getAmount()
             else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
+                retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
                 amount_left = 0.0
                 break
+            inc(it)
         return retval
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
+        cdef:
+            double amount_left = amount
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            OrderBookEntry entry
         retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
+        while it != self._bid_book.rend():
+            entry = deref(it)
+            if entry.getAmount() < amount_left:
+                retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                amount_left -= entry.getAmount()
             else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
+                retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
                 amount_left = 0.0
                 break
+            inc(it)
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
@@ -319,55 +502,104 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy, double max_volume, double max_price):
+        """
+        Collects the entries on one side of the book, from the top of the book, until the cumulative volume reaches
+        max_volume or the price goes past max_price. The entries are not converted to Python objects.
+        """
+        cdef:
+            vector[OrderBookEntry] entries
+            double cumulative_volume = 0
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if is_buy:
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > max_price:
+                    break
+                entries.push_back(deref(ask_it))
+                cumulative_volume += deref(ask_it).getAmount()
+                if cumulative_volume >= max_volume:
+                    break
+                inc(ask_it)
+        else:
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < max_price:
+                    break
+                entries.push_back(deref(bid_it))
+                cumulative_volume += deref(bid_it).getAmount()
+                if cumulative_volume >= max_volume:
+                    break
+                inc(bid_it)
+        return entries
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            DepthIndexResult index_result
+
+        if self._bid_depth_index != NULL:
+            index_result = deref(self._ask_depth_index if is_buy else self._bid_depth_index).findVolume(volume)
+            cumulative_volume = index_result.cumulativeAmount + index_result.amount
+            return OrderBookQueryResult(NaN, volume, index_result.price, min(cumulative_volume, volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookEntry entry
+            vector[OrderBookEntry] entries
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double price
+            double amount
+            double incremental_amount
+            DepthIndexResult index_result
+
+        if self._bid_depth_index != NULL:
+            index_result = deref(self._ask_depth_index if is_buy else self._bid_depth_index).findVolume(volume)
+            total_cost = index_result.cumulativeQuoteAmount
+            total_volume = index_result.cumulativeAmount
+            if index_result.found:
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * index_result.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+            return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+        entries = self.c_get_depth_entries(is_buy, volume, INFINITY if is_buy else -INFINITY)
+        for entry in entries:
+            price = entry.getPrice()
+            amount = entry.getAmount()
+            total_cost += amount * price
+            total_volume += amount
+            if total_volume >= volume:
+                total_cost -= amount * price
+                total_volume -= amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -375,89 +607,236 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            OrderBookEntry entry
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(is_buy,
+                                                                      base_amount,
+                                                                      INFINITY if is_buy else -INFINITY)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        for entry in entries:
+            row_amount = entry.getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * entry.getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookEntry entry
+            vector[OrderBookEntry] entries
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndexResult index_result
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if self._bid_depth_index != NULL:
+            index_result = deref(self._ask_depth_index if is_buy else self._bid_depth_index).findPrice(price)
+            cumulative_volume = index_result.cumulativeAmount + index_result.amount
+            return OrderBookQueryResult(price, NaN, index_result.price, cumulative_volume)
+
+        entries = self.c_get_depth_entries(is_buy, INFINITY, price)
+
+        for entry in entries:
+            cumulative_volume += entry.getAmount()
+            result_price = entry.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookEntry entry
+            vector[OrderBookEntry] entries
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndexResult index_result
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if self._bid_depth_index != NULL:
+            index_result = deref(self._ask_depth_index if is_buy else self._bid_depth_index).findPrice(price)
+            if index_result.found:
+                cumulative_volume = (index_result.cumulativeQuoteAmount
+                                     + index_result.amount * index_result.price)
+            return OrderBookQueryResult(price, NaN, index_result.price, cumulative_volume)
+
+        entries = self.c_get_depth_entries(is_buy, INFINITY, price)
+
+        for entry in entries:
+            cumulative_volume += entry.getAmount() * entry.getPrice()
+            result_price = entry.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef list c_get_prices_for_volumes(self, bint is_buy, list volumes):
+        """
+        Answers several price for volume queries with a single pass over one side of the book.
+        The results are in the same order as the queried volumes.
+        """
+        if self._bid_depth_index != NULL:
+            return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+        cdef:
+            vector[double] query_volumes = volumes
+            vector[size_t] sorted_queries = sorted(range(len(volumes)), key=volumes.__getitem__)
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(
+                is_buy,
+                query_volumes[sorted_queries.back()] if query_volumes.size() > 0 else 0,
+                INFINITY if is_buy else -INFINITY)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double volume
+            size_t query_index = 0
+            size_t result_index
+            size_t queries_count = query_volumes.size()
+            list results = [None] * queries_count
+
+        for entry in entries:
+            cumulative_volume += entry.getAmount()
+            while query_index < queries_count and cumulative_volume >= query_volumes[sorted_queries[query_index]]:
+                result_index = sorted_queries[query_index]
+                volume = query_volumes[result_index]
+                results[result_index] = OrderBookQueryResult(
+                    NaN, volume, entry.getPrice(), min(cumulative_volume, volume))
+                query_index += 1
+            if query_index == queries_count:
+                break
+        while query_index < queries_count:
+            result_index = sorted_queries[query_index]
+            volume = query_volumes[result_index]
+            results[result_index] = OrderBookQueryResult(
+                NaN, volume, NaN, min(cumulative_volume, volume))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_vwaps_for_volumes(self, bint is_buy, list volumes):
+        """
+        Answers several VWAP for volume queries with a single pass over one side of the book.
+        The results are in the same order as the queried volumes.
+        """
+        if self._bid_depth_index != NULL:
+            return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+        cdef:
+            vector[double] query_volumes = volumes
+            vector[size_t] sorted_queries = sorted(range(len(volumes)), key=volumes.__getitem__)
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(
+                is_buy,
+                query_volumes[sorted_queries.back()] if query_volumes.size() > 0 else 0,
+                INFINITY if is_buy else -INFINITY)
+            OrderBookEntry entry
+            double total_cost = 0
+            double total_volume = 0
+            double price
+            double amount
+            double volume
+            double query_cost
+            double query_volume
+            double incremental_amount
+            size_t query_index = 0
+            size_t result_index
+            size_t queries_count = query_volumes.size()
+            list results = [None] * queries_count
+
+        for entry in entries:
+            price = entry.getPrice()
+            amount = entry.getAmount()
+            total_cost += amount * price
+            total_volume += amount
+            while query_index < queries_count and total_volume >= query_volumes[sorted_queries[query_index]]:
+                # Same calculation as c_get_vwap_for_volume, so the results are identical
+                result_index = sorted_queries[query_index]
+                volume = query_volumes[result_index]
+                query_cost = total_cost
+                query_volume = total_volume
+                query_cost -= amount * price
+                query_volume -= amount
+                incremental_amount = volume - query_volume
+                query_cost += incremental_amount * price
+                query_volume += incremental_amount
+                results[result_index] = OrderBookQueryResult(
+                    NaN, volume, query_cost / query_volume, min(query_volume, volume))
+                query_index += 1
+            if query_index == queries_count:
+                break
+        while query_index < queries_count:
+            result_index = sorted_queries[query_index]
+            volume = query_volumes[result_index]
+            results[result_index] = OrderBookQueryResult(
+                NaN, volume, NaN, min(total_volume, volume))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_volumes_for_prices(self, bint is_buy, list prices):
+        """
+        Answers several volume for price queries with a single pass over one side of the book.
+        The results are in the same order as the queried prices.
+        """
+        if self._bid_depth_index != NULL:
+            return [self.c_get_volume_for_price(is_buy, price) for price in prices]
+
+        cdef:
+            vector[double] query_prices = prices
+            vector[size_t] sorted_queries = sorted(range(len(prices)), key=prices.__getitem__, reverse=not is_buy)
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(
+                is_buy,
+                INFINITY,
+                query_prices[sorted_queries.back()] if query_prices.size() > 0 else (-INFINITY if is_buy else INFINITY))
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double result_price = NaN
+            double price
+            size_t query_index = 0
+            size_t result_index
+            size_t queries_count = query_prices.size()
+            list results = [None] * queries_count
+
+        for entry in entries:
+            # Answer the queries with prices before this entry, they don't include its volume
+            while query_index < queries_count:
+                result_index = sorted_queries[query_index]
+                price = query_prices[result_index]
+                if (is_buy and entry.getPrice() <= price) or (not is_buy and entry.getPrice() >= price):
+                    break
+                results[result_index] = OrderBookQueryResult(
+                    price, NaN, result_price, cumulative_volume)
+                query_index += 1
+            cumulative_volume += entry.getAmount()
+            result_price = entry.getPrice()
+        while query_index < queries_count:
+            result_index = sorted_queries[query_index]
+            price = query_prices[result_index]
+            results[result_index] = OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            query_index += 1
+
+        return results
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -476,6 +855,15 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_prices_for_volumes(is_buy, [float(volume) for volume in volumes])
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_vwaps_for_volumes(is_buy, [float(volume) for volume in volumes])
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_volumes_for_prices(is_buy, [float(price) for price in prices])
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -487,6 +875,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -64,10 +64,36 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def raw_asks(self) -> Optional[List[List[Any]]]:
+        """
+        The ask levels as received from the exchange, [price, amount, ...] lists with string or numeric values, to be
+        applied with OrderBook.apply_raw_diffs or apply_raw_snapshot. None if the message builds its asks from another
+        payload format.
+        """
+        return self.content["asks"] if type(self).asks is OrderBookMessage.asks else None
+
+    @property
+    def raw_bids(self) -> Optional[List[List[Any]]]:
+        """
+        The bid levels as received from the exchange, see raw_asks
+        """
+        return self.content["bids"] if type(self).bids is OrderBookMessage.bids else None
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
 
+    @property
+    def has_first_update_id(self) -> bool:
+        """
+        True for diff messages stating the first update they include, so their continuity with the previous diff can
+        be checked (first_update_id is then the previous update_id + 1). This requires first_update_id and update_id to
+        be numbers of the same sequence, as for Binance, Gate.io and KuCoin. CoinFLEX diffs have a sequence number as
+        first_update_id and a timestamp as update_id, so they never show a gap.
+        """
+        return self.type is OrderBookMessageType.DIFF and "first_update_id" in self.content
+
     @property
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
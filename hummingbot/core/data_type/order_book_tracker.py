@@ -3,16 +3,17 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from hummingbot.core.backtest.market_data_recorder import MarketDataRecorder
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
-from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource, WebsocketShardStats
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +22,34 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class DirectDispatchQueue:
+    """
+    Used in place of a message queue to hand the messages to a dispatch function as soon as they are added, instead of
+    storing them until a consumer task reads them.
+    """
+
+    def __init__(self, dispatch: Callable[[OrderBookMessage], None]):
+        self._dispatch = dispatch
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._dispatch(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._dispatch(message)
+
+    def qsize(self) -> int:
+        return 0
+
+    def empty(self) -> bool:
+        return True
+
+
 class OrderBookTracker():
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
+    MAX_COALESCED_DIFFS: int = 1000
+    MAX_RESYNC_BUFFERED_DIFFS: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,20 +58,71 @@ class OrderBookTracker():
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 concurrent_bootstrap: bool = False,
+                 coalesce_diffs: bool = False,
+                 direct_dispatch: bool = False,
+                 resync_on_gap: bool = False,
+                 websocket_shards: int = 1):
+        """
+        :param data_source: the data source providing snapshots, diffs and trades
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, when the connector supports several
+        :param concurrent_bootstrap: if True the initial snapshots are requested concurrently (the data source
+        requests are expected to be rate limited by the connector's throttler) and each order book starts being
+        tracked as soon as its own snapshot is available. Otherwise the snapshots are requested one at a time.
+        :param coalesce_diffs: if True all the diff messages queued for an order book are applied to it at once, their
+        levels concatenated in order in a single OrderBook.apply_diff_messages call, instead of applying them one
+        message at a time
+        :param direct_dispatch: if True the messages parsed by the data source are routed straight to the per pair
+        tracking queues (diffs and snapshots) or applied to the order books (trades) when they are received, instead
+        of going through the intermediate streams and router tasks
+        :param resync_on_gap: if True the diffs that include their first update id are checked for gaps, for each
+        order book (see OrderBookMessage.has_first_update_id for the connectors it applies to). A gap makes the data
+        source fetch a new snapshot of that order book only, and the diffs received meanwhile are buffered and
+        applied after it. The data source no longer resets all the order books periodically. Ignored for the data
+        sources overriding listen_for_order_book_snapshots, they cannot fetch snapshots on demand
+        (see OrderBookTrackerDataSource.enable_on_demand_snapshots)
+        :param websocket_shards: the number of websocket connections the data source spreads the trading pairs
+        subscriptions over, if it supports it (see OrderBookTrackerDataSource.set_websocket_shards). The order books
+        of a reconnected shard are only resynchronized right away together with resync_on_gap, which enables the on
+        demand snapshots
+        """
         self._domain: Optional[str] = domain
+        self._concurrent_bootstrap: bool = concurrent_bootstrap
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._direct_dispatch: bool = direct_dispatch
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        if resync_on_gap:
+            self._data_source.enable_on_demand_snapshots()
+        self._resync_on_gap: bool = resync_on_gap and self._data_source.on_demand_snapshots_enabled
+        if websocket_shards > 1:
+            self._data_source.set_websocket_shards(websocket_shards)
+        if direct_dispatch:
+            self._order_book_diff_stream = DirectDispatchQueue(self._route_diff_message)
+            self._order_book_snapshot_stream = DirectDispatchQueue(self._route_snapshot_message)
+            self._order_book_trade_stream = DirectDispatchQueue(self._apply_trade_message)
+            self._data_source.set_direct_dispatch_outputs(diff_output=self._order_book_diff_stream,
+                                                          trade_output=self._order_book_trade_stream)
+        else:
+            self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
+            self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
+            self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +146,34 @@ class OrderBookTracker():
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    @market_data_recorder.setter
+    def market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        """
+        Sets the recorder of the snapshots, diffs and trades applied to the order books. Recording is disabled when
+        there is no recorder (the default). The recorder is started and stopped with the tracker.
+        """
+        self._market_data_recorder = recorder
+
+    @property
+    def websocket_shard_stats(self) -> List[WebsocketShardStats]:
+        """
+        Returns the statistics of each websocket connection of the data source, when its subscriptions are sharded
+        """
+        return self._data_source.websocket_shard_stats
+
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book has been initialized and is being tracked
+        """
+        return [trading_pair
+                for trading_pair in self._trading_pairs
+                if self.is_order_book_ready(trading_pair)]
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,14 +181,45 @@ class OrderBookTracker():
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Checks if the order book for a trading pair has been initialized, independently of the other order books
+
+        :param trading_pair: the trading pair to check
+
+        :return: True if the order book is initialized and being tracked
+        """
+        event = self._order_book_ready_events.get(trading_pair)
+        return (event is not None and event.is_set()) or (self.ready and trading_pair in self._order_books)
+
+    async def wait_for_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        Waits until the order book of a trading pair is initialized
+
+        :param trading_pair: the trading pair to wait for
+
+        :return: the initialized order book
+        """
+        await self._order_book_ready_events[trading_pair].wait()
+        return self._order_books[trading_pair]
+
     def start(self):
         self.stop()
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.start()
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
-        self._emit_trade_event_task = safe_ensure_future(
-            self._emit_trade_event_loop()
-        )
+        if not self._direct_dispatch:
+            self._emit_trade_event_task = safe_ensure_future(
+                self._emit_trade_event_loop()
+            )
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._order_book_diff_listener_task = safe_ensure_future(
             self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
@@ -95,12 +232,6 @@ class OrderBookTracker():
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -138,6 +269,11 @@ class OrderBookTracker():
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
+        if self._market_data_recorder is not None:
+            # Stopping the recorder waits for its thread to write the queued messages, out of the event loop
+            self._ev_loop.run_in_executor(None, self._market_data_recorder.stop)
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -166,6 +302,14 @@ class OrderBookTracker():
                 self.logger().network("Unexpected error while fetching last trade price.", exc_info=True)
                 await asyncio.sleep(30)
 
+    async def _wait_for_order_books_tracking(self):
+        """
+        With the concurrent bootstrap each order book is processed as soon as it is initialized (messages for pairs
+        not yet initialized are discarded by the consumers). Otherwise waits for all the order books.
+        """
+        if not self._concurrent_bootstrap:
+            await self._order_books_initialized.wait()
+
     async def _initial_order_book_for_trading_pair(self, trading_pair: str) -> OrderBook:
         return await self._data_source.get_new_order_book(trading_pair)
 
@@ -173,15 +317,64 @@ class OrderBookTracker():
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        if self._concurrent_bootstrap:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair, order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await asyncio.sleep(1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Requests the initial snapshot of all order books at the same time, with at most
+        MAX_CONCURRENT_SNAPSHOT_REQUESTS requests in flight. The rate limits are enforced by the throttler used by the
+        data source. Each order book starts being tracked as soon as its snapshot is received.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        completed: List[str] = []
+
+        async def init_order_book(trading_pair: str):
+            while True:
+                try:
+                    async with semaphore:
+                        order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing order book for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Could not initialize the order book for {trading_pair}. "
+                                        f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL} seconds."
+                    )
+                    await asyncio.sleep(self.SNAPSHOT_RETRY_INTERVAL)
+            self._start_tracking_order_book(trading_pair, order_book)
+            completed.append(trading_pair)
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{len(completed)}/{len(self._trading_pairs)} completed.")
+
+        tasks = [safe_ensure_future(init_order_book(trading_pair)) for trading_pair in self._trading_pairs]
+        try:
+            await safe_gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        self._last_update_ids[trading_pair] = order_book.snapshot_uid
+        self._resync_buffers.pop(trading_pair, None)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record_order_book(trading_pair, order_book, order_book.snapshot_timestamp)
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -194,21 +387,13 @@ class OrderBookTracker():
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
+                routed: Optional[bool] = self._route_diff_message(ob_message)
+                if routed is None:
                     messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
+                if not routed:
                     messages_rejected += 1
                     continue
-                await message_queue.put(ob_message)
                 messages_accepted += 1
 
                 # Log some statistics.
@@ -235,21 +420,62 @@ class OrderBookTracker():
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
+        await self._wait_for_order_books_tracking()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
-                trading_pair: str = ob_message.trading_pair
-                if trading_pair not in self._tracking_message_queues:
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
+                self._route_snapshot_message(ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _route_diff_message(self, ob_message: OrderBookMessage) -> Optional[bool]:
+        """
+        Adds a diff message to the tracking queue of its order book. Messages received before the order book is
+        initialized are saved to be applied after its snapshot.
+
+        :return: True if the message was queued for tracking, False if it is older than the order book snapshot, None
+        if it was saved
+        """
+        trading_pair: str = ob_message.trading_pair
+        if trading_pair not in self._tracking_message_queues:
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(ob_message)
+            return None
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        if self._order_books[trading_pair].snapshot_uid > ob_message.update_id:
+            return False
+        self._tracking_message_queues[trading_pair].put_nowait(ob_message)
+        return True
+
+    def _route_snapshot_message(self, ob_message: OrderBookMessage):
+        message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(ob_message.trading_pair)
+        if message_queue is not None:
+            message_queue.put_nowait(ob_message)
+
+    def _apply_trade_message(self, trade_message: OrderBookMessage) -> bool:
+        """
+        Applies a trade message to its order book
+
+        :return: True if the message was applied, False if the order book is not tracked
+        """
+        order_book: Optional[OrderBook] = self._order_books.get(trade_message.trading_pair)
+        if order_book is None:
+            return False
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        ))
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record_message(trade_message, order_book)
+        return True
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
@@ -257,21 +483,39 @@ class OrderBookTracker():
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        next_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if next_message is not None:
+                    message = next_message
+                    next_message = None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs:
+                        diffs, next_message = self._get_queued_diffs(message, saved_messages, message_queue)
+                    else:
+                        diffs = [message]
+                    if self._resync_on_gap:
+                        diffs = self._continuous_diffs(trading_pair, diffs)
+                        if len(diffs) == 0:
+                            continue
+                    if self._coalesce_diffs:
+                        order_book.apply_diff_messages(diffs)
+                    else:
+                        order_book.apply_diff_message(diffs[0])
+                    past_diffs_window.extend(diffs)
+                    diff_messages_accepted += len(diffs)
+                    if self._market_data_recorder is not None:
+                        for diff in diffs:
+                            self._market_data_recorder.record_message(diff, order_book)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -281,7 +525,20 @@ class OrderBookTracker():
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                    resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.pop(trading_pair, None)
+                    if resync_buffer is not None:
+                        past_diffs.extend(resync_buffer)
+                        past_diffs_window.extend(resync_buffer)
+                    if self._resync_on_gap:
+                        past_diffs = [diff for diff in past_diffs if diff.update_id > message.update_id]
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._resync_on_gap:
+                        # Starts a new resync if the diffs replayed after the snapshot are not continuous with it
+                        self._last_update_ids[trading_pair] = message.update_id
+                        self._continuous_diffs(trading_pair, past_diffs)
+                    if self._market_data_recorder is not None:
+                        # The restored order book includes the past diffs applied after the snapshot
+                        self._market_data_recorder.record_order_book(trading_pair, order_book, message.timestamp)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -293,30 +550,66 @@ class OrderBookTracker():
                 )
                 await asyncio.sleep(5.0)
 
+    def _continuous_diffs(self, trading_pair: str, diffs: List[OrderBookMessage]) -> List[OrderBookMessage]:
+        """
+        Checks the continuity of the diffs with the last update applied to the order book. The diffs from the first
+        gap on are buffered, and a new snapshot of the order book is requested. While the snapshot is awaited all the
+        diffs are buffered.
+
+        :return: the diffs that can be applied to the order book
+        """
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.get(trading_pair)
+        if resync_buffer is not None:
+            resync_buffer.extend(diffs)
+            return []
+        last_update_id: int = self._last_update_ids[trading_pair]
+        for index, diff in enumerate(diffs):
+            if diff.has_first_update_id and diff.first_update_id > last_update_id + 1:
+                self.logger().warning(f"Order book diffs gap for {trading_pair} (expected update {last_update_id + 1}, "
+                                      f"received {diff.first_update_id}). Requesting a new snapshot.")
+                self._last_update_ids[trading_pair] = last_update_id
+                self._resync_buffers[trading_pair] = deque(diffs[index:], maxlen=self.MAX_RESYNC_BUFFERED_DIFFS)
+                self._data_source.request_order_book_snapshot(trading_pair)
+                return diffs[:index]
+            last_update_id = max(last_update_id, diff.update_id)
+        self._last_update_ids[trading_pair] = last_update_id
+        return diffs
+
+    def _get_queued_diffs(self,
+                          first_diff: OrderBookMessage,
+                          saved_messages: Deque[OrderBookMessage],
+                          message_queue: asyncio.Queue) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes, without waiting, the diff messages queued for an order book after the first one. It stops at the first
+        message that is not a diff, so it can be processed after the diffs, in order.
+
+        :return: the diff messages and the first message that is not a diff, if any
+        """
+        diffs: List[OrderBookMessage] = [first_diff]
+        while len(diffs) < self.MAX_COALESCED_DIFFS:
+            if len(saved_messages) > 0:
+                message = saved_messages.popleft()
+            elif not message_queue.empty():
+                message = message_queue.get_nowait()
+            else:
+                break
+            if message.type is not OrderBookMessageType.DIFF:
+                return diffs, message
+            diffs.append(message)
+        return diffs, None
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
+        await self._wait_for_order_books_tracking()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
-                trading_pair: str = trade_message.trading_pair
-
-                if trading_pair not in self._order_books:
+                if not self._apply_trade_message(trade_message):
                     messages_rejected += 1
                     continue
 
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
-
                 messages_accepted += 1
 
                 # Log some statistics.
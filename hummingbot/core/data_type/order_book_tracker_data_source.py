@@ -7,12 +7,77 @@ from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.duration_histogram import DurationHistogram
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
+class WebsocketShardStats:
+    """
+    Connection and message statistics of one of the websocket connections of a data source
+    """
+    MESSAGE_RATE_INTERVAL: float = 10.0
+
+    def __init__(self, shard_id: int, trading_pairs: List[str]):
+        self.shard_id: int = shard_id
+        self.trading_pairs: List[str] = trading_pairs
+        self.connected: bool = False
+        self.connections: int = 0
+        self.messages: int = 0
+        self.last_message_timestamp: float = 0.0
+        # Time taken to hand each message over to its queue or to parse it (direct dispatch)
+        self.dispatch_times: DurationHistogram = DurationHistogram()
+        self._rate_interval_start: float = 0.0
+        self._rate_interval_messages: int = 0
+        self._message_rate: float = 0.0
+
+    @property
+    def reconnections(self) -> int:
+        return max(0, self.connections - 1)
+
+    @property
+    def message_rate(self) -> float:
+        """
+        The messages per second received during the last completed MESSAGE_RATE_INTERVAL
+        """
+        return self._message_rate
+
+    def lag(self, timestamp: float) -> float:
+        """
+        :param timestamp: the current time
+        :return: the seconds elapsed since the last message was received, 0 if no message was received yet
+        """
+        return timestamp - self.last_message_timestamp if self.last_message_timestamp > 0 else 0.0
+
+    def record_message(self, timestamp: float, dispatch_time: float):
+        if timestamp - self._rate_interval_start >= self.MESSAGE_RATE_INTERVAL:
+            if self._rate_interval_start > 0:
+                self._message_rate = self._rate_interval_messages / (timestamp - self._rate_interval_start)
+            self._rate_interval_start = timestamp
+            self._rate_interval_messages = 0
+        self._rate_interval_messages += 1
+        self.messages += 1
+        self.last_message_timestamp = timestamp
+        self.dispatch_times.record(dispatch_time)
+
+    def to_dict(self, timestamp: float) -> Dict[str, Any]:
+        return {
+            "shard_id": self.shard_id,
+            "trading_pairs": self.trading_pairs,
+            "connected": self.connected,
+            "reconnections": self.reconnections,
+            "messages": self.messages,
+            "message_rate": self._message_rate,
+            "lag": self.lag(timestamp),
+            "dispatch_times": self.dispatch_times.to_dict(),
+        }
+
+
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    WEBSOCKET_SHARD_MIN_RECONNECT_DELAY = 1.0
+    WEBSOCKET_SHARD_MAX_RECONNECT_DELAY = 60.0
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -23,6 +88,10 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._direct_dispatch_outputs: Dict[str, asyncio.Queue] = {}
+        self._snapshot_requests: Optional[asyncio.Queue] = None
+        self._websocket_shards: int = 1
+        self._websocket_shard_stats: List[WebsocketShardStats] = []
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -38,6 +107,68 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    def set_direct_dispatch_outputs(self, diff_output: asyncio.Queue, trade_output: asyncio.Queue):
+        """
+        Makes the websocket messages be parsed as soon as they are received, adding the parsed messages to the
+        outputs, instead of being stored in the message queues until the listen_for_order_book_diffs and
+        listen_for_trades tasks parse them
+
+        :param diff_output: the output of the diff messages
+        :param trade_output: the output of the trade messages
+        """
+        self._direct_dispatch_outputs = {
+            self._diff_messages_queue_key: diff_output,
+            self._trade_messages_queue_key: trade_output,
+        }
+
+    @property
+    def websocket_shard_stats(self) -> List[WebsocketShardStats]:
+        """
+        The statistics of each websocket connection, when the subscriptions are sharded
+        """
+        return self._websocket_shard_stats
+
+    def set_websocket_shards(self, shards: int):
+        """
+        Makes listen_for_subscriptions spread the trading pairs subscriptions over several websocket connections, each
+        one reconnecting independently. Only supported by the data sources implementing
+        _subscribe_trading_pairs_channels, the others keep using a single connection. Only the order books of a
+        reconnected shard are resynchronized if the on demand snapshots are enabled (see enable_on_demand_snapshots).
+
+        :param shards: the number of websocket connections
+        """
+        if shards > 1 and not self._supports_websocket_shards():
+            self.logger().warning(f"{type(self).__name__} does not support sharded websocket subscriptions. "
+                                  f"Using a single websocket connection.")
+            shards = 1
+        self._websocket_shards = max(1, min(shards, len(self._trading_pairs)))
+
+    @property
+    def on_demand_snapshots_enabled(self) -> bool:
+        return self._snapshot_requests is not None
+
+    def enable_on_demand_snapshots(self):
+        """
+        Makes listen_for_order_book_snapshots fetch only the snapshots requested with request_order_book_snapshot,
+        instead of the snapshots of all the trading pairs every FULL_ORDER_BOOK_RESET_DELTA_SECONDS. The data sources
+        overriding listen_for_order_book_snapshots would never serve the requests, they keep their own schedule.
+        """
+        if not self._supports_on_demand_snapshots():
+            self.logger().warning(f"{type(self).__name__} does not support on demand order book snapshots. "
+                                  f"Keeping its periodic snapshots.")
+            return
+        if self._snapshot_requests is None:
+            self._snapshot_requests = asyncio.Queue()
+
+    def request_order_book_snapshot(self, trading_pair: str):
+        """
+        Requests a new snapshot of one order book, to be added to the output of listen_for_order_book_snapshots.
+        Requires the on demand snapshots to be enabled (see enable_on_demand_snapshots).
+
+        :param trading_pair: the trading pair of the order book
+        """
+        self._snapshot_requests.put_nowait(trading_pair)
+
     @abstractmethod
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -65,7 +196,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
@@ -73,6 +204,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
         """
+        if self._websocket_shards > 1:
+            await self._listen_for_sharded_subscriptions()
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -89,6 +222,65 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 ws and await ws.disconnect()
 
+    async def _listen_for_sharded_subscriptions(self):
+        self._websocket_shard_stats = [
+            WebsocketShardStats(shard_id=shard_id, trading_pairs=self._trading_pairs[shard_id::self._websocket_shards])
+            for shard_id in range(self._websocket_shards)
+        ]
+        tasks = [safe_ensure_future(self._listen_for_shard_subscriptions(shard_stats))
+                 for shard_stats in self._websocket_shard_stats]
+        try:
+            await safe_gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _listen_for_shard_subscriptions(self, shard_stats: WebsocketShardStats):
+        """
+        Keeps the websocket connection of one shard, reconnecting with an exponential backoff that starts again once
+        a connection receives messages. After a reconnection new snapshots of the shard's order books are requested,
+        when on demand snapshots are enabled. Otherwise the shard's order books are only resynchronized by the
+        periodic snapshots.
+        """
+        reconnect_delay: float = self.WEBSOCKET_SHARD_MIN_RECONNECT_DELAY
+        ws: Optional[WSAssistant] = None
+        while True:
+            messages_before: int = shard_stats.messages
+            try:
+                ws = await self._connected_websocket_assistant()
+                await self._subscribe_trading_pairs_channels(ws, shard_stats.trading_pairs)
+                shard_stats.connected = True
+                shard_stats.connections += 1
+                if shard_stats.connections > 1 and self._snapshot_requests is not None:
+                    for trading_pair in shard_stats.trading_pairs:
+                        self.request_order_book_snapshot(trading_pair)
+                await self._process_shard_websocket_messages(websocket_assistant=ws, shard_stats=shard_stats)
+                if shard_stats.messages > messages_before:
+                    reconnect_delay = self.WEBSOCKET_SHARD_MIN_RECONNECT_DELAY
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if shard_stats.messages > messages_before:
+                    reconnect_delay = self.WEBSOCKET_SHARD_MIN_RECONNECT_DELAY
+                self.logger().exception(
+                    f"Unexpected error occurred when listening to order book streams (websocket shard "
+                    f"{shard_stats.shard_id}). Retrying in {reconnect_delay} seconds...",
+                )
+                await self._sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, self.WEBSOCKET_SHARD_MAX_RECONNECT_DELAY)
+            finally:
+                shard_stats.connected = False
+                ws and await ws.disconnect()
+                ws = None
+
+    async def _process_shard_websocket_messages(self,
+                                                websocket_assistant: WSAssistant,
+                                                shard_stats: WebsocketShardStats):
+        async for ws_response in websocket_assistant.iter_messages():
+            start: float = time.perf_counter()
+            await self._dispatch_websocket_message(ws_response.data)
+            shard_stats.record_message(self._time(), time.perf_counter() - start)
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -110,13 +302,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
-        This method runs continuously and request the full order book content from the exchange every hour.
+        This method runs continuously and request the full order book content from the exchange every hour, or only
+        when requested if the on demand snapshots are enabled.
         The method uses the REST API from the exchange. With the information creates a snapshot messages that
         is added to the output queue
 
         :param ev_loop: the event loop the method will run in
         :param output: a queue to add the created snapshot messages
         """
+        if self._snapshot_requests is not None:
+            await self._listen_for_requested_snapshots(output)
         while True:
             try:
                 for trading_pair in self._trading_pairs:
@@ -134,6 +329,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
                 self.logger().error("Unexpected error.", exc_info=True)
                 await self._sleep(5.0)
 
+    async def _listen_for_requested_snapshots(self, output: asyncio.Queue):
+        while True:
+            trading_pair: str = await self._snapshot_requests.get()
+            try:
+                output.put_nowait(await self._order_book_snapshot(trading_pair=trading_pair))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error fetching order book snapshot for {trading_pair}. "
+                                    f"Retrying in 5 seconds.", exc_info=True)
+                await self._sleep(5.0)
+                self._snapshot_requests.put_nowait(trading_pair)
+
     async def listen_for_trades(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the trade events queue. For each event creates a trade message instance and adds it to the output queue
@@ -189,6 +397,24 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_trading_pairs_channels(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of some of the trading pairs through the provided
+        websocket connection. Required to shard the subscriptions over several connections.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
+    def _supports_on_demand_snapshots(self) -> bool:
+        return (type(self).listen_for_order_book_snapshots
+                is OrderBookTrackerDataSource.listen_for_order_book_snapshots)
+
+    def _supports_websocket_shards(self) -> bool:
+        return (type(self)._subscribe_trading_pairs_channels
+                is not OrderBookTrackerDataSource._subscribe_trading_pairs_channels)
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel fot a particular event message. Used to find the correct queue to add the message in
@@ -201,10 +427,26 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            channel: str = self._channel_originating_message(event_message=data)
-            if channel in [self._diff_messages_queue_key, self._trade_messages_queue_key]:
-                self._message_queue[channel].put_nowait(data)
+            await self._dispatch_websocket_message(ws_response.data)
+
+    async def _dispatch_websocket_message(self, data: Dict[str, Any]):
+        channel: str = self._channel_originating_message(event_message=data)
+        if channel in self._direct_dispatch_outputs:
+            await self._parse_message_directly(channel=channel, raw_message=data)
+        elif channel in [self._diff_messages_queue_key, self._trade_messages_queue_key]:
+            self._message_queue[channel].put_nowait(data)
+
+    async def _parse_message_directly(self, channel: str, raw_message: Dict[str, Any]):
+        output: asyncio.Queue = self._direct_dispatch_outputs[channel]
+        try:
+            if channel == self._diff_messages_queue_key:
+                await self._parse_order_book_diff_message(raw_message=raw_message, message_queue=output)
+            else:
+                await self._parse_trade_message(raw_message=raw_message, message_queue=output)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception("Unexpected error when processing public order book updates from exchange")
 
     async def _sleep(self, delay):
         """
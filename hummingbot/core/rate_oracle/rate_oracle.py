@@ -1,16 +1,20 @@
 import asyncio
+import json
 import logging
+import os
+import time
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 import aiohttp
 
 import hummingbot.client.settings  # noqa
+from hummingbot import data_path
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_api_order_book_data_source import AscendExAPIOrderBookDataSource
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionGraph, find_rate, find_rates
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
@@ -34,7 +38,10 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are kept in a
+    ConversionGraph, so the conversion paths and rates are only calculated again when the prices change.
+    The last prices are also saved to a local file, and loaded when the oracle starts so rates are available (even if
+    stale) before the first fetch from the source completes.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -46,6 +53,10 @@ class RateOracle(NetworkBase):
     _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
+    PRICES_CACHE_FILE_NAME: str = "rate_oracle_prices.json"
+    PRICES_CACHE_SAVE_INTERVAL: float = 60.0
+    PRICES_CACHE_MAX_AGE: float = 24 * 60 * 60
+
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
     binance_us_price_url = "https://api.binance.us/api/v3/ticker/bookTicker"
     coingecko_usd_price_url = "https://api.coingecko.com/api/v3/coins/markets?category={}&order=market_cap_desc" \
@@ -79,7 +90,10 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
-        self._prices: Dict[str, Decimal] = {}
+        self._prices: Dict[str, Decimal] = ConversionGraph()
+        self._prices_timestamp: Optional[float] = None
+        self._using_cached_prices: bool = False
+        self._prices_cache_saved_timestamp: float = 0
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
 
@@ -116,6 +130,75 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def prices_age(self) -> Optional[float]:
+        """
+        Time in seconds since the stored prices were fetched from the source, None if there are no prices
+        """
+        if self._prices_timestamp is None or not self._prices:
+            return None
+        return max(0.0, time.time() - self._prices_timestamp)
+
+    @property
+    def using_cached_prices(self) -> bool:
+        """
+        True while the prices are the ones loaded from the local cache file, before the first fetch from the source
+        """
+        return self._using_cached_prices
+
+    @classmethod
+    def prices_cache_path(cls) -> str:
+        return os.path.join(data_path(), cls.PRICES_CACHE_FILE_NAME)
+
+    def load_cached_prices(self) -> bool:
+        """
+        Loads the prices saved to the local cache file by a previous run, if they were fetched from the same source,
+        for the same global token, and are not older than PRICES_CACHE_MAX_AGE.
+
+        :return True if the cached prices were loaded
+        """
+        cache_path: str = self.prices_cache_path()
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            with open(cache_path) as cache_file:
+                cached_prices = json.load(cache_file)
+            if (cached_prices["source"] != self.source.name
+                    or cached_prices["global_token"] != self.global_token
+                    or time.time() - cached_prices["timestamp"] > self.PRICES_CACHE_MAX_AGE):
+                return False
+            self._prices = ConversionGraph({pair: Decimal(price) for pair, price in cached_prices["prices"].items()})
+            self._prices_timestamp = cached_prices["timestamp"]
+            self._using_cached_prices = True
+            if self._prices:
+                self._ready_event.set()
+            return True
+        except Exception:
+            self.logger().error("Unexpected error loading the cached rate oracle prices.", exc_info=True)
+            return False
+
+    def save_cached_prices(self):
+        """
+        Saves the current prices to the local cache file, replacing the previous file only once it's fully written
+        """
+        if self._prices_timestamp is None or not self._prices:
+            return
+        cache_path: str = self.prices_cache_path()
+        temp_path: str = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, "w") as cache_file:
+                json.dump({
+                    "source": self.source.name,
+                    "global_token": self.global_token,
+                    "timestamp": self._prices_timestamp,
+                    "prices": {pair: str(price) for pair, price in self._prices.items()},
+                }, cache_file)
+            os.replace(temp_path, cache_path)
+            self._prices_cache_saved_timestamp = time.time()
+        except Exception:
+            self.logger().error("Unexpected error saving the rate oracle prices.", exc_info=True)
+
     def rate(self, pair: str) -> Decimal:
         """
         Finds a conversion rate for a given symbol, this can be direct or indirect prices as long as it can find a route
@@ -127,6 +210,16 @@ class RateOracle(NetworkBase):
         """
         return find_rate(self._prices, pair)
 
+    def rates(self, pairs: Iterable[str]) -> Dict[str, Decimal]:
+        """
+        Finds the conversion rates for several symbols at once, see rate
+
+        :param pairs: The trading pairs, e.g. [BTC-USDT, ETH-USDT]
+
+        :return A dictionary with the conversion rate of each trading pair (None if there is no rate for the pair)
+        """
+        return find_rates(self._prices, pairs)
+
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
         Finds a conversion rate for a given symbol trying to use the local prices. If local prices are not initialized
@@ -180,9 +273,20 @@ class RateOracle(NetworkBase):
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
+                prices = await self.get_prices()
+                # Keep the cached prices until the source returns some
+                if prices or not self._using_cached_prices:
+                    if isinstance(self._prices, ConversionGraph):
+                        self._prices.set_prices(prices)
+                    else:
+                        self._prices = ConversionGraph(prices)
+                    self._prices_timestamp = time.time()
+                    self._using_cached_prices = False
                 if self._prices:
                     self._ready_event.set()
+                if (not self._using_cached_prices
+                        and time.time() - self._prices_cache_saved_timestamp >= self.PRICES_CACHE_SAVE_INTERVAL):
+                    self.save_cached_prices()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -358,14 +462,19 @@ class RateOracle(NetworkBase):
 
     async def start_network(self):
         await self.stop_network()
+        self.load_cached_prices()
         self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+        if not self._using_cached_prices:
+            self.save_cached_prices()
         # Reset stored prices so that they are not used if they are not being updated
-        self._prices = {}
+        self._prices = ConversionGraph()
+        self._prices_timestamp = None
+        self._using_cached_prices = False
 
     async def check_network(self) -> NetworkStatus:
         try:
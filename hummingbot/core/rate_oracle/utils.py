@@ -1,8 +1,170 @@
-from typing import Dict
+from collections import OrderedDict
 from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
+# A conversion path is a sequence of (trading pair, inverted) steps, the rate is the product of the pairs prices
+# (or of their inverses for the inverted steps). An empty path is the conversion of a token to itself.
+ConversionPath = Tuple[Tuple[str, bool], ...]
+
+
+class ConversionGraph(dict):
+    """
+    Dictionary of prices by trading pair, indexed to find conversion rates between any two tokens.
+
+    The pairs are indexed by their base token, the conversion path found for each requested pair is kept for as long
+    as the set of trading pairs doesn't change, and the last resolved rates are kept in a LRU cache that is cleared
+    whenever any price changes.
+    """
+    RATE_CACHE_SIZE: int = 4096
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pairs_by_base: Optional[Dict[str, List[str]]] = None
+        self._paths: Dict[str, Optional[ConversionPath]] = {}
+        self._rates: "OrderedDict[str, Optional[Decimal]]" = OrderedDict()
+
+    def __setitem__(self, pair: str, price: Decimal):
+        if pair in self:
+            self._rates.clear()
+        else:
+            self._invalidate_paths()
+        super().__setitem__(pair, price)
+
+    def __delitem__(self, pair: str):
+        super().__delitem__(pair)
+        self._invalidate_paths()
+
+    def clear(self):
+        super().clear()
+        self._invalidate_paths()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._invalidate_paths()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._invalidate_paths()
+        return result
+
+    def setdefault(self, pair: str, default: Optional[Decimal] = None):
+        if pair not in self:
+            self._invalidate_paths()
+        return super().setdefault(pair, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate_paths()
+
+    def set_prices(self, prices: Dict[str, Decimal]):
+        """
+        Replaces all the prices. The conversion paths are kept if the trading pairs are the same, in the same order.
+
+        :param prices: The new dictionary of trading pairs and their prices
+        """
+        if list(prices) == list(self):
+            super().update(prices)
+            self._rates.clear()
+        else:
+            super().clear()
+            super().update(prices)
+            self._invalidate_paths()
+
+    def _invalidate_paths(self):
+        self._pairs_by_base = None
+        self._paths.clear()
+        self._rates.clear()
+
+    @property
+    def pairs_by_base(self) -> Dict[str, List[str]]:
+        """
+        The trading pairs of the prices grouped by their base token
+        """
+        if self._pairs_by_base is None:
+            pairs_by_base: Dict[str, List[str]] = {}
+            for pair in self:
+                pairs_by_base.setdefault(pair.split("-")[0], []).append(pair)
+            self._pairs_by_base = pairs_by_base
+        return self._pairs_by_base
+
+    def find_path(self, pair: str) -> Optional[ConversionPath]:
+        """
+        Finds the pairs to use to convert the base token of a trading pair into its quote token. The pair itself is
+        used if available, else its reverse pair, else a pair of the base token with a common token that has a pair
+        (or a reverse pair) with the quote token.
+
+        :param pair: The trading pair
+        :return: The conversion path, None if the tokens can't be converted
+        """
+        if pair in self._paths:
+            return self._paths[pair]
+
+        path: Optional[ConversionPath] = None
+        if pair in self:
+            path = ((pair, False),)
+        else:
+            base, quote = pair.split("-")
+            base = unwrap_token_symbol(base)
+            quote = unwrap_token_symbol(quote)
+            reverse_pair = f"{quote}-{base}"
+            if base == quote:
+                path = ()
+            elif reverse_pair in self:
+                path = ((reverse_pair, True),)
+            else:
+                for base_pair in self.pairs_by_base.get(base, []):
+                    link_quote = base_pair.split("-")[1]
+                    link_pair = f"{link_quote}-{quote}"
+                    if link_pair in self:
+                        path = ((base_pair, False), (link_pair, False))
+                        break
+                    common_denom_pair = f"{quote}-{link_quote}"
+                    if common_denom_pair in self:
+                        path = ((base_pair, False), (common_denom_pair, True))
+                        break
+
+        self._paths[pair] = path
+        return path
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the exchange rate for a given trading pair
+
+        :param pair: The trading pair
+        :return: The rate, None if there is no price to calculate it
+        """
+        if pair in self._rates:
+            self._rates.move_to_end(pair)
+            return self._rates[pair]
+
+        path: Optional[ConversionPath] = self.find_path(pair)
+        result: Optional[Decimal] = None
+        if path is not None:
+            result = Decimal("1") if len(path) == 0 else None
+            for step_pair, inverted in path:
+                price: Decimal = self[step_pair]
+                if result is None:
+                    result = Decimal("1") / price if inverted else price
+                else:
+                    result = result / price if inverted else result * price
+
+        self._rates[pair] = result
+        if len(self._rates) > self.RATE_CACHE_SIZE:
+            self._rates.popitem(last=False)
+        return result
+
+    def rates(self, pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Finds the exchange rates for several trading pairs
+
+        :param pairs: The trading pairs
+        :return: A dictionary with the rate of each trading pair, None for the pairs without rate
+        """
+        return {pair: self.rate(pair) for pair in pairs}
+
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
@@ -15,22 +177,17 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
-    if pair in prices:
-        return prices[pair]
-    base, quote = pair.split("-")
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = f"{quote}-{base}"
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = base_pair.split("-")[1]
-        link_pair = f"{link_quote}-{quote}"
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = f"{quote}-{link_quote}"
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    if not isinstance(prices, ConversionGraph):
+        prices = ConversionGraph(prices)
+    return prices.rate(pair)
+
+
+def find_rates(prices: Dict[str, Decimal], pairs: Iterable[str]) -> Dict[str, Decimal]:
+    '''
+    Finds exchange rates for several trading pairs from a dictionary of prices, see find_rate
+    :param prices: The dictionary of trading pairs and their prices
+    :param pairs: The trading pairs
+    '''
+    if not isinstance(prices, ConversionGraph):
+        prices = ConversionGraph(prices)
+    return prices.rates(pairs)
@@ -0,0 +1,72 @@
+import bisect
+import math
+from typing import Any, Dict, List
+
+# Upper bounds in seconds of the duration histogram buckets, the last bucket has no upper bound
+DURATION_BUCKETS: List[float] = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                                 1.0, 2.5, 5.0, math.inf]
+
+
+class DurationHistogram:
+    """
+    Counts durations in DURATION_BUCKETS, keeping their total and maximum
+    """
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * len(DURATION_BUCKETS)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def bucket_counts(self) -> List[int]:
+        return self._bucket_counts
+
+    def record(self, duration: float):
+        self._bucket_counts[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+        self._count += 1
+        self._total += duration
+        if duration > self._max:
+            self._max = duration
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Estimates a percentile as the upper bound of the bucket it falls in (the maximum for the last bucket)
+
+        :param percentile: the percentile, between 0 and 100
+        :return: the estimated duration in seconds
+        """
+        if self._count == 0:
+            return 0.0
+        rank: float = self._count * percentile / 100
+        cumulative_count: int = 0
+        for upper_bound, bucket_count in zip(DURATION_BUCKETS, self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and bucket_count > 0:
+                return min(upper_bound, self._max)
+        return self._max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "total": self._total,
+            "max": self._max,
+            "buckets": [{"le": str(upper_bound) if math.isinf(upper_bound) else upper_bound, "count": bucket_count}
+                        for upper_bound, bucket_count in zip(DURATION_BUCKETS, self._bucket_counts)],
+        }
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.json_codec import get_json_codec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -111,7 +113,9 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        # Decodes the body bytes directly, without building the intermediate str of aiohttp's json()
+        body = await self._aiohttp_response.read()
+        json_ = get_json_codec().loads(body) if body.strip() else None
         return json_
 
     async def text(self) -> str:
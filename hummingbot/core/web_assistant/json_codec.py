@@ -0,0 +1,107 @@
+"""
+JSON decoding used by the web assistants for the REST responses and the websocket messages. The request bodies are
+still encoded as before (json.dumps), so what is sent to the exchanges does not depend on the installed codecs.
+The fastest available codec is used by default: orjson when it is installed, then ujson (a hummingbot requirement),
+and the json module as the last fallback.
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a JSON document, raising a ValueError if it is not valid JSON
+
+        :param data: the document, as text or UTF-8 bytes (decoded without an intermediate str when the codec can)
+        """
+        ...
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class ORJSONCodec(JSONCodec):
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class UJSONCodec(JSONCodec):
+    name = "ujson"
+
+    def __init__(self):
+        # Older ujson versions parse floats with a fast but imprecise algorithm unless precise_float is set, the newer
+        # ones are always precise and no longer accept the argument
+        try:
+            ujson.loads("0.1", precise_float=True)
+            self._loads_kwargs = {"precise_float": True}
+        except TypeError:
+            self._loads_kwargs = {}
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data, **self._loads_kwargs)
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+
+def available_json_codecs() -> List[JSONCodec]:
+    """
+    Returns the codecs that can be used in this environment, the fastest first
+    """
+    codecs: List[JSONCodec] = []
+    if orjson is not None:
+        codecs.append(ORJSONCodec())
+    if ujson is not None:
+        codecs.append(UJSONCodec())
+    codecs.append(StdlibJSONCodec())
+    return codecs
+
+
+_json_codec: Optional[JSONCodec] = None
+
+
+def get_json_codec() -> JSONCodec:
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = available_json_codecs()[0]
+    return _json_codec
+
+
+def set_json_codec(codec: Optional[JSONCodec]):
+    """
+    Replaces the codec used by the web assistants
+
+    :param codec: the codec to use, None to go back to the fastest available one
+    """
+    global _json_codec
+    _json_codec = codec
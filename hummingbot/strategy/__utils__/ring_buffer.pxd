@@ -8,10 +8,20 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _anchor
+        double _shifted_sum
+        double _shifted_sum_of_squares
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_reanchor(self)
     cdef double c_get_last_value(self)
+    cdef double c_get_first_value(self)
+    cdef int64_t c_size(self)
+    cdef double c_sum_value(self)
+    cdef double c_sum_of_squares(self)
+    cdef double c_running_mean(self)
+    cdef double c_running_variance(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
@@ -6,6 +6,13 @@ cimport numpy as np
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of float values, where each new value replaces the oldest one once the buffer is full.
+
+    The sum and sum of squares of the values are updated with each value added, so the mean and variance are available
+    in constant time. The sums are kept relative to an anchor value (close to the mean) to avoid losing precision,
+    and are calculated again from the values every time the buffer wraps around, so rounding errors don't accumulate.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,19 +25,46 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._anchor = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double shifted_value
+
+        if self.c_is_empty():
+            self._anchor = val
+        if self._is_full:
+            shifted_value = self._buffer[self._delimiter] - self._anchor
+            self._shifted_sum -= shifted_value
+            self._shifted_sum_of_squares -= shifted_value * shifted_value
         self._buffer[self._delimiter] = val
+        shifted_value = self._buffer[self._delimiter] - self._anchor
+        self._shifted_sum += shifted_value
+        self._shifted_sum_of_squares += shifted_value * shifted_value
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self.c_reanchor()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_reanchor(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] shifted_values = self.c_get_as_numpy_array()
+
+        if shifted_values.size > 0:
+            self._anchor = np.mean(shifted_values)
+        shifted_values = shifted_values - self._anchor
+        self._shifted_sum = np.sum(shifted_values)
+        self._shifted_sum_of_squares = np.dot(shifted_values, shifted_values)
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
@@ -39,25 +73,55 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter] if self._is_full else self._buffer[0]
+
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum_value(self):
+        return self._anchor * self.c_size() + self._shifted_sum
+
+    cdef double c_sum_of_squares(self):
+        return (self._shifted_sum_of_squares
+                + 2 * self._anchor * self._shifted_sum
+                + self._anchor * self._anchor * self.c_size())
+
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._anchor + self._shifted_sum / self.c_size()
+
+    cdef double c_running_variance(self):
+        cdef:
+            double shifted_mean
+
+        if self.c_is_empty():
+            return np.nan
+        shifted_mean = self._shifted_sum / self.c_size()
+        return max(self._shifted_sum_of_squares / self.c_size() - shifted_mean * shifted_mean, 0)
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_running_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = np.sqrt(self.c_running_variance())
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
@@ -75,6 +139,9 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._anchor = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,10 +152,35 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     @property
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self):
+        return self.c_size()
+
+    @property
+    def sum_value(self):
+        return self.c_sum_value()
+
+    @property
+    def sum_of_squares(self):
+        return self.c_sum_of_squares()
+
+    @property
+    def running_mean(self):
+        """Mean of the values in the buffer, even if it is not full"""
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """Variance of the values in the buffer, even if it is not full"""
+        return self.c_running_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
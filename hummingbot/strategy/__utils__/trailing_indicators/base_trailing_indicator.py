@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 import numpy as np
 import logging
 from ..ring_buffer import RingBuffer
@@ -21,14 +22,27 @@ class BaseTrailingIndicator(ABC):
         self._processing_buffer = RingBuffer(processing_length)
 
     def add_sample(self, value: float):
+        removed_value = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else None
         self._sampling_buffer.add_value(value)
-        indicator_value = self._indicator_calculation()
+        indicator_value = self._indicator_update(removed_value)
         self._processing_buffer.add_value(indicator_value)
 
     @abstractmethod
     def _indicator_calculation(self) -> float:
+        """
+        Calculation of the indicator value from the whole sampling buffer.
+        """
         raise NotImplementedError
 
+    def _indicator_update(self, removed_value: Optional[float]) -> float:
+        """
+        Calculation of the indicator value after a sample is added to the sampling buffer.
+        Indicators that keep running values override it to update them in constant time, the result should match
+        _indicator_calculation. Default behavior is calculating the value from the whole sampling buffer.
+        :param removed_value: the sample removed from the sampling buffer to add the new one, None if it wasn't full
+        """
+        return self._indicator_calculation()
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
@@ -1,4 +1,7 @@
-from base_trailing_indicator import BaseTrailingIndicator
+from typing import Optional
+
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 import pandas as pd
 
 
@@ -7,11 +10,35 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._decay = 1 - 2 / (sampling_length + 1)
+        # Weight of a sample when it leaves the sampling buffer
+        self._removed_weight = self._decay ** sampling_length
+        # Running weighted sum of the samples and sum of the weights, calculated again from the sampling buffer
+        # every sampling_length samples so rounding errors don't accumulate
+        self._weighted_sum = 0
+        self._weights_sum = 0
+        self._samples_since_reanchor = 0
 
     def _indicator_calculation(self) -> float:
         ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
             .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return ema.iloc[-1]
+
+    def _indicator_update(self, removed_value: Optional[float]) -> float:
+        self._samples_since_reanchor += 1
+        if self._samples_since_reanchor >= self._sampling_length:
+            samples = self._sampling_buffer.get_as_numpy_array()
+            weights = self._decay ** np.arange(samples.size - 1, -1, -1)
+            self._weighted_sum = np.dot(weights, samples)
+            self._weights_sum = np.sum(weights)
+            self._samples_since_reanchor = 0
+        else:
+            self._weighted_sum = self._decay * self._weighted_sum + self._sampling_buffer.get_last_value()
+            self._weights_sum = self._decay * self._weights_sum + 1
+            if removed_value is not None:
+                self._weighted_sum -= self._removed_weight * removed_value
+                self._weights_sum -= self._removed_weight
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
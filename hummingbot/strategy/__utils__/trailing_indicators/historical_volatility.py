@@ -1,10 +1,16 @@
+from typing import Optional
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between consecutive samples of the sampling buffer
+        self._log_returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+        self._last_sample = np.nan
 
     def _indicator_calculation(self) -> float:
         prices = self._sampling_buffer.get_as_numpy_array()
@@ -12,6 +18,15 @@ class HistoricalVolatilityIndicator(BaseTrailingIndicator):
             log_returns = np.diff(np.log(prices))
             return np.var(log_returns)
 
+    def _indicator_update(self, removed_value: Optional[float]) -> float:
+        sample = self._sampling_buffer.get_last_value()
+        if self._sampling_length > 1 and not np.isnan(self._last_sample):
+            self._log_returns_buffer.add_value(np.log(sample) - np.log(self._last_sample))
+        self._last_sample = sample
+        if self._sampling_length < 2 or self._log_returns_buffer.size == 0:
+            return self._indicator_calculation()
+        return self._log_returns_buffer.running_variance
+
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
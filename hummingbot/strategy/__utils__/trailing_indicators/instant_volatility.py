@@ -1,10 +1,16 @@
+from typing import Optional
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Differences between consecutive samples of the sampling buffer
+        self._diffs_buffer = RingBuffer(max(sampling_length - 1, 1))
+        self._last_sample = np.nan
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
@@ -14,6 +20,15 @@ class InstantVolatilityIndicator(BaseTrailingIndicator):
         vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
         return vol
 
+    def _indicator_update(self, removed_value: Optional[float]) -> float:
+        sample = self._sampling_buffer.get_last_value()
+        if self._sampling_length > 1 and not np.isnan(self._last_sample):
+            self._diffs_buffer.add_value(sample - self._last_sample)
+        self._last_sample = sample
+        if self._sampling_length < 2 or self._diffs_buffer.size == 0:
+            return self._indicator_calculation()
+        return np.sqrt(self._diffs_buffer.sum_of_squares / self._sampling_buffer.size)
+
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
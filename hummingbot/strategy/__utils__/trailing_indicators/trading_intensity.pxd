@@ -13,15 +13,28 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
-        list _current_trade_sample
+        list _sample_timestamps
+        dict _level_amounts
+        dict _level_counts
+        double _total_amount
+        double _amount_change
+        double _refit_threshold
+        double[:, ::1] _trades
+        int _trades_count
+        double[:, ::1] _quotes
+        int _quotes_start
+        int _quotes_end
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
         int _sampling_length
         int _samples_length
 
+    cdef c_add_quote(self, double timestamp, double price)
     cdef c_calculate(self, timestamp)
+    cdef c_process_trades(self)
+    cdef c_add_sample(self, double timestamp, object price_levels, object amounts)
+    cdef c_remove_sample(self, double timestamp)
     cdef c_register_trade(self, object trade)
     cdef c_estimate_intensity(self)
 
@@ -1,6 +1,7 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import bisect
 import warnings
 from decimal import Decimal
 from typing import Tuple
@@ -26,19 +27,42 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity parameters (alpha and kappa) of the Avellaneda-Stoikov model by fitting
+    lambda(delta) = alpha * exp(-kappa * delta) to the volume traded at each distance delta from the mid price.
+
+    The mid price quotes and the trades registered since the last tick are kept in array buffers. Each trade is
+    matched to the last quote before it with a sorted search, and the traded amount per price level is aggregated
+    incrementally as samples enter and leave the sampling buffer. The curve is only fitted again when the aggregated
+    amount has changed by more than refit_threshold (relative to the total amount) since the last fit.
+    """
+    INITIAL_BUFFER_SIZE = 64
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refit_threshold: float = 0):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
-        self._current_trade_sample = []
+        self._sample_timestamps = []
+        self._level_amounts = {}
+        self._level_counts = {}
+        self._total_amount = 0
+        self._amount_change = 0
+        self._refit_threshold = refit_threshold
+        self._trades = np.zeros((self.INITIAL_BUFFER_SIZE, 3), dtype=np.float64)
+        self._trades_count = 0
+        self._quotes = np.zeros((self.INITIAL_BUFFER_SIZE, 2), dtype=np.float64)
+        self._quotes_start = 0
+        self._quotes_end = 0
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
         self._order_book.c_add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +72,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -63,93 +87,160 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": self._quotes[i, 0], "price": self._quotes[i, 1]}
+                for i in range(self._quotes_end - 1, self._quotes_start - 1, -1)]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # The quotes are received in descending timestamp order, and stored in ascending order
+        self._quotes_start = 0
+        self._quotes_end = 0
+        for quote in reversed(value):
+            self.c_add_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
+    cdef c_add_quote(self, double timestamp, double price):
+        cdef:
+            int quotes_count = self._quotes_end - self._quotes_start
+            double[:, ::1] quotes
+
+        if self._quotes_end == self._quotes.shape[0]:
+            # Move the quotes still in use to the start of the buffer, growing it if more than half is in use
+            quotes = self._quotes
+            if quotes_count * 2 > quotes.shape[0]:
+                quotes = np.zeros((quotes.shape[0] * 2, 2), dtype=np.float64)
+            quotes[:quotes_count] = self._quotes[self._quotes_start:self._quotes_end]
+            self._quotes = quotes
+            self._quotes_start = 0
+            self._quotes_end = quotes_count
+        self._quotes[self._quotes_end, 0] = timestamp
+        self._quotes[self._quotes_end, 1] = price
+        self._quotes_end += 1
+
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self.c_add_quote(timestamp, float(price))
 
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+        if self._trades_count > 0:
+            self.c_process_trades()
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
+        # Keep only the last sampling_length samples
+        while len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_sample(self._sample_timestamps.pop(0))
 
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        if self.is_sampling_buffer_full and self._amount_change > self._refit_threshold * self._total_amount:
+            self.c_estimate_intensity()
+
+    cdef c_process_trades(self):
+        cdef:
+            object quotes = np.asarray(self._quotes[self._quotes_start:self._quotes_end])
+            object trades = np.asarray(self._trades[:self._trades_count])
+            object quote_indices
+            object matched
+
+        # Each trade is matched with the last quote that happened before it, trades without quote are discarded
+        quote_indices = np.searchsorted(quotes[:, 0], trades[:, 0], side="left") - 1
+        matched = quote_indices >= 0
+        # There are no trades left to process
+        self._trades_count = 0
+        if not matched.any():
+            return
+
+        quote_indices = quote_indices[matched]
+        trades = trades[matched]
+        sample_timestamps = quotes[quote_indices, 0] + 1
+        price_levels = np.abs(trades[:, 1] - quotes[quote_indices, 1])
+        amounts = trades[:, 2]
+        for sample_timestamp in np.unique(sample_timestamps):
+            in_sample = sample_timestamps == sample_timestamp
+            self.c_add_sample(float(sample_timestamp), price_levels[in_sample], amounts[in_sample])
 
-        # THere are no trades left to process
-        self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-        
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
-            self.c_estimate_intensity()
+        self._quotes_start += int(quote_indices.max())
+
+    cdef c_add_sample(self, double timestamp, object price_levels, object amounts):
+        cdef:
+            object levels
+            object inverse
+            object level_amounts
+            object level_counts
+            double level_amount
+            int level_count
+
+        levels, inverse = np.unique(price_levels, return_inverse=True)
+        level_amounts = np.bincount(inverse, weights=amounts)
+        level_counts = np.bincount(inverse)
+        if timestamp not in self._trade_samples:
+            self._trade_samples[timestamp] = []
+            bisect.insort(self._sample_timestamps, timestamp)
+        self._trade_samples[timestamp].append((levels, level_amounts, level_counts))
+
+        for level, level_amount, level_count in zip(levels.tolist(), level_amounts.tolist(), level_counts.tolist()):
+            self._level_amounts[level] = self._level_amounts.get(level, 0) + level_amount
+            self._level_counts[level] = self._level_counts.get(level, 0) + level_count
+            self._total_amount += level_amount
+            self._amount_change += level_amount
+
+    cdef c_remove_sample(self, double timestamp):
+        cdef:
+            double level_amount
+            int level_count
+
+        for levels, level_amounts, level_counts in self._trade_samples.pop(timestamp):
+            for level, level_amount, level_count in zip(levels.tolist(),
+                                                        level_amounts.tolist(),
+                                                        level_counts.tolist()):
+                self._level_counts[level] -= level_count
+                if self._level_counts[level] == 0:
+                    del self._level_counts[level]
+                    del self._level_amounts[level]
+                else:
+                    self._level_amounts[level] -= level_amount
+                self._total_amount -= level_amount
+                self._amount_change += level_amount
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
         self.c_register_trade(trade)
 
     cdef c_register_trade(self, object trade):
-        self._current_trade_sample.append(trade)
+        cdef:
+            double[:, ::1] trades
+
+        if self._trades_count == self._trades.shape[0]:
+            trades = np.zeros((self._trades.shape[0] * 2, 3), dtype=np.float64)
+            trades[:self._trades_count] = self._trades
+            self._trades = trades
+        self._trades[self._trades_count, 0] = trade.timestamp
+        self._trades[self._trades_count, 1] = trade.price
+        self._trades[self._trades_count, 2] = trade.amount
+        self._trades_count += 1
 
     def _estimate_intensity(self):
         self.c_estimate_intensity()
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+            int levels_count = len(self._level_amounts)
+            object price_levels
+            object lambdas
+            object order
+
+        # The trading intensity of each price level is the total amount traded at that level, by descending level
+        price_levels = np.fromiter(self._level_amounts.keys(), dtype=np.float64, count=levels_count)
+        lambdas = np.fromiter(self._level_amounts.values(), dtype=np.float64, count=levels_count)
+        order = np.argsort(-price_levels, kind="stable")
+        price_levels = price_levels[order]
+        lambdas = lambdas[order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
 
+        self._amount_change = 0
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
@@ -0,0 +1,69 @@
+"""
+Measures the time taken by each available JSON codec (see hummingbot.core.web_assistant.json_codec) to decode
+websocket payloads, as text (websocket text frames) and as bytes (REST response bodies).
+
+The payloads are read from a file with one recorded message per line, or generated in the format of the Binance and
+KuCoin order book diff streams when no file is given.
+
+Run with: python -m test.benchmark.json_codec_benchmark [--payloads recorded_messages.jsonl]
+"""
+import argparse
+import json
+import random
+import time
+from typing import List, Union
+
+import pandas as pd
+
+from hummingbot.core.web_assistant.json_codec import JSONCodec, available_json_codecs
+
+
+def generated_payloads(count: int, levels: int) -> List[str]:
+    rng = random.Random(42)
+    payloads = []
+    for update_id in range(1, count + 1):
+        bids = [[f"{rng.uniform(90, 100):.4f}", f"{rng.uniform(0, 10):.8f}"] for _ in range(levels)]
+        asks = [[f"{rng.uniform(100, 110):.4f}", f"{rng.uniform(0, 10):.8f}"] for _ in range(levels)]
+        if update_id % 2 == 0:
+            payload = {"stream": "coinalphahbot@depth@100ms", "data": {
+                "e": "depthUpdate", "E": 1640000000000 + update_id, "s": "COINALPHAHBOT",
+                "U": update_id * 10, "u": update_id * 10 + 9, "b": bids, "a": asks}}
+        else:
+            payload = {"type": "message", "topic": "/market/level2:COINALPHA-HBOT", "subject": "trade.l2update",
+                       "data": {"sequenceStart": update_id * 10, "sequenceEnd": update_id * 10 + 9,
+                                "symbol": "COINALPHA-HBOT", "changes": {"bids": bids, "asks": asks}}}
+        payloads.append(json.dumps(payload))
+    return payloads
+
+
+def recorded_payloads(path: str) -> List[str]:
+    with open(path) as payloads_file:
+        return [line.strip() for line in payloads_file if line.strip()]
+
+
+def measure(codec: JSONCodec, payloads: List[Union[str, bytes]]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        codec.loads(payload)
+    return (time.perf_counter() - start) / len(payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", help="File with one recorded JSON message per line")
+    parser.add_argument("--messages", type=int, default=20000, help="Number of generated messages")
+    parser.add_argument("--levels", type=int, default=20, help="Number of bid and ask levels in generated messages")
+    args = parser.parse_args()
+
+    payloads = recorded_payloads(args.payloads) if args.payloads else generated_payloads(args.messages, args.levels)
+    encoded_payloads = [payload.encode() for payload in payloads]
+    rows = []
+    for codec in available_json_codecs():
+        rows.append([codec.name, len(payloads),
+                     measure(codec, payloads) * 1e6,
+                     measure(codec, encoded_payloads) * 1e6])
+    print(pd.DataFrame(rows, columns=["Codec", "Messages", "Text (us)", "Bytes (us)"]).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
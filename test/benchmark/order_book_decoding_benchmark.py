@@ -0,0 +1,59 @@
+"""
+Measures the time taken to apply order book diff messages holding the raw exchange levels (lists of string prices and
+amounts, as sent by Binance, KuCoin or Gate.io), through the OrderBookRow instances of the message or from the raw
+levels.
+
+Run with: python -m test.benchmark.order_book_decoding_benchmark
+"""
+import argparse
+import random
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+def diff_messages(count: int, levels: int) -> List[OrderBookMessage]:
+    rng = random.Random(42)
+    messages = []
+    for update_id in range(1, count + 1):
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": [[f"{rng.uniform(90, 100):.4f}", f"{rng.choice([0, rng.uniform(0, 10)]):.8f}"]
+                     for _ in range(levels)],
+            "asks": [[f"{rng.uniform(100, 110):.4f}", f"{rng.choice([0, rng.uniform(0, 10)]):.8f}"]
+                     for _ in range(levels)],
+        }, time.time()))
+    return messages
+
+
+def measure(apply: Callable[[OrderBook, OrderBookMessage], None], messages: List[OrderBookMessage]) -> float:
+    order_book = OrderBook()
+    order_book.apply_snapshot([], [], 0)
+    start = time.perf_counter()
+    for message in messages:
+        apply(order_book, message)
+    return (time.perf_counter() - start) / len(messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000, help="Number of diff messages")
+    parser.add_argument("--levels", type=int, default=20, help="Number of bid and ask levels in each diff")
+    args = parser.parse_args()
+
+    messages = diff_messages(args.messages, args.levels)
+    rows = []
+    for name, apply in (
+            ("OrderBookRow", lambda book, message: book.apply_diffs(message.bids, message.asks, message.update_id)),
+            ("Raw levels", lambda book, message: book.apply_diff_message(message))):
+        rows.append([name, args.messages, measure(apply, messages) * 1e6])
+    print(pd.DataFrame(rows, columns=["Decoding", "Messages", "Mean (us)"]).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
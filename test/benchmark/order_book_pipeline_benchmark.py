@@ -0,0 +1,141 @@
+"""
+Measures the latency of the order book diff messages from their reception in the websocket to their application to
+the order book, with and without the order book tracker direct dispatch.
+
+The websocket delivers the messages in bursts, as they are read when the connection buffer holds several frames.
+
+Run with: python -m test.benchmark.order_book_pipeline_benchmark
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.web_assistant.connections.data_types import WSResponse
+
+
+class LatencyOrderBook(OrderBook):
+    """
+    Order book recording the time elapsed since the reception of each diff it applies
+    """
+
+    def __init__(self, reception_times: Dict[Tuple[str, int], float], latencies: List[float], trading_pair: str):
+        super().__init__()
+        self.reception_times = reception_times
+        self.latencies = latencies
+        self.trading_pair = trading_pair
+
+    def apply_diff_message(self, diff: OrderBookMessage):
+        super().apply_diff_message(diff)
+        self.latencies.append(time.perf_counter() - self.reception_times.pop((self.trading_pair, diff.update_id)))
+
+
+class FakeWebsocketAssistant:
+    def __init__(self, trading_pairs: List[str], bursts: int, burst_size: int, reception_times: Dict):
+        self._trading_pairs = trading_pairs
+        self._bursts = bursts
+        self._burst_size = burst_size
+        self._reception_times = reception_times
+
+    async def iter_messages(self):
+        update_id = 0
+        for _ in range(self._bursts):
+            for index in range(self._burst_size):
+                trading_pair = self._trading_pairs[index % len(self._trading_pairs)]
+                update_id += 1
+                self._reception_times[(trading_pair, update_id)] = time.perf_counter()
+                yield WSResponse(data={
+                    "channel": "order_book_diff",
+                    "trading_pair": trading_pair,
+                    "update_id": update_id,
+                    "bids": [[100.0 - (update_id % 10), float(update_id % 7)]],
+                    "asks": [[101.0 + (update_id % 10), float(update_id % 5)]],
+                })
+            await asyncio.sleep(0.001)
+
+    async def disconnect(self):
+        pass
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], bursts: int, burst_size: int):
+        super().__init__(trading_pairs)
+        self.reception_times: Dict[Tuple[str, int], float] = {}
+        self.latencies: List[float] = []
+        self.streaming = asyncio.Event()
+        self._websocket_assistant: Optional[FakeWebsocketAssistant] = FakeWebsocketAssistant(
+            trading_pairs, bursts, burst_size, self.reception_times)
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None):
+        return {trading_pair: 100.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = LatencyOrderBook(self.reception_times, self.latencies, trading_pair)
+        order_book.apply_snapshot([], [], 0)
+        return order_book
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def _connected_websocket_assistant(self) -> FakeWebsocketAssistant:
+        await self.streaming.wait()
+        websocket_assistant, self._websocket_assistant = self._websocket_assistant, None
+        if websocket_assistant is None:
+            await asyncio.Event().wait()
+        return websocket_assistant
+
+    async def _subscribe_channels(self, ws: FakeWebsocketAssistant):
+        pass
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return event_message["channel"]
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, raw_message, time.time()))
+
+
+async def measure_latencies(direct_dispatch: bool, trading_pairs: List[str], bursts: int, burst_size: int) -> np.ndarray:
+    data_source = BenchmarkDataSource(trading_pairs, bursts, burst_size)
+    tracker = OrderBookTracker(data_source=data_source,
+                               trading_pairs=trading_pairs,
+                               concurrent_bootstrap=True,
+                               direct_dispatch=direct_dispatch)
+    tracker.start()
+    try:
+        await tracker._order_books_initialized.wait()
+        data_source.streaming.set()
+        while len(data_source.latencies) < bursts * burst_size:
+            await asyncio.sleep(0.01)
+    finally:
+        tracker.stop()
+    return np.array(data_source.latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=10, help="Number of trading pairs")
+    parser.add_argument("--bursts", type=int, default=200, help="Number of message bursts")
+    parser.add_argument("--burst-size", type=int, default=50, help="Number of messages in each burst")
+    args = parser.parse_args()
+
+    trading_pairs = [f"COIN{index}-HBOT" for index in range(args.pairs)]
+    ev_loop = asyncio.get_event_loop()
+    rows = []
+    for name, direct_dispatch in (("Queues and routers", False), ("Direct dispatch", True)):
+        latencies = ev_loop.run_until_complete(
+            measure_latencies(direct_dispatch, trading_pairs, args.bursts, args.burst_size)) * 1e6
+        rows.append([name, len(latencies), np.mean(latencies), np.percentile(latencies, 50),
+                     np.percentile(latencies, 99), np.max(latencies)])
+    print(pd.DataFrame(rows, columns=["Pipeline", "Messages", "Mean (us)", "p50 (us)", "p99 (us)", "Max (us)"])
+          .round(1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from copy import deepcopy
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class ProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication()
+        self.global_config_backup = deepcopy(global_config_map)
+        self.captures = []
+        notify_patcher = patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+        notify_mock = notify_patcher.start()
+        notify_mock.side_effect = lambda s: self.captures.append(s)
+        self.addCleanup(notify_patcher.stop)
+
+    def tearDown(self) -> None:
+        self.reset_global_config()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def reset_global_config(self):
+        for key, value in self.global_config_backup.items():
+            global_config_map[key] = value
+
+    def start_clock(self) -> Clock:
+        self.app.clock = Clock(ClockMode.BACKTEST, start_time=0, end_time=10)
+        self.app.clock.add_iterator(TimeIterator())
+        return self.app.clock
+
+    def test_profile_without_running_strategy(self):
+        self.app.profile("start")
+
+        self.assertEqual(["\n This command can only be used while a strategy is running"], self.captures)
+
+    def test_profile_not_started(self):
+        clock = self.start_clock()
+
+        self.app.profile()
+
+        self.assertIsNone(clock.profiler)
+        self.assertEqual(["\n Clock profiling is not running. Use `profile start` to start it."], self.captures)
+
+    def test_start_show_and_stop_profiling(self):
+        global_config_map["tables_format"].value = "psql"
+        clock = self.start_clock()
+
+        self.app.profile("start")
+        clock.backtest()
+        self.app.profile()
+        self.app.profile("stop")
+
+        self.assertIsNone(clock.profiler)
+        self.assertEqual("\n Clock profiling started.", self.captures[0])
+        self.assertIn("  Tick size: 1.0 s, overruns: 0, missed ticks: 0", self.captures[1])
+        self.assertIn("| TimeIterator   |      10 |", self.captures[1])
+        self.assertIn("Event loop lag", self.captures[1])
+        self.assertEqual("\n Clock profiling stopped.", self.captures[2])
+
+    def test_export_profile(self):
+        clock = self.start_clock()
+        self.app.profile("start")
+        clock.backtest()
+
+        with tempfile.TemporaryDirectory() as directory:
+            global_config_map["log_file_path"].value = directory
+            self.app.profile("export")
+            file_names = os.listdir(directory)
+            self.assertEqual(1, len(file_names))
+            with open(os.path.join(directory, file_names[0])) as file:
+                exported = json.load(file)
+
+        self.assertTrue(file_names[0].startswith("clock_profile_"))
+        self.assertEqual(10, exported["iterator_durations"]["TimeIterator"]["count"])
+        self.assertEqual(f"Successfully exported the clock profile to {os.path.join(directory, file_names[0])}",
+                         self.captures[-1])
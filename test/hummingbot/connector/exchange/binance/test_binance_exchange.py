@@ -719,6 +719,69 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             asyncio.CancelledError,
             self.async_run_with_timeout, self.exchange._update_time_synchronizer())
 
+    def test_time_synchronizer_related_request_error_detection(self):
+        exception = IOError("Error executing request POST https://api.binance.com/api/v3/order. HTTP status is 400. "
+                            "Error: {'code':-1021,'msg':'Timestamp for this request is outside of the recvWindow.'}")
+        self.assertTrue(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
+
+        exception = IOError("Error executing request POST https://api.binance.com/api/v3/order. HTTP status is 400. "
+                            "Error: {'code':-1022,'msg':'Signature for this request is not valid.'}")
+        self.assertFalse(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
+
+    @patch("hummingbot.connector.exchange.binance.binance_exchange.BinanceExchange._update_time_synchronizer",
+           new_callable=AsyncMock)
+    def test_timestamp_rejected_request_synchronizes_time_again(self, update_time_synchronizer_mock):
+        rest_assistant = AsyncMock()
+        rest_assistant.execute_request.side_effect = IOError(
+            "Error executing request GET https://api.binance.com/api/v3/account. HTTP status is 400. "
+            "Error: {'code':-1021,'msg':'Timestamp for this request was 1000ms ahead of the server's time.'}")
+        self.exchange._web_assistants_factory.get_rest_assistant = AsyncMock(return_value=rest_assistant)
+        self.exchange._time_synchronizer.add_time_offset_ms_sample(1000)
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.ACCOUNTS_PATH_URL,
+                                                               is_auth_required=True))
+
+        update_time_synchronizer_mock.assert_awaited_once()
+        self.assertTrue(self.exchange._time_synchronizer.is_sync_required)
+
+    @patch("hummingbot.connector.exchange.binance.binance_exchange.BinanceExchange._update_time_synchronizer",
+           new_callable=AsyncMock)
+    def test_concurrent_timestamp_rejected_requests_share_one_time_synchronization(
+            self, update_time_synchronizer_mock):
+        rest_assistant = AsyncMock()
+        rest_assistant.execute_request.side_effect = IOError(
+            "Error executing request GET https://api.binance.com/api/v3/account. HTTP status is 400. "
+            "Error: {'code':-1021,'msg':'Timestamp for this request was 1000ms ahead of the server's time.'}")
+        self.exchange._web_assistants_factory.get_rest_assistant = AsyncMock(return_value=rest_assistant)
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            *[self.exchange._api_get(path_url=CONSTANTS.ACCOUNTS_PATH_URL, is_auth_required=True)
+              for _ in range(3)],
+            return_exceptions=True))
+
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        update_time_synchronizer_mock.assert_awaited_once()
+
+    @patch("hummingbot.connector.exchange.binance.binance_exchange.BinanceExchange._update_time_synchronizer",
+           new_callable=AsyncMock)
+    def test_failed_time_synchronization_keeps_the_request_error(self, update_time_synchronizer_mock):
+        request_error = IOError(
+            "Error executing request GET https://api.binance.com/api/v3/account. HTTP status is 400. "
+            "Error: {'code':-1021,'msg':'Timestamp for this request was 1000ms ahead of the server's time.'}")
+        synchronization_error = IOError("Error requesting the server time")
+        rest_assistant = AsyncMock()
+        rest_assistant.execute_request.side_effect = request_error
+        self.exchange._web_assistants_factory.get_rest_assistant = AsyncMock(return_value=rest_assistant)
+        update_time_synchronizer_mock.side_effect = synchronization_error
+
+        with self.assertRaises(IOError) as raised:
+            self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.ACCOUNTS_PATH_URL,
+                                                               is_auth_required=True))
+
+        self.assertIs(request_error, raised.exception)
+        self.assertIs(synchronization_error, raised.exception.__cause__)
+
     @aioresponses()
     def test_update_order_fills_from_trades_triggers_filled_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
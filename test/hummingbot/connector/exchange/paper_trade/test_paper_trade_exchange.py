@@ -1,9 +1,15 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -21,3 +27,71 @@ class PaperTradeExchangeTests(TestCase):
 
         paper_exchange = create_paper_trade_market(exchange_name="kucoin", trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeLimitOrdersTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self):
+        super().setUp()
+        self.exchange = MockPaperExchange()
+        self.exchange.set_balanced_order_book(trading_pair=self.trading_pair,
+                                              mid_price=100,
+                                              min_price=50,
+                                              max_price=150,
+                                              price_step_size=1,
+                                              volume_step_size=10)
+        self.exchange.set_balance("COINALPHA", Decimal("1000"))
+        self.exchange.set_balance("HBOT", Decimal("100000"))
+        self.exchange.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.fill_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def _simulate_trade(self, trade_type: TradeType, price: Decimal):
+        self.exchange.get_order_book(self.trading_pair).apply_trade(
+            OrderBookTradeEvent(self.trading_pair, 1, trade_type, price, Decimal("1")))
+
+    def test_cancel_order_in_the_middle_of_the_book(self):
+        order_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(price))
+                     for price in range(90, 95)]
+
+        self.exchange.cancel(self.trading_pair, order_ids[2])
+
+        self.assertEqual([order_ids[2]], [event.order_id for event in self.cancel_logger.event_log])
+        self.assertEqual(sorted(order_ids[:2] + order_ids[3:]),
+                         sorted(order.client_order_id for order in self.exchange.limit_orders))
+
+        self.exchange.cancel(self.trading_pair, order_ids[2])
+        self.assertEqual(1, len(self.cancel_logger.event_log))
+
+    def test_trade_fills_only_the_crossed_orders(self):
+        bid_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(price))
+                   for price in range(90, 95)]
+        ask_ids = [self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(price))
+                   for price in range(105, 110)]
+
+        self._simulate_trade(TradeType.SELL, Decimal("92"))
+
+        self.assertEqual([bid_ids[4], bid_ids[3]], [event.order_id for event in self.fill_logger.event_log])
+        self.assertEqual([Decimal("94"), Decimal("93")], [event.price for event in self.fill_logger.event_log])
+
+        self._simulate_trade(TradeType.BUY, Decimal("107"))
+
+        self.assertEqual([ask_ids[0], ask_ids[1]], [event.order_id for event in self.fill_logger.event_log[2:]])
+        self.assertEqual(sorted(bid_ids[:3] + ask_ids[2:]),
+                         sorted(order.client_order_id for order in self.exchange.limit_orders))
+
+        # The filled orders can't be cancelled anymore
+        self.exchange.cancel(self.trading_pair, bid_ids[4])
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+
+    def test_available_balances_exclude_resting_orders(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("90"))
+        self.exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("110"))
+
+        available_balances = self.exchange.available_balances
+
+        self.assertEqual(Decimal("997"), available_balances["COINALPHA"])
+        self.assertEqual(Decimal("99820"), available_balances["HBOT"])
@@ -265,6 +265,68 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_updated_after_tracking_started(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_exchange_order_id(order.client_order_id))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual("someExchangeOrderId", self.tracker.fetch_exchange_order_id(order.client_order_id))
+
+    def test_fetch_order_by_exchange_order_id_of_cached_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        # Once the order leaves the cache it is not found anymore, and it is removed from the index
+        del self.tracker._cached_orders[order.client_order_id]
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_exchange_order_id(order.client_order_id))
+
+    def test_expired_exchange_order_ids_removed_when_index_grows(self):
+        for i in range(2 * ClientOrderTracker.MAX_CACHE_SIZE + 2):
+            order: InFlightOrder = InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                exchange_order_id=f"someExchangeOrderId_{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            self.tracker.start_tracking_order(order)
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(self.tracker._exchange_order_ids), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        last_order_id = f"someClientOrderId_{2 * ClientOrderTracker.MAX_CACHE_SIZE + 1}"
+        self.assertEqual(last_order_id,
+                         self.tracker.fetch_order(exchange_order_id=f"someExchangeOrderId_{2 * ClientOrderTracker.MAX_CACHE_SIZE + 1}").client_order_id)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId_0"))
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
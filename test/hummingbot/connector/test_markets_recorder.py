@@ -1,3 +1,7 @@
+import asyncio
+import csv
+import os
+import tempfile
 import time
 from decimal import Decimal
 from unittest import TestCase
@@ -15,6 +19,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -45,6 +50,48 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def _create_and_fill_order(self, recorder: MarketsRecorder):
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+    def _assert_order_created_and_filled(self, manager: SQLConnectionManager):
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name],
+                             [status.status for status in orders[0].status])
+            self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+            self.assertEqual(1, len(orders[0].trade_fills))
+            self.assertEqual(1, len(session.query(MarketState).all()))
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -262,3 +309,185 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    def test_write_behind_records_are_written_on_stop(self, _):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        self._create_and_fill_order(recorder)
+
+        self.assertEqual(2, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+        recorder.stop()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        self._assert_order_created_and_filled(self.manager)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.MAX_PENDING_WRITES", 2)
+    def test_write_behind_records_are_written_when_queue_is_full(self, _):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        self._create_and_fill_order(recorder)
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        self._assert_order_created_and_filled(self.manager)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    def test_write_behind_failing_record_does_not_discard_the_batch(self, _):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        def failing_writer(session):
+            raise ValueError("Invalid record")
+
+        recorder._record(self, failing_writer)
+        self._create_and_fill_order(recorder)
+        self.assertEqual(3, recorder.pending_writes_count)
+
+        recorder.stop()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        self._assert_order_created_and_filled(self.manager)
+
+    def test_write_behind_failing_batch_appends_each_trade_to_csv_once(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name,
+                    write_behind=True,
+                )
+
+                def failing_writer(session):
+                    raise ValueError("Invalid record")
+
+                # The fill is written in the failing batch before the invalid record, and again when it is retried
+                self._create_and_fill_order(recorder)
+                recorder._record(self, failing_writer)
+                recorder.stop()
+
+            csv_path = os.path.join(data_dir, f"trades_{self.config_file_path[:-4]}.csv")
+            with open(csv_path, newline="") as csv_file:
+                rows = list(csv.reader(csv_file))
+
+            self.assertEqual(2, len(rows))
+            self.assertEqual("TradeId1", rows[1][0])
+            self._assert_order_created_and_filled(self.manager)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    @patch("hummingbot.model.sql_connection_manager.SQLConnectionManager.get_db_engine")
+    def test_write_behind_worker_writes_records_in_background(self, engine_mock, _):
+        # The worker writes from its own thread, so the database can't be an in-memory one
+        with tempfile.TemporaryDirectory() as db_dir:
+            engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir, 'test_DB.sqlite')}")
+            manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_name="test_DB")
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                write_behind=True,
+            )
+            recorder.start()
+
+            self._create_and_fill_order(recorder)
+            asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.5))
+
+            self.assertEqual(0, recorder.pending_writes_count)
+            self._assert_order_created_and_filled(manager)
+
+            recorder.stop()
+            manager.engine.dispose()
+
+    def test_trades_csv_rows_are_appended_after_a_single_header(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name
+                )
+                self._create_and_fill_order(recorder)
+                recorder.stop()
+
+                csv_path = os.path.join(data_dir, f"trades_{self.config_file_path[:-4]}.csv")
+                with open(csv_path, newline="") as csv_file:
+                    rows = list(csv.reader(csv_file))
+
+                self.assertEqual(2, len(rows))
+                self.assertEqual(TradeFill.attribute_names_for_file_export() + ["age"], rows[0])
+                self.assertEqual("TradeId1", rows[1][0])
+                self.assertEqual("1010", rows[1][rows[0].index("price")])
+                self.assertEqual("n/a", rows[1][-1])
+
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name
+                )
+                fill_event = OrderFilledEvent(
+                    timestamp=1642030000,
+                    order_id="OID1-1642010000000000",
+                    trading_pair=self.trading_pair,
+                    trade_type=TradeType.BUY,
+                    order_type=OrderType.LIMIT,
+                    price=Decimal(1020),
+                    amount=Decimal(1),
+                    trade_fee=AddedToCostTradeFee(),
+                    exchange_trade_id="TradeId2"
+                )
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+                recorder.flush_csv_writers()
+
+                with open(csv_path, newline="") as csv_file:
+                    rows = list(csv.reader(csv_file))
+                recorder.stop()
+
+                self.assertEqual(3, len(rows))
+                self.assertEqual("TradeId2", rows[2][0])
+
+    def test_trades_csv_with_other_header_is_moved_aside(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            csv_path = os.path.join(data_dir, f"trades_{self.config_file_path[:-4]}.csv")
+            with open(csv_path, "w") as csv_file:
+                csv_file.write("exchange_trade_id,other_field\nTradeId0,1\n")
+
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name
+                )
+                self._create_and_fill_order(recorder)
+                recorder.stop()
+
+            with open(csv_path, newline="") as csv_file:
+                rows = list(csv.reader(csv_file))
+            self.assertEqual(2, len(rows))
+            self.assertEqual("TradeId1", rows[1][0])
+            self.assertEqual(2, len(os.listdir(data_dir)))
@@ -70,3 +70,61 @@ class TimeSynchronizerTests(TestCase):
         self.assertEqual(
             statistics.median(expected_offsets) + seconds_difference_when_calculating_current_time,
             synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_sync_interval_increases_while_offset_is_stable(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        self.assertTrue(time_provider.is_sync_required)
+
+        counter = 0
+        for i in range(12):
+            seconds_counter_mock.side_effect = [counter, counter + 0.1]
+            self.async_run_with_timeout(
+                time_provider.update_server_time_offset_with_time_provider(
+                    time_provider=self.configurable_timestamp_provider((1640000000 + counter) * 1e3)
+                ))
+            counter += time_provider.sync_interval
+
+        self.assertEqual(TimeSynchronizer.MAX_SYNC_INTERVAL, time_provider.sync_interval)
+
+        seconds_counter_mock.side_effect = [counter - 1]
+        self.assertFalse(time_provider.is_sync_required)
+        seconds_counter_mock.side_effect = [counter + 0.1]
+        self.assertTrue(time_provider.is_sync_required)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_sync_interval_reset_when_offset_drifts(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        for offset in [1000, 1001, 1002]:
+            time_provider.add_time_offset_ms_sample(offset, round_trip_time_ms=10)
+        self.assertEqual(TimeSynchronizer.MIN_SYNC_INTERVAL * 4, time_provider.sync_interval)
+
+        time_provider.add_time_offset_ms_sample(1500, round_trip_time_ms=10)
+        self.assertEqual(TimeSynchronizer.MIN_SYNC_INTERVAL, time_provider.sync_interval)
+
+    def test_offset_within_round_trip_time_is_stable(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000, round_trip_time_ms=400)
+        time_provider.add_time_offset_ms_sample(1150, round_trip_time_ms=400)
+
+        self.assertEqual(TimeSynchronizer.MIN_SYNC_INTERVAL * 2, time_provider.sync_interval)
+
+    def test_median_offset_is_cached(self):
+        time_provider = TimeSynchronizer()
+        for offset in [1000, 3000, 2000]:
+            time_provider.add_time_offset_ms_sample(offset)
+
+        with patch("hummingbot.connector.time_synchronizer.statistics.median") as median_mock:
+            self.assertEqual(2000, time_provider.time_offset_ms)
+            self.assertEqual(2000, time_provider.time_offset_ms)
+            median_mock.assert_not_called()
+
+    def test_clear_samples_requires_sync(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(1001)
+
+        time_provider.clear_time_offset_ms_samples()
+
+        self.assertTrue(time_provider.is_sync_required)
+        self.assertEqual(TimeSynchronizer.MIN_SYNC_INTERVAL, time_provider.sync_interval)
@@ -8,7 +8,7 @@ from typing import Dict, List
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog, WaitTimeHistogram
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -50,6 +50,9 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         global_config_map["rate_limits_share_pct"].value = None
         super().tearDown()
 
+    def _task_logs_count(self) -> int:
+        return sum(len(window) for window in self.throttler._task_logs.values())
+
     async def execute_requests(self, no_request: int, limit_id: str, throttler: AsyncThrottler):
         for _ in range(no_request):
             async with throttler.execute_task(limit_id=limit_id):
@@ -91,35 +94,36 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         lock = asyncio.Lock()
 
         rate_limit = self.rate_limits[0]
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, self._task_logs_count())
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, self._task_logs_count())
 
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        window = self.throttler._task_logs[rate_limit.limit_id]
+        window.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        window.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(2, self._task_logs_count())
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, self._task_logs_count())
+        self.assertEqual(rate_limit.weight, window.capacity_used)
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        self.throttler._task_logs[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -141,7 +145,8 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -165,10 +170,12 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -204,11 +211,12 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                                       lock=asyncio.Lock(),
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.ev_loop.run_until_complete(context.acquire())
-        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(2, self._task_logs_count())
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        self.throttler._task_logs[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
@@ -219,6 +227,97 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                 asyncio.wait_for(context.acquire(), 1.0)
             )
 
+    def test_within_capacity_ignores_expired_tasks(self):
+        rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
+        self.throttler._task_logs[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time() - 10.0, rate_limit=rate_limit, weight=rate_limit.weight))
+
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[(rate_limit, rate_limit.weight)],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(0, self._task_logs_count())
+
+    def test_task_logs_are_kept_per_rate_limit(self):
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(5, self.throttler._task_logs[TEST_WEIGHTED_POOL_ID].capacity_used)
+        self.assertEqual(2, self.throttler._task_logs[TEST_WEIGHTED_TASK_1_ID].capacity_used)
+        self.assertEqual(0, self.throttler._task_logs[TEST_WEIGHTED_TASK_2_ID].capacity_used)
+
+    def test_acquire_wakes_up_when_blocking_task_expires(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0.0)
+        throttler._task_logs[TEST_POOL_ID].append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+
+        start = time.time()
+        self.ev_loop.run_until_complete(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.2 + throttler._retry_interval)
+
+    def test_waiting_requests_are_executed_in_fifo_order(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.1)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0.0)
+        executed = []
+
+        async def request(request_id: int):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                executed.append(request_id)
+
+        async def run_requests():
+            tasks = []
+            for request_id in range(4):
+                tasks.append(asyncio.ensure_future(request(request_id)))
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            self.assertEqual(3, throttler.get_queue_depth(TEST_POOL_ID))
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2))
+
+        self.assertEqual([0, 1, 2, 3], executed)
+        self.assertEqual(0, throttler.get_queue_depth(TEST_POOL_ID))
+
+    def test_cancelled_waiter_leaves_the_queue(self):
+        rate_limit = self.rate_limits[0]
+        self.throttler._task_logs[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        context = self.throttler.execute_task(limit_id=rate_limit.limit_id)
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(context.acquire(), 0.1)
+            )
+        self.assertEqual(0, self.throttler.get_queue_depth(rate_limit.limit_id))
+
+    def test_wait_time_histogram(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_PATH_URL).acquire())
+
+        histogram = self.throttler.get_wait_time_histogram(TEST_PATH_URL)
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(1, histogram.bucket_counts[0])
+        self.assertEqual(1, self.throttler.get_wait_time_histogram(TEST_POOL_ID).count)
+        self.assertEqual(0, self.throttler.get_wait_time_histogram(TEST_WEIGHTED_POOL_ID).count)
+        self.assertIsNone(self.throttler.get_wait_time_histogram("UNKNOWN_LIMIT"))
+
+    def test_wait_time_histogram_buckets(self):
+        histogram = WaitTimeHistogram()
+        histogram.add(0.0)
+        histogram.add(0.02)
+        histogram.add(100.0)
+
+        self.assertEqual(3, histogram.count)
+        self.assertEqual(100.0, histogram.max_wait_time)
+        self.assertAlmostEqual(100.02 / 3, histogram.mean_wait_time)
+        self.assertEqual((0.001, 1), histogram.buckets[0])
+        self.assertEqual((0.05, 1), histogram.buckets[2])
+        self.assertEqual((float("inf"), 1), histogram.buckets[-1])
+
     def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
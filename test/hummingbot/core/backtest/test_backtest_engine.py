@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.backtest.backtest_engine import BacktestEngine
+from hummingbot.core.backtest.market_data import (
+    BUY_SIDE,
+    DIFF_MESSAGE_TYPE,
+    MARKET_DATA_DTYPE,
+    SELL_SIDE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_MESSAGE_TYPE,
+)
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class SingleBuyStrategy(StrategyPyBase):
+    """
+    Places one limit buy order as soon as the market is ready
+    """
+
+    def __init__(self, market_info: MarketTradingPairTuple, price: Decimal, amount: Decimal):
+        super().__init__()
+        self._market_info = market_info
+        self._price = price
+        self._amount = amount
+        self._order_id = None
+        self.add_markets([market_info.market])
+
+    @property
+    def order_id(self):
+        return self._order_id
+
+    def tick(self, timestamp: float):
+        if self._order_id is None and self._market_info.market.ready:
+            self._order_id = self.buy_with_specific_market(
+                self._market_info, self._amount, OrderType.LIMIT, self._price)
+
+
+class BacktestEngineTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.market_data_path = os.path.join(self.temp_dir.name, "market_data")
+        self.start_timestamp = 1640000000.0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def write_market_data(self, records: List[tuple]):
+        np.array(records, dtype=MARKET_DATA_DTYPE).tofile(self.market_data_path)
+
+    def recorded_market(self) -> List[tuple]:
+        ts = self.start_timestamp
+        return [
+            (ts, SNAPSHOT_MESSAGE_TYPE, BUY_SIDE, 99.0, 10.0, 1.0),
+            (ts, SNAPSHOT_MESSAGE_TYPE, BUY_SIDE, 98.0, 10.0, 1.0),
+            (ts, SNAPSHOT_MESSAGE_TYPE, SELL_SIDE, 101.0, 10.0, 1.0),
+            (ts, SNAPSHOT_MESSAGE_TYPE, SELL_SIDE, 102.0, 10.0, 1.0),
+            (ts + 5, DIFF_MESSAGE_TYPE, BUY_SIDE, 99.0, 0.0, 2.0),
+            (ts + 5, DIFF_MESSAGE_TYPE, SELL_SIDE, 100.5, 3.0, 2.0),
+            (ts + 10, TRADE_MESSAGE_TYPE, SELL_SIDE, 97.0, 2.0, 3.0),
+            (ts + 10, TRADE_MESSAGE_TYPE, BUY_SIDE, 100.5, 1.0, 4.0),
+        ]
+
+    def test_replay_applies_snapshots_diffs_and_trades(self):
+        self.write_market_data(self.recorded_market())
+        engine = BacktestEngine(exchange_name="binance",
+                                market_data_paths={self.trading_pair: self.market_data_path},
+                                strategy_factory=lambda market_infos: SingleBuyStrategy(
+                                    market_infos[0], price=Decimal("95"), amount=Decimal("1")),
+                                balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")})
+
+        metrics = engine.run()
+
+        order_book = engine.exchange.get_order_book(self.trading_pair)
+        self.assertEqual([98.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([100.5, 101.0, 102.0], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(100.5, order_book.last_trade_price)
+        self.assertEqual(0, len(engine.trades))
+        self.assertEqual(0, metrics[self.trading_pair].num_trades)
+        self.assertEqual(Decimal("99.25"), metrics[self.trading_pair].cur_price)
+
+    def test_trades_crossing_resting_orders_are_filled_and_reported(self):
+        self.write_market_data(self.recorded_market())
+        engine = BacktestEngine(exchange_name="binance",
+                                market_data_paths={self.trading_pair: self.market_data_path},
+                                strategy_factory=lambda market_infos: SingleBuyStrategy(
+                                    market_infos[0], price=Decimal("97.5"), amount=Decimal("1")),
+                                balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")})
+
+        metrics = engine.run()
+
+        self.assertEqual(1, len(engine.trades))
+        trade = engine.trades[0]
+        self.assertEqual(TradeType.BUY, trade.side)
+        self.assertEqual(Decimal("97.5"), trade.price)
+        self.assertEqual(Decimal("1"), trade.amount)
+
+        pair_metrics = metrics[self.trading_pair]
+        self.assertEqual(1, pair_metrics.num_buys)
+        self.assertEqual(0, pair_metrics.num_sells)
+        # The exchange trading fees are applied to the fills
+        self.assertEqual(Decimal("10.999"), pair_metrics.cur_base_bal)
+        self.assertEqual(Decimal("902.5"), pair_metrics.cur_quote_bal)
+        self.assertGreater(pair_metrics.fee_in_quote, Decimal("0"))
+
+    def test_backtest_is_deterministic(self):
+        self.write_market_data(self.recorded_market())
+
+        def run_backtest():
+            engine = BacktestEngine(exchange_name="binance",
+                                    market_data_paths={self.trading_pair: self.market_data_path},
+                                    strategy_factory=lambda market_infos: SingleBuyStrategy(
+                                        market_infos[0], price=Decimal("97.5"), amount=Decimal("1")),
+                                    balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")})
+            metrics = engine.run()[self.trading_pair]
+            return [(trade.timestamp, trade.price, trade.amount) for trade in engine.trades], metrics.total_pnl
+
+        self.assertEqual(run_backtest(), run_backtest())
+
+    def test_run_without_market_data_raises_error(self):
+        self.write_market_data([])
+        engine = BacktestEngine(exchange_name="binance",
+                                market_data_paths={self.trading_pair: self.market_data_path},
+                                strategy_factory=lambda market_infos: SingleBuyStrategy(
+                                    market_infos[0], price=Decimal("97.5"), amount=Decimal("1")),
+                                balances={})
+
+        with self.assertRaises(ValueError):
+            engine.run()
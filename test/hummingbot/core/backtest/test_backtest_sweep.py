@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.backtest.backtest_sweep import BacktestSweep, pure_market_making_strategy
+from hummingbot.core.backtest.market_data import (
+    BUY_SIDE,
+    MARKET_DATA_DTYPE,
+    SELL_SIDE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_MESSAGE_TYPE,
+)
+
+
+class BacktestSweepTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.market_data_path = os.path.join(self.temp_dir.name, "market_data")
+        ts = 1640000000.0
+        np.array([
+            (ts, SNAPSHOT_MESSAGE_TYPE, BUY_SIDE, 99.0, 10.0, 1.0),
+            (ts, SNAPSHOT_MESSAGE_TYPE, SELL_SIDE, 101.0, 10.0, 1.0),
+            (ts + 10, TRADE_MESSAGE_TYPE, SELL_SIDE, 97.5, 5.0, 2.0),
+            (ts + 20, TRADE_MESSAGE_TYPE, BUY_SIDE, 101.5, 5.0, 3.0),
+        ], dtype=MARKET_DATA_DTYPE).tofile(self.market_data_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def sweep(self, max_workers: int) -> BacktestSweep:
+        return BacktestSweep(exchange_name="binance",
+                             market_data_paths={self.trading_pair: self.market_data_path},
+                             strategy_factory=pure_market_making_strategy,
+                             config_template={"order_amount": Decimal("1"),
+                                              "bid_spread": Decimal("0.01"),
+                                              "ask_spread": Decimal("0.01")},
+                             parameter_grid={"bid_spread": [Decimal("0.01"), Decimal("0.05")],
+                                             "ask_spread": [Decimal("0.01"), Decimal("0.05")]},
+                             balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")},
+                             max_workers=max_workers)
+
+    def test_configs_combine_template_and_grid(self):
+        configs = self.sweep(max_workers=1).configs
+
+        self.assertEqual(4, len(configs))
+        self.assertEqual({"order_amount": Decimal("1"), "bid_spread": Decimal("0.05"), "ask_spread": Decimal("0.01")},
+                         configs[2])
+
+    def test_results_are_ranked_by_performance(self):
+        sweep = self.sweep(max_workers=1)
+        table = sweep.run()
+
+        self.assertEqual(4, len(table))
+        self.assertEqual(["bid_spread", "ask_spread", "trading_pair"], list(table.columns[:3]))
+        self.assertEqual(sorted(table["total_pnl"], reverse=True), list(table["total_pnl"]))
+        # Only the orders at 1% of the mid price are crossed by the trades
+        best = table.iloc[0]
+        self.assertEqual((Decimal("0.01"), Decimal("0.01")), (best["bid_spread"], best["ask_spread"]))
+        self.assertEqual(2, best["num_trades"])
+        worst = table.iloc[-1]
+        self.assertEqual(0, worst["num_trades"])
+
+        table = sweep.ranked_table(rank_by="num_trades")
+        self.assertEqual([2, 1, 1, 0], list(table["num_trades"]))
+
+    def test_parallel_sweep_matches_sequential_sweep(self):
+        sequential = self.sweep(max_workers=1)
+        sequential.run()
+        parallel = self.sweep(max_workers=2)
+        parallel.run()
+
+        self.assertEqual([config for config, _ in sequential.results], [config for config, _ in parallel.results])
+        for (_, sequential_metrics), (_, parallel_metrics) in zip(sequential.results, parallel.results):
+            self.assertEqual(sequential_metrics[self.trading_pair].total_pnl,
+                             parallel_metrics[self.trading_pair].total_pnl)
+            self.assertEqual(sequential_metrics[self.trading_pair].fees, parallel_metrics[self.trading_pair].fees)
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.backtest.backtest_order_book_tracker import BacktestOrderBookTracker
+from hummingbot.core.backtest.market_data import (
+    BUY_SIDE,
+    DIFF_MESSAGE_TYPE,
+    SELL_SIDE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_MESSAGE_TYPE,
+    load_market_data,
+    market_data_file_path,
+)
+from hummingbot.core.backtest.market_data_recorder import MarketDataRecorder
+from hummingbot.core.backtest.market_data_replayer import MarketDataReplayer
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class MarketDataRecorderTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # 2021-12-20 11:33:20 UTC
+        self.start_timestamp = 1640000000.0
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot(*self._levels([[99, 10], [98, 10]], [[101, 10], [102, 10]], 1), 1)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def _levels(bids: List[List[float]], asks: List[List[float]], update_id: int):
+        message = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                   {"trading_pair": "", "update_id": update_id, "bids": bids, "asks": asks})
+        return message.bids, message.asks
+
+    def _diff_message(self, timestamp: float, update_id: int, bids: List[List[float]], asks: List[List[float]]):
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
+
+    def _trade_message(self, timestamp: float, trade_type: TradeType, price: float, amount: float):
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(trade_type.value),
+            "trade_id": 1,
+            "price": price,
+            "amount": amount,
+        }, timestamp=timestamp)
+
+    def _apply_and_record(self, recorder: MarketDataRecorder, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.DIFF:
+            self.order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        recorder.record_message(message, self.order_book)
+
+    def _recorded_file(self, timestamp: float) -> str:
+        return market_data_file_path(self.temp_dir.name, self.trading_pair, timestamp)
+
+    def test_recorded_messages_are_replayed_to_the_same_order_book(self):
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.start()
+        recorder.record_order_book(self.trading_pair, self.order_book, self.start_timestamp)
+        self._apply_and_record(recorder, self._diff_message(self.start_timestamp + 1, 2, [[99, 0]], [[100.5, 3]]))
+        self._apply_and_record(recorder, self._trade_message(self.start_timestamp + 2, TradeType.SELL, 97, 2))
+        recorder.stop()
+
+        records = load_market_data(self._recorded_file(self.start_timestamp))
+        self.assertEqual([SNAPSHOT_MESSAGE_TYPE] * 4 + [DIFF_MESSAGE_TYPE] * 2 + [TRADE_MESSAGE_TYPE],
+                         records["message_type"].tolist())
+        self.assertEqual([BUY_SIDE, BUY_SIDE, SELL_SIDE, SELL_SIDE, BUY_SIDE, SELL_SIDE, SELL_SIDE],
+                         records["side"].tolist())
+        self.assertEqual([99, 98, 101, 102, 99, 100.5, 97], records["price"].tolist())
+        self.assertEqual([1, 1, 1, 1, 2, 2, -1], records["update_id"].tolist())
+
+        tracker = BacktestOrderBookTracker([self.trading_pair])
+        replayer = MarketDataReplayer(tracker, {self.trading_pair: records})
+        replayer.replay_until(self.trading_pair, self.start_timestamp + 2)
+        replayed_order_book = tracker.order_books[self.trading_pair]
+
+        for side, expected_side in zip(replayed_order_book.snapshot, self.order_book.snapshot):
+            self.assertEqual(expected_side[["price", "amount"]].values.tolist(),
+                             side[["price", "amount"]].values.tolist())
+        self.assertEqual(97, replayed_order_book.last_trade_price)
+
+    def test_each_day_file_starts_with_a_snapshot(self):
+        next_day = self.start_timestamp + 86400
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.start()
+        recorder.record_order_book(self.trading_pair, self.order_book, self.start_timestamp)
+        self._apply_and_record(recorder, self._diff_message(self.start_timestamp + 1, 2, [[99, 5]], []))
+        self._apply_and_record(recorder, self._diff_message(next_day, 3, [[98, 0]], []))
+        recorder.stop()
+
+        first_day = load_market_data(self._recorded_file(self.start_timestamp))
+        second_day = load_market_data(self._recorded_file(next_day))
+        self.assertEqual(5, len(first_day))
+        self.assertEqual([SNAPSHOT_MESSAGE_TYPE] * 3, second_day["message_type"].tolist())
+        self.assertEqual([99, 101, 102], second_day["price"].tolist())
+        self.assertEqual([next_day] * 3, second_day["timestamp"].tolist())
+        self.assertEqual([3] * 3, second_day["update_id"].tolist())
+
+    def test_messages_dropped_when_the_queue_is_full_are_replaced_by_a_snapshot(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, max_queue_size=1)
+        recorder.record_order_book(self.trading_pair, self.order_book, self.start_timestamp)
+        self._apply_and_record(recorder, self._diff_message(self.start_timestamp + 1, 2, [[99, 5]], []))
+        self.assertEqual(1, recorder.dropped_messages)
+
+        recorder.start()
+        while not recorder._queue.empty():
+            time.sleep(0.01)
+        self._apply_and_record(recorder, self._diff_message(self.start_timestamp + 2, 3, [[97, 1]], []))
+        recorder.stop()
+
+        records = load_market_data(self._recorded_file(self.start_timestamp))
+        self.assertEqual([SNAPSHOT_MESSAGE_TYPE] * 9, records["message_type"].tolist())
+        resync_snapshot = records[4:]
+        self.assertEqual([99, 98, 97, 101, 102], resync_snapshot["price"].tolist())
+        self.assertEqual([5, 10, 1, 10, 10], resync_snapshot["amount"].tolist())
+        self.assertTrue(np.all(resync_snapshot["timestamp"] == self.start_timestamp + 2))
+
+    def test_recording_appends_to_existing_file(self):
+        for _ in range(2):
+            recorder = MarketDataRecorder(self.temp_dir.name)
+            recorder.start()
+            recorder.record_order_book(self.trading_pair, self.order_book, self.start_timestamp)
+            recorder.stop()
+
+        path = self._recorded_file(self.start_timestamp)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(8, len(load_market_data(path)))
@@ -720,3 +720,60 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertTrue(order.update_with_trade_update(trade_update))
         self.assertIsNone(order.exchange_order_id)
         self.assertFalse(order.exchange_order_id_update_event.is_set())
+
+    def test_order_has_no_instance_dict(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.assertFalse(hasattr(order, "__dict__"))
+        with self.assertRaises(AttributeError):
+            order.unknown_attribute = 1
+
+    def test_events_created_after_the_order_changes_are_set(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        order.update_exchange_order_id(self.exchange_order_id)
+        order.executed_amount_base = order.amount
+        order.check_filled_condition()
+
+        self.assertTrue(order.exchange_order_id_update_event.is_set())
+        self.assertTrue(order.completely_filled_event.is_set())
+        self.assertEqual(self.exchange_order_id, self.async_run_with_timeout(order.get_exchange_order_id()))
+
+    def test_snapshot_reuses_previous_snapshot_of_unchanged_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        snapshot = order.snapshot()
+        self.assertIsNot(order, snapshot)
+        self.assertEqual(order.attributes, snapshot.attributes)
+        self.assertIs(snapshot, order.snapshot(snapshot))
+
+        order.current_state = OrderState.OPEN
+        new_snapshot = order.snapshot(snapshot)
+
+        self.assertIsNot(snapshot, new_snapshot)
+        self.assertEqual(OrderState.PENDING_CREATE, snapshot.current_state)
+        self.assertEqual(OrderState.OPEN, new_snapshot.current_state)
@@ -2,7 +2,10 @@
 
 import logging
 import unittest
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
@@ -50,6 +53,220 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def _depth_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9.5, 2, 1], [9, 3, 1], [8, 4, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [11.5, 2, 1], [12, 3, 1], [13, 4, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_depth_queries(self):
+        order_book = self._depth_order_book()
+
+        result = order_book.get_price_for_volume(True, 2.5)
+        self.assertEqual(11.5, result.result_price)
+        self.assertEqual(2.5, result.result_volume)
+        result = order_book.get_price_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(10, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((11 + 11.5) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(False, 20)
+        self.assertEqual(9.5, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(22.5, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 12)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(6, result.result_volume)
+        result = order_book.get_volume_for_price(False, 9.2)
+        self.assertEqual(9.5, result.result_price)
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 9.5)
+        self.assertEqual(29, result.result_volume)
+
+    def test_simulate_buy_and_sell(self):
+        order_book = self._depth_order_book()
+
+        self.assertEqual([(11, 1, 1), (11.5, 0.5, 1)], [tuple(row) for row in order_book.simulate_buy(1.5)])
+        self.assertEqual([(10, 1, 1), (9.5, 2, 1), (9, 1, 1)], [tuple(row) for row in order_book.simulate_sell(4)])
+
+    def test_batched_depth_queries_match_single_queries(self):
+        order_book = self._depth_order_book()
+        volumes = [3.3, 0.5, 100, 1, 6, 2.5]
+        prices = [11.2, 8.5, 20, 1, 10, 9.5, 11]
+
+        for is_buy in (True, False):
+            for volume, result in zip(volumes, order_book.get_prices_for_volumes(is_buy, volumes)):
+                expected = order_book.get_price_for_volume(is_buy, volume)
+                np.testing.assert_equal([expected.query_volume, expected.result_price, expected.result_volume],
+                                        [result.query_volume, result.result_price, result.result_volume])
+            for volume, result in zip(volumes, order_book.get_vwaps_for_volumes(is_buy, volumes)):
+                expected = order_book.get_vwap_for_volume(is_buy, volume)
+                np.testing.assert_equal([expected.query_volume, expected.result_price, expected.result_volume],
+                                        [result.query_volume, result.result_price, result.result_volume])
+            for price, result in zip(prices, order_book.get_volumes_for_prices(is_buy, prices)):
+                expected = order_book.get_volume_for_price(is_buy, price)
+                np.testing.assert_equal([expected.query_price, expected.result_price, expected.result_volume],
+                                        [result.query_price, result.result_price, result.result_volume])
+
+    def test_batched_depth_queries_without_queries(self):
+        order_book = self._depth_order_book()
+
+        self.assertEqual([], order_book.get_prices_for_volumes(True, []))
+        self.assertEqual([], order_book.get_vwaps_for_volumes(False, []))
+        self.assertEqual([], order_book.get_volumes_for_prices(True, []))
+
+    def _assert_depth_queries_equal(self, expected_book: OrderBook, order_book: OrderBook):
+        volumes = [0.5, 1, 2.5, 3, 6, 9.75, 100]
+        prices = [1, 8, 8.5, 9.5, 10, 10.5, 11, 11.5, 12.25, 13, 20]
+        for is_buy in (True, False):
+            for volume in volumes:
+                for query in ("get_price_for_volume", "get_vwap_for_volume"):
+                    expected = getattr(expected_book, query)(is_buy, volume)
+                    result = getattr(order_book, query)(is_buy, volume)
+                    np.testing.assert_equal([expected.result_price, expected.result_volume],
+                                            [result.result_price, result.result_volume])
+            for price in prices:
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    expected = getattr(expected_book, query)(is_buy, price)
+                    result = getattr(order_book, query)(is_buy, price)
+                    np.testing.assert_equal([expected.result_price, expected.result_volume],
+                                            [result.result_price, result.result_volume])
+            np.testing.assert_equal(
+                [(r.result_price, r.result_volume) for r in expected_book.get_vwaps_for_volumes(is_buy, volumes)],
+                [(r.result_price, r.result_volume) for r in order_book.get_vwaps_for_volumes(is_buy, volumes)])
+
+    def test_depth_index_queries_match_linear_queries(self):
+        order_book = self._depth_order_book()
+        indexed_order_book = OrderBook(depth_index=True)
+        self.assertTrue(indexed_order_book.has_depth_index)
+        bids_array = np.array([[10, 1, 1], [9.5, 2, 1], [9, 3, 1], [8, 4, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [11.5, 2, 1], [12, 3, 1], [13, 4, 1]], dtype=np.float64)
+        indexed_order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        # Updated, new and removed levels
+        bids_array = np.array([[9.5, 0.5, 2], [8.5, 1.5, 2], [9, 0, 2]], dtype=np.float64)
+        asks_array = np.array([[11.5, 0, 2], [12.5, 2.25, 2], [11, 3, 2]], dtype=np.float64)
+        for book in (order_book, indexed_order_book):
+            book.apply_numpy_diffs(bids_array, asks_array)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        # A new bid crossing the asks truncates the ask levels below it
+        for book in (order_book, indexed_order_book):
+            book.apply_numpy_diffs(np.array([[12.25, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+    def test_enable_depth_index_on_existing_book(self):
+        order_book = self._depth_order_book()
+        indexed_order_book = self._depth_order_book()
+        self.assertFalse(indexed_order_book.has_depth_index)
+
+        indexed_order_book.enable_depth_index()
+        self.assertTrue(indexed_order_book.has_depth_index)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        indexed_order_book.disable_depth_index()
+        self.assertFalse(indexed_order_book.has_depth_index)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+    def test_composite_order_book_rejects_depth_index(self):
+        order_book = CompositeOrderBook()
+
+        with self.assertRaises(TypeError):
+            order_book.enable_depth_index()
+        self.assertFalse(order_book.has_depth_index)
+
+    def test_apply_diff_messages_matches_applying_each_diff(self):
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 2, "bids": [[10, 3], [8, 1]], "asks": [[11, 0]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 3, "bids": [[10, 0.5]], "asks": [[12.5, 4]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 4, "bids": [[8, 0], [12, 2]], "asks": [[11.5, 1]]}),
+        ]
+        expected_order_book = self._depth_order_book()
+        for diff in diffs:
+            expected_order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        order_book = self._depth_order_book()
+        order_book.apply_diff_messages(diffs)
+
+        for side, expected_side in zip(order_book.snapshot, expected_order_book.snapshot):
+            self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_apply_raw_levels_matches_applying_rows(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": "A-B", "update_id": 1,
+                                     "bids": [["10.5", "2.25"], ["10", "1"]],
+                                     "asks": [["11", "3", "extra"], [11.5, 1]]})
+        diff = OrderBookMessage(OrderBookMessageType.DIFF,
+                                {"trading_pair": "A-B", "update_id": 2,
+                                 "bids": [["10.5", "0"], [10.25, 4.5]],
+                                 "asks": [["1.1e1", "0.5"], [12, 2, 7]]})
+        expected_order_book = OrderBook()
+        expected_order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        expected_order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot(snapshot.raw_bids, snapshot.raw_asks, snapshot.update_id)
+        order_book.apply_raw_diffs(diff.raw_bids, diff.raw_asks, diff.update_id)
+        message_order_book = OrderBook()
+        message_order_book.apply_snapshot_message(snapshot)
+        message_order_book.apply_diff_message(diff)
+
+        for book in (order_book, message_order_book):
+            for side, expected_side in zip(book.snapshot, expected_order_book.snapshot):
+                self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+            self.assertEqual(1, book.snapshot_uid)
+            self.assertEqual(2, book.last_diff_uid)
+        self.assertEqual(10.25, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_snapshot_timestamp_is_the_applied_snapshot_message_timestamp(self):
+        order_book = OrderBook()
+        self.assertIsNone(order_book.snapshot_timestamp)
+
+        order_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                                           {"trading_pair": "A-B", "update_id": 1,
+                                                            "bids": [[10, 1]], "asks": [[11, 1]]},
+                                                           timestamp=1640000000.5))
+        self.assertEqual(1640000000.5, order_book.snapshot_timestamp)
+
+        order_book.apply_snapshot([], [], 2)
+        self.assertEqual(1640000000.5, order_book.snapshot_timestamp)
+
+    def test_apply_raw_diffs_rejects_invalid_values(self):
+        order_book = OrderBook()
+        with self.assertRaises(ValueError):
+            order_book.apply_raw_diffs([["10.5x", "1"]], [], 1)
+        with self.assertRaises(IndexError):
+            order_book.apply_raw_diffs([["10.5"]], [], 1)
+
+    def test_messages_overriding_levels_are_applied_from_rows(self):
+        class ScaledOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(float(price) * 2, float(amount), self.update_id)
+                        for price, amount in self.content["bids"]]
+
+        message = ScaledOrderBookMessage(OrderBookMessageType.DIFF,
+                                         {"trading_pair": "A-B", "update_id": 2, "bids": [["5", "1"]], "asks": []})
+        self.assertIsNone(message.raw_bids)
+        self.assertEqual([], message.raw_asks)
+
+        order_book = OrderBook()
+        order_book.apply_diff_message(message)
+        self.assertEqual(10, order_book.get_price(False))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,627 @@
+import asyncio
+import unittest
+from typing import Any, Awaitable, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.web_assistant.connections.data_types import WSResponse
+
+
+class WebsocketDataSource(OrderBookTrackerDataSource):
+    """
+    Parses the messages of a fake websocket: {"channel": "trade" or "order_book_diff", "message": OrderBookMessage}
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None):
+        return {}
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return event_message["channel"]
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message["message"])
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        if raw_message["message"] is None:
+            raise ValueError("Invalid trade message")
+        message_queue.put_nowait(raw_message["message"])
+
+
+class ShardedWebsocketDataSource(WebsocketDataSource):
+    """
+    Connects to fake websockets. Each connection returns the next messages list of its shard, keyed by the shard's
+    first trading pair, the items being {"channel": ..., "message": ...} or an exception to raise
+    """
+
+    def __init__(self, trading_pairs: List[str], connections_messages: Dict[str, List[List[Any]]]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.connections_messages = connections_messages
+        self.subscriptions: List[List[str]] = []
+
+    async def _connected_websocket_assistant(self):
+        websocket_assistant = MagicMock()
+
+        async def iter_messages():
+            shard_messages = self.connections_messages.get(websocket_assistant.trading_pairs[0], [])
+            for message in (shard_messages.pop(0) if len(shard_messages) > 0 else []):
+                if isinstance(message, Exception):
+                    raise message
+                yield WSResponse(data=message)
+            # Keeps the connection open
+            await asyncio.Event().wait()
+
+        websocket_assistant.iter_messages.side_effect = iter_messages
+        websocket_assistant.disconnect = AsyncMock()
+        return websocket_assistant
+
+    async def _subscribe_trading_pairs_channels(self, ws, trading_pairs: List[str]):
+        ws.trading_pairs = trading_pairs
+        self.subscriptions.append(trading_pairs)
+
+    async def _sleep(self, delay: float):
+        pass
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    # logging.Level required to receive logs from the tracker
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.snapshot_requests: List[str] = []
+        self.snapshot_futures: Dict[str, asyncio.Future] = {}
+
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book.side_effect = self._get_new_order_book
+
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        concurrent_bootstrap=True)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests.append(trading_pair)
+        future = self.ev_loop.create_future()
+        self.snapshot_futures[trading_pair] = future
+        return await future
+
+    def _resolve_snapshot(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        self.snapshot_futures[trading_pair].set_result(order_book)
+        return order_book
+
+    def test_concurrent_bootstrap_requests_all_snapshots_at_once(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(set(self.trading_pairs), set(self.snapshot_requests))
+        self.assertFalse(self.tracker.ready)
+
+        init_task.cancel()
+
+    def test_concurrent_bootstrap_limits_requests_in_flight(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(2, len(self.snapshot_requests))
+
+        self._resolve_snapshot(self.snapshot_requests[0])
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(3, len(self.snapshot_requests))
+
+        init_task.cancel()
+
+    def test_order_book_is_tracked_as_soon_as_its_snapshot_is_received(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_book = self._resolve_snapshot(self.trading_pairs[1])
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertFalse(self.tracker.ready)
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertEqual([self.trading_pairs[1]], self.tracker.ready_trading_pairs)
+        self.assertIn(self.trading_pairs[1], self.tracker._tracking_tasks)
+        self.assertEqual(order_book, self.async_run_with_timeout(
+            self.tracker.wait_for_order_book(self.trading_pairs[1])))
+        self.assertTrue(self._is_logged("INFO", f"Initialized order book for {self.trading_pairs[1]}. 1/3 completed."))
+
+        init_task.cancel()
+
+    def test_ready_when_all_order_books_initialized(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        for trading_pair in self.trading_pairs:
+            self._resolve_snapshot(trading_pair)
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker.SNAPSHOT_RETRY_INTERVAL", 0.0)
+    def test_failed_snapshot_is_retried_only_for_its_trading_pair(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self._resolve_snapshot(self.trading_pairs[0])
+        self.snapshot_futures[self.trading_pairs[1]].set_exception(IOError("Test error"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(4, len(self.snapshot_requests))
+        self.assertEqual(self.trading_pairs[1], self.snapshot_requests[-1])
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertTrue(self._is_logged("NETWORK", f"Unexpected error initializing order book for {self.trading_pairs[1]}."))
+
+        self._resolve_snapshot(self.trading_pairs[1])
+        self._resolve_snapshot(self.trading_pairs[2])
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+
+    def test_stop_clears_per_pair_readiness(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        for trading_pair in self.trading_pairs:
+            self._resolve_snapshot(trading_pair)
+        self.async_run_with_timeout(init_task)
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    def _diff_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pairs[0],
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id))
+
+    def _snapshot_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pairs[0],
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id))
+
+    def _initial_order_book(self) -> OrderBook:
+        snapshot = self._snapshot_message(1, [[10, 1], [9, 2]], [[11, 1], [12, 2]])
+        order_book = OrderBook()
+        order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        return order_book
+
+    def _start_tracking_with_coalesced_diffs(self) -> OrderBook:
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        coalesce_diffs=True)
+        order_book = self._initial_order_book()
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        return order_book
+
+    def test_queued_diffs_are_applied_together(self):
+        order_book = self._start_tracking_with_coalesced_diffs()
+        diffs = [
+            self._diff_message(2, [[10, 3], [8, 1]], [[11, 0]]),
+            self._diff_message(3, [[10, 0.5]], [[12.5, 4]]),
+            self._diff_message(4, [[8, 0], [9.5, 2]], [[11.5, 1]]),
+        ]
+        for diff in diffs:
+            self.tracker._tracking_message_queues[self.trading_pairs[0]].put_nowait(diff)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        expected_order_book = self._initial_order_book()
+        for diff in diffs:
+            expected_order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        for side, expected_side in zip(order_book.snapshot, expected_order_book.snapshot):
+            self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(diffs, list(self.tracker._past_diffs_windows[self.trading_pairs[0]]))
+
+    def test_coalesced_diffs_stop_at_snapshot(self):
+        order_book = self._start_tracking_with_coalesced_diffs()
+        first_diff = self._diff_message(2, [[10, 3]], [])
+        snapshot = self._snapshot_message(3, [[9, 1]], [[13, 1]])
+        last_diff = self._diff_message(4, [[8, 1]], [[13, 2]])
+        queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        for message in (first_diff, snapshot, last_diff):
+            queue.put_nowait(message)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        expected_order_book = self._initial_order_book()
+        expected_order_book.apply_diffs(first_diff.bids, first_diff.asks, first_diff.update_id)
+        expected_order_book.restore_from_snapshot_and_diffs(snapshot, [first_diff])
+        expected_order_book.apply_diffs(last_diff.bids, last_diff.asks, last_diff.update_id)
+
+        for side, expected_side in zip(order_book.snapshot, expected_order_book.snapshot):
+            self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+        self.assertEqual(3, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_applied_messages_are_recorded(self):
+        recorder = MagicMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        coalesce_diffs=True)
+        self.tracker.market_data_recorder = recorder
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(1, [[10, 1], [9, 2]], [[11, 1], [12, 2]]))
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        # The initial order book is recorded with the timestamp of its snapshot
+        recorder.record_order_book.assert_called_once_with(self.trading_pairs[0], order_book, 1.0)
+
+        first_diff = self._diff_message(2, [[10, 3]], [])
+        second_diff = self._diff_message(3, [[9, 1]], [])
+        snapshot = self._snapshot_message(4, [[9, 1]], [[13, 1]])
+        queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        for message in (first_diff, second_diff, snapshot):
+            queue.put_nowait(message)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual([(first_diff, order_book), (second_diff, order_book)],
+                         [call.args for call in recorder.record_message.call_args_list])
+        recorder.record_order_book.assert_called_with(self.trading_pairs[0], order_book, snapshot.timestamp)
+
+    def _websocket_assistant(self, raw_messages: List[Dict[str, Any]]) -> MagicMock:
+        async def iter_messages():
+            for raw_message in raw_messages:
+                yield WSResponse(data=raw_message)
+
+        websocket_assistant = MagicMock()
+        websocket_assistant.iter_messages.side_effect = iter_messages
+        return websocket_assistant
+
+    def test_direct_dispatch_routes_websocket_messages_to_tracking_queues(self):
+        data_source = WebsocketDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        direct_dispatch=True)
+        order_book = self._initial_order_book()
+        # Keeps the routed messages in the tracking queue
+        track_patcher = patch.object(self.tracker, "_track_single_book")
+        track_patcher.start()
+        self.addCleanup(track_patcher.stop)
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        stale_diff = self._diff_message(0, [[10, 5]], [])
+        diff = self._diff_message(2, [[10, 3]], [])
+        untracked_pair_diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pairs[1], "update_id": 2, "bids": [], "asks": []}, timestamp=2)
+        trade = OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pairs[0], "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+            "update_id": 3, "price": 10.5, "amount": 1}, timestamp=3)
+        raw_messages = [{"channel": "order_book_diff", "message": message}
+                        for message in (stale_diff, diff, untracked_pair_diff)]
+        raw_messages.append({"channel": "trade", "message": None})
+        raw_messages.append({"channel": "trade", "message": trade})
+
+        self.async_run_with_timeout(data_source._process_websocket_messages(self._websocket_assistant(raw_messages)))
+
+        tracking_queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        self.assertEqual(1, tracking_queue.qsize())
+        self.assertIs(diff, tracking_queue.get_nowait())
+        self.assertEqual([untracked_pair_diff], list(self.tracker._saved_message_queues[self.trading_pairs[1]]))
+        self.assertEqual(10.5, order_book.last_trade_price)
+        self.assertTrue(data_source._message_queue["order_book_diff"].empty())
+
+    def test_direct_dispatch_skips_router_tasks(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        direct_dispatch=True)
+        self.tracker.start()
+
+        self.assertIsNone(self.tracker._order_book_diff_router_task)
+        self.assertIsNone(self.tracker._order_book_snapshot_router_task)
+        self.assertIsNone(self.tracker._emit_trade_event_task)
+        self.data_source.set_direct_dispatch_outputs.assert_called_once_with(
+            diff_output=self.tracker._order_book_diff_stream, trade_output=self.tracker._order_book_trade_stream)
+        self.data_source.listen_for_order_book_diffs.assert_called_once_with(
+            self.tracker._ev_loop, self.tracker._order_book_diff_stream)
+
+    def test_direct_dispatch_applies_diffs_in_order(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        direct_dispatch=True)
+        early_diff = self._diff_message(2, [[10, 3]], [])
+        self.tracker._order_book_diff_stream.put_nowait(early_diff)
+        order_book = self._initial_order_book()
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        snapshot = self._snapshot_message(3, [[9, 1]], [[13, 1]])
+        last_diff = self._diff_message(4, [[8, 1]], [[13, 2]])
+        self.tracker._order_book_snapshot_stream.put_nowait(snapshot)
+        self.tracker._order_book_diff_stream.put_nowait(last_diff)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        expected_order_book = self._initial_order_book()
+        expected_order_book.apply_diffs(early_diff.bids, early_diff.asks, early_diff.update_id)
+        expected_order_book.restore_from_snapshot_and_diffs(snapshot, [early_diff])
+        expected_order_book.apply_diffs(last_diff.bids, last_diff.asks, last_diff.update_id)
+        for side, expected_side in zip(order_book.snapshot, expected_order_book.snapshot):
+            self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def _sequenced_diff_message(self, first_update_id: int, update_id: int, bids: List[List[float]]) -> OrderBookMessage:
+        diff = self._diff_message(update_id, bids, [])
+        diff.content["first_update_id"] = first_update_id
+        return diff
+
+    def _start_tracking_with_resync_on_gap(self, coalesce_diffs: bool = False) -> OrderBook:
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        coalesce_diffs=coalesce_diffs,
+                                        resync_on_gap=True)
+        order_book = self._initial_order_book()
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        return order_book
+
+    def test_resync_on_gap_enables_on_demand_snapshots(self):
+        self._start_tracking_with_resync_on_gap()
+
+        self.data_source.enable_on_demand_snapshots.assert_called_once()
+
+    def test_continuous_diffs_are_applied_without_resync(self):
+        order_book = self._start_tracking_with_resync_on_gap()
+        queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        queue.put_nowait(self._sequenced_diff_message(2, 3, [[10, 3]]))
+        queue.put_nowait(self._sequenced_diff_message(4, 4, [[9, 4]]))
+        # Diffs not stating their first update id are not checked
+        queue.put_nowait(self._diff_message(10, [[8, 1]], []))
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(10, order_book.last_diff_uid)
+        self.assertEqual(10, self.tracker._last_update_ids[self.trading_pairs[0]])
+        self.data_source.request_order_book_snapshot.assert_not_called()
+
+    def test_gap_buffers_diffs_until_the_requested_snapshot(self):
+        order_book = self._start_tracking_with_resync_on_gap()
+        queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        first_diff = self._sequenced_diff_message(2, 2, [[10, 3]])
+        gap_diff = self._sequenced_diff_message(5, 5, [[9, 5]])
+        buffered_diff = self._sequenced_diff_message(6, 6, [[8, 1]])
+        for message in (first_diff, gap_diff, buffered_diff):
+            queue.put_nowait(message)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.data_source.request_order_book_snapshot.assert_called_once_with(self.trading_pairs[0])
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            f"Order book diffs gap for {self.trading_pairs[0]} (expected update 3, received 5). "
+            f"Requesting a new snapshot."))
+
+        snapshot = self._snapshot_message(5, [[9, 1]], [[13, 1]])
+        queue.put_nowait(snapshot)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        expected_order_book = OrderBook()
+        expected_order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        expected_order_book.apply_diffs(buffered_diff.bids, buffered_diff.asks, buffered_diff.update_id)
+        for side, expected_side in zip(order_book.snapshot, expected_order_book.snapshot):
+            self.assertEqual(expected_side.values.tolist(), side.values.tolist())
+        self.assertEqual(6, self.tracker._last_update_ids[self.trading_pairs[0]])
+        self.assertNotIn(self.trading_pairs[0], self.tracker._resync_buffers)
+        self.data_source.request_order_book_snapshot.assert_called_once()
+
+    def test_snapshot_older_than_the_gap_requests_another_snapshot(self):
+        self._start_tracking_with_resync_on_gap(coalesce_diffs=True)
+        queue = self.tracker._tracking_message_queues[self.trading_pairs[0]]
+        queue.put_nowait(self._sequenced_diff_message(2, 2, [[10, 3]]))
+        queue.put_nowait(self._sequenced_diff_message(5, 5, [[9, 5]]))
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        queue.put_nowait(self._snapshot_message(1, [[9, 1]], [[13, 1]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, self.data_source.request_order_book_snapshot.call_count)
+        self.assertEqual([5], [diff.update_id for diff in self.tracker._resync_buffers[self.trading_pairs[0]]])
+
+
+class OnDemandSnapshotsDataSourceTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.data_source = WebsocketDataSource(trading_pairs=["COINALPHA-HBOT", "COINBETA-HBOT"])
+        self.snapshot_requests: List[str] = []
+        self.data_source._order_book_snapshot = self._order_book_snapshot
+        self.data_source._sleep = self._sleep
+        self.listening_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        if self.listening_task is not None:
+            self.listening_task.cancel()
+        super().tearDown()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests.append(trading_pair)
+        if len(self.snapshot_requests) == 1:
+            raise IOError("Snapshot request failed")
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                {"trading_pair": trading_pair, "update_id": 1, "bids": [], "asks": []})
+
+    async def _sleep(self, delay: float):
+        pass
+
+    def test_only_requested_snapshots_are_fetched(self):
+        output = asyncio.Queue()
+        self.data_source.enable_on_demand_snapshots()
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_order_book_snapshots(self.ev_loop, output))
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual([], self.snapshot_requests)
+
+        self.data_source.request_order_book_snapshot("COINBETA-HBOT")
+        snapshot: OrderBookMessage = self.ev_loop.run_until_complete(asyncio.wait_for(output.get(), 1))
+
+        # The failed request is retried
+        self.assertEqual(["COINBETA-HBOT", "COINBETA-HBOT"], self.snapshot_requests)
+        self.assertEqual("COINBETA-HBOT", snapshot.trading_pair)
+
+    def test_resync_on_gap_is_ignored_when_snapshots_listener_is_overridden(self):
+        class PeriodicSnapshotsDataSource(WebsocketDataSource):
+            async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+                pass
+
+        data_source = PeriodicSnapshotsDataSource(trading_pairs=["COINALPHA-HBOT"])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=["COINALPHA-HBOT"], resync_on_gap=True)
+
+        self.assertFalse(data_source.on_demand_snapshots_enabled)
+        self.assertFalse(tracker._resync_on_gap)
+
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COINALPHA-HBOT"], resync_on_gap=True)
+
+        self.assertTrue(self.data_source.on_demand_snapshots_enabled)
+        self.assertTrue(tracker._resync_on_gap)
+
+
+class WebsocketShardsDataSourceTests(unittest.TestCase):
+    # logging.Level required to receive logs from the data source
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.log_records = []
+        self.listening_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        if self.listening_task is not None:
+            self.listening_task.cancel()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    def _diff(self, trading_pair: str) -> Dict[str, Any]:
+        return {"channel": "order_book_diff", "message": OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": 1, "bids": [], "asks": []})}
+
+    def test_unsupported_data_source_uses_a_single_connection(self):
+        data_source = WebsocketDataSource(trading_pairs=self.trading_pairs)
+        data_source.logger().setLevel(1)
+        data_source.logger().addHandler(self)
+
+        data_source.set_websocket_shards(2)
+
+        self.assertEqual(1, data_source._websocket_shards)
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            "WebsocketDataSource does not support sharded websocket subscriptions. Using a single websocket connection."))
+
+    def test_tracker_sets_the_data_source_shards(self):
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, websocket_shards=2)
+
+        data_source.set_websocket_shards.assert_called_once_with(2)
+        self.assertIs(data_source.websocket_shard_stats, tracker.websocket_shard_stats)
+
+    def test_trading_pairs_are_spread_over_the_shards(self):
+        data_source = ShardedWebsocketDataSource(
+            trading_pairs=self.trading_pairs,
+            connections_messages={
+                self.trading_pairs[0]: [[self._diff(self.trading_pairs[0]), self._diff(self.trading_pairs[2])]],
+                self.trading_pairs[1]: [[self._diff(self.trading_pairs[1])]]})
+        data_source.set_websocket_shards(2)
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        self.assertEqual([[self.trading_pairs[0], self.trading_pairs[2]], [self.trading_pairs[1]]],
+                         data_source.subscriptions)
+        self.assertEqual(3, data_source._message_queue["order_book_diff"].qsize())
+        first_shard, second_shard = data_source.websocket_shard_stats
+        self.assertEqual(2, first_shard.messages)
+        self.assertEqual(1, second_shard.messages)
+        self.assertEqual(2, first_shard.dispatch_times.count)
+        self.assertTrue(first_shard.connected)
+        self.assertEqual(0, first_shard.reconnections)
+
+    def test_reconnected_shard_requests_only_its_snapshots(self):
+        data_source = ShardedWebsocketDataSource(
+            trading_pairs=self.trading_pairs,
+            connections_messages={
+                self.trading_pairs[0]: [[self._diff(self.trading_pairs[0]), ConnectionError("Connection lost")]],
+                self.trading_pairs[1]: [[self._diff(self.trading_pairs[1])]]})
+        data_source.logger().setLevel(1)
+        data_source.logger().addHandler(self)
+        data_source.set_websocket_shards(2)
+        data_source.enable_on_demand_snapshots()
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        first_shard, second_shard = data_source.websocket_shard_stats
+        self.assertEqual(1, first_shard.reconnections)
+        self.assertEqual(0, second_shard.reconnections)
+        self.assertTrue(self._is_logged(
+            "ERROR",
+            "Unexpected error occurred when listening to order book streams (websocket shard 0). "
+            "Retrying in 1.0 seconds..."))
+        requested_snapshots = []
+        while not data_source._snapshot_requests.empty():
+            requested_snapshots.append(data_source._snapshot_requests.get_nowait())
+        self.assertEqual([self.trading_pairs[0], self.trading_pairs[2]], requested_snapshots)
+
+    def test_shard_reconnect_delay_is_reset_once_messages_are_received(self):
+        data_source = ShardedWebsocketDataSource(
+            trading_pairs=self.trading_pairs,
+            connections_messages={
+                self.trading_pairs[0]: [[ConnectionError("Connection refused")],
+                                        [ConnectionError("Connection refused")],
+                                        [self._diff(self.trading_pairs[0]), ConnectionError("Connection lost")],
+                                        [ConnectionError("Connection refused")]]})
+        data_source.logger().setLevel(1)
+        data_source.logger().addHandler(self)
+        data_source.set_websocket_shards(2)
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        retry_logs = [record.getMessage() for record in self.log_records
+                      if record.levelname == "ERROR" and "(websocket shard 0)" in record.getMessage()]
+        self.assertEqual(["1.0", "2.0", "1.0", "2.0"],
+                         [message.split("Retrying in ")[1].split(" ")[0] for message in retry_logs])
@@ -1,6 +1,9 @@
 import asyncio
 import json
+import os
 import re
+import tempfile
+import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable, Dict
@@ -11,7 +14,7 @@ from bidict import bidict
 
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_api_order_book_data_source import AscendExAPIOrderBookDataSource
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionGraph, find_rate, find_rates
 
 from .fixture import Fixture
 
@@ -53,6 +56,7 @@ class RateOracleTest(unittest.TestCase):
 
     def setUp(self) -> None:
         super().setUp()
+        self.addCleanup(setattr, RateOracle, "source", RateOracle.source)
         RateOracle.source = RateOracleSource.binance
         RateOracle.get_binance_prices.cache_clear()
         RateOracle.get_kucoin_prices.cache_clear()
@@ -179,6 +183,92 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rates(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        rates = find_rates(prices, ["HBOT-USDT", "ZBOT-USDT", "HBOT-AAVE", "USDT-USDT"])
+        self.assertEqual({"HBOT-USDT": Decimal("100"),
+                          "ZBOT-USDT": None,
+                          "HBOT-AAVE": Decimal("2"),
+                          "USDT-USDT": Decimal("1")}, rates)
+
+    def test_conversion_graph_rates_are_updated_when_prices_change(self):
+        graph = ConversionGraph({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")})
+        self.assertEqual(Decimal("75"), graph.rate("HBOT-GBP"))
+        self.assertEqual(None, graph.rate("HBOT-EUR"))
+
+        graph["USDT-GBP"] = Decimal("0.5")
+        self.assertEqual(Decimal("50"), graph.rate("HBOT-GBP"))
+
+        graph["EUR-USDT"] = Decimal("2")
+        self.assertEqual(Decimal("50"), graph.rate("HBOT-EUR"))
+
+        del graph["HBOT-USDT"]
+        self.assertEqual(None, graph.rate("HBOT-GBP"))
+
+        graph.set_prices({"HBOT-USDT": Decimal("10"), "USDT-GBP": Decimal("0.5")})
+        self.assertEqual(Decimal("5"), graph.rate("HBOT-GBP"))
+        self.assertEqual(None, graph.rate("HBOT-EUR"))
+
+    def test_conversion_graph_keeps_paths_when_pairs_do_not_change(self):
+        graph = ConversionGraph({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")})
+        path = graph.find_path("HBOT-GBP")
+        self.assertEqual((("HBOT-USDT", False), ("USDT-GBP", False)), path)
+
+        graph.set_prices({"HBOT-USDT": Decimal("10"), "USDT-GBP": Decimal("0.5")})
+        self.assertIs(path, graph._paths["HBOT-GBP"])
+        self.assertEqual(Decimal("5"), graph.rate("HBOT-GBP"))
+
+        graph.set_prices({"USDT-GBP": Decimal("0.5"), "HBOT-USDT": Decimal("10")})
+        self.assertNotIn("HBOT-GBP", graph._paths)
+
+    def test_rate_oracle_rates(self):
+        oracle = RateOracle()
+        oracle._prices = ConversionGraph({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+
+        self.assertEqual({"HBOT-AAVE": Decimal("2"), "USDT-HBOT": Decimal("0.01")},
+                         oracle.rates(["HBOT-AAVE", "USDT-HBOT"]))
+
+    def test_cached_prices_are_loaded_by_a_new_oracle(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, RateOracle.PRICES_CACHE_FILE_NAME)
+            with patch.object(RateOracle, "prices_cache_path", return_value=cache_path):
+                oracle = RateOracle()
+                oracle._prices = ConversionGraph({"HBOT-USDT": Decimal("100.5"), "AAVE-USDT": Decimal("50")})
+                oracle._prices_timestamp = time.time() - 30
+                oracle.save_cached_prices()
+
+                new_oracle = RateOracle()
+                self.assertIsNone(new_oracle.prices_age)
+                self.assertTrue(new_oracle.load_cached_prices())
+
+                self.assertTrue(new_oracle.using_cached_prices)
+                self.assertTrue(new_oracle._ready_event.is_set())
+                self.assertEqual(oracle.prices, new_oracle.prices)
+                self.assertEqual(Decimal("100.5"), new_oracle.rate("HBOT-USDT"))
+                self.assertAlmostEqual(30, new_oracle.prices_age, delta=5)
+
+    def test_cached_prices_are_not_loaded_if_expired_or_from_other_source(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, RateOracle.PRICES_CACHE_FILE_NAME)
+            with patch.object(RateOracle, "prices_cache_path", return_value=cache_path):
+                oracle = RateOracle()
+                self.assertFalse(oracle.load_cached_prices())
+
+                oracle._prices = ConversionGraph({"HBOT-USDT": Decimal("100")})
+                oracle._prices_timestamp = time.time()
+                oracle.save_cached_prices()
+
+                RateOracle.source = RateOracleSource.kucoin
+                self.assertFalse(RateOracle().load_cached_prices())
+
+                RateOracle.source = RateOracleSource.binance
+                oracle._prices_timestamp = time.time() - RateOracle.PRICES_CACHE_MAX_AGE - 1
+                oracle.save_cached_prices()
+                new_oracle = RateOracle()
+                self.assertFalse(new_oracle.load_cached_prices())
+                self.assertFalse(new_oracle.using_cached_prices)
+                self.assertEqual({}, new_oracle.prices)
+
     @aioresponses()
     @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle._binance_connector_without_private_keys")
     def test_get_binance_prices(self, mock_api, connector_creator_mock):
@@ -7,6 +7,8 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -124,3 +126,34 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_with_profiler_records_iterator_ticks(self):
+        profiler = ClockProfiler()
+        time_iterator: TimeIterator = TimeIterator()
+        self.clock_backtest.add_iterator(time_iterator)
+        self.clock_backtest.profiler = profiler
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10 * self.tick_size)
+
+        self.assertEqual({"TimeIterator": 10},
+                         {name: histogram.count for name, histogram in profiler.iterator_durations.items()})
+        self.assertEqual(0, profiler.tick_durations.count)
+
+    def test_run_til_with_profiler_records_overruns_and_missed_ticks(self):
+        class SlowIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                time.sleep(0.15)
+
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        profiler = ClockProfiler()
+        clock.profiler = profiler
+        clock.add_iterator(SlowIterator())
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.7))
+
+        self.assertGreater(profiler.tick_durations.count, 0)
+        self.assertEqual(profiler.tick_durations.count, profiler.overruns)
+        self.assertGreater(profiler.missed_ticks, 0)
+        self.assertGreaterEqual(profiler.iterator_durations["SlowIterator"].percentile(50), 0.15)
+        self.assertEqual(profiler.tick_durations.count, profiler.event_loop_lags.count)
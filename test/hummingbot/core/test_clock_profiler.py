@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class ClockProfilerTests(unittest.TestCase):
+
+    def test_overruns_and_missed_ticks(self):
+        profiler = ClockProfiler()
+        profiler.record_clock_tick(scheduled_time=100.0, wakeup_time=100.001, duration=0.5, tick_size=1.0)
+        # Finishes after the next tick is due
+        profiler.record_clock_tick(scheduled_time=101.0, wakeup_time=101.2, duration=0.9, tick_size=1.0)
+        # The ticks at 102 and 103 were missed
+        profiler.record_clock_tick(scheduled_time=104.0, wakeup_time=104.0, duration=0.1, tick_size=1.0)
+
+        self.assertEqual(1, profiler.overruns)
+        self.assertEqual(2, profiler.missed_ticks)
+        self.assertEqual(3, profiler.tick_durations.count)
+        self.assertAlmostEqual(0.2, profiler.event_loop_lags.max)
+
+    def test_iterators_with_the_same_name_are_reported_separately(self):
+        profiler = ClockProfiler()
+        first_iterator = TimeIterator()
+        second_iterator = TimeIterator()
+        profiler.record_iterator_tick(first_iterator, 0.01)
+        profiler.record_iterator_tick(first_iterator, 0.02)
+        profiler.record_iterator_tick(second_iterator, 0.03)
+
+        durations = profiler.iterator_durations
+        self.assertEqual(2, durations["TimeIterator"].count)
+        self.assertEqual(1, durations[f"TimeIterator ({id(second_iterator):x})"].count)
+
+        df = profiler.durations_df()
+        self.assertEqual(["TimeIterator", f"TimeIterator ({id(second_iterator):x})", "Clock tick", "Event loop lag"],
+                         df["Iterator"].tolist())
+        self.assertEqual(20.0, df["Max (ms)"][0])
+
+    def test_export(self):
+        profiler = ClockProfiler()
+        profiler.record_iterator_tick(TimeIterator(), 0.01)
+        profiler.record_clock_tick(scheduled_time=100.0, wakeup_time=100.5, duration=0.6, tick_size=1.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.export(path)
+            with open(path) as file:
+                exported = json.load(file)
+
+        self.assertEqual(1, exported["overruns"])
+        self.assertEqual(0, exported["missed_ticks"])
+        self.assertEqual(1, exported["iterator_durations"]["TimeIterator"]["count"])
+        self.assertEqual({"le": "inf", "count": 0}, exported["tick_durations"]["buckets"][-1])
+
+    def test_module_imports_in_a_fresh_interpreter(self):
+        # clock.pyx imports the profiler module, so the profiler must not import clock.pyx back at module level
+        result = subprocess.run([sys.executable, "-c", "import hummingbot.core.clock_profiler"],
+                                capture_output=True, text=True)
+
+        self.assertEqual(0, result.returncode, result.stderr)
@@ -0,0 +1,29 @@
+import unittest
+
+from hummingbot.core.utils.duration_histogram import DurationHistogram
+
+
+class DurationHistogramTests(unittest.TestCase):
+
+    def test_record_counts_durations_in_buckets(self):
+        histogram = DurationHistogram()
+        for duration in (0.00005, 0.0003, 0.0003, 0.002, 7.0):
+            histogram.record(duration)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(7.00265, histogram.total)
+        self.assertEqual(7.0, histogram.max)
+        self.assertEqual([1, 0, 2, 0, 1], histogram.bucket_counts[:5])
+        self.assertEqual(1, histogram.bucket_counts[-1])
+
+    def test_percentile_is_upper_bound_of_its_bucket(self):
+        histogram = DurationHistogram()
+        for _ in range(98):
+            histogram.record(0.003)
+        histogram.record(0.2)
+        histogram.record(0.3)
+
+        self.assertEqual(0.005, histogram.percentile(50))
+        self.assertEqual(0.25, histogram.percentile(99))
+        self.assertEqual(0.3, histogram.percentile(100))
+        self.assertEqual(0.0, DurationHistogram().percentile(50))
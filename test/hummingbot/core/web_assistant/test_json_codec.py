@@ -0,0 +1,57 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import (
+    JSONCodec,
+    StdlibJSONCodec,
+    available_json_codecs,
+    get_json_codec,
+    set_json_codec,
+)
+
+
+class JSONCodecTests(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        set_json_codec(None)
+        super().tearDown()
+
+    def test_codecs_decode_text_and_bytes(self):
+        document = {"e": "depthUpdate", "U": 157, "u": 160, "b": [["0.0024", "10"]], "a": [[0.0026, 100.5]]}
+        encoded = json.dumps(document)
+        for codec in available_json_codecs():
+            self.assertEqual(document, codec.loads(encoded), codec.name)
+            self.assertEqual(document, codec.loads(encoded.encode()), codec.name)
+            self.assertEqual(document, json.loads(codec.dumps(document)), codec.name)
+            self.assertIsInstance(codec.dumps(document), str, codec.name)
+
+    def test_codecs_raise_value_error_on_invalid_documents(self):
+        for codec in available_json_codecs():
+            with self.assertRaises(ValueError, msg=codec.name):
+                codec.loads("pong")
+
+    def test_fastest_available_codec_is_used_by_default(self):
+        self.assertIsInstance(get_json_codec(), type(available_json_codecs()[0]))
+        self.assertEqual("json", available_json_codecs()[-1].name)
+        if json_codec.orjson is not None:
+            self.assertEqual("orjson", get_json_codec().name)
+        elif json_codec.ujson is not None:
+            self.assertEqual("ujson", get_json_codec().name)
+
+    def test_ujson_is_preferred_to_the_json_module(self):
+        if json_codec.ujson is None:
+            self.skipTest("ujson is not installed")
+        names = [codec.name for codec in available_json_codecs()]
+
+        self.assertLess(names.index("ujson"), names.index("json"))
+
+    def test_set_json_codec(self):
+        codec = StdlibJSONCodec()
+
+        set_json_codec(codec)
+        self.assertIs(codec, get_json_codec())
+
+        set_json_codec(None)
+        self.assertIsInstance(get_json_codec(), JSONCodec)
+        self.assertIsNot(codec, get_json_codec())
@@ -100,3 +100,19 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_execute_request_encodes_body_as_json_module(self, mocked_api):
+        url = "https://www.test.com/url"
+        data = {"price": 0.1, "amount": 1e-08, "nonce": 2 ** 64 + 1, "side": "BUY"}
+        mocked_api.post(url, body=json.dumps({"one": 1}).encode())
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]))
+        self.async_run_with_timeout(assistant.execute_request(url=url,
+                                                              throttler_limit_id="test",
+                                                              data=data,
+                                                              method=RESTMethod.POST))
+
+        sent_request = next(iter(mocked_api.requests.values()))[0]
+        self.assertEqual(json.dumps(data), sent_request.kwargs["data"])
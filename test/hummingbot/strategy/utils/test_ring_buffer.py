@@ -107,3 +107,30 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_sums_match_values(self):
+        np.random.seed(3141592653)
+        values = np.random.normal(100, 1, self.BUFFER_LENGTH * 3 + 7)
+        for i, value in enumerate(values):
+            self.buffer.add_value(value)
+            buffer_values = self.buffer.get_as_numpy_array()
+            self.assertEqual(min(i + 1, self.BUFFER_LENGTH), self.buffer.size)
+            self.assertAlmostEqual(np.sum(buffer_values), self.buffer.sum_value, 8)
+            self.assertAlmostEqual(np.sum(np.square(buffer_values)), self.buffer.sum_of_squares, 6)
+            self.assertAlmostEqual(np.mean(buffer_values), self.buffer.running_mean, 10)
+            self.assertAlmostEqual(np.var(buffer_values), self.buffer.running_variance, 10)
+
+    def test_running_stats_of_empty_buffer(self):
+        self.assertEqual(0, self.buffer.size)
+        self.assertEqual(0, self.buffer.sum_value)
+        self.assertTrue(np.isnan(self.buffer.running_mean))
+        self.assertTrue(np.isnan(self.buffer.running_variance))
+
+    def test_get_first_value(self):
+        buffer = RingBuffer(3)
+        self.assertTrue(np.isnan(buffer.get_first_value()))
+        for i in range(3):
+            buffer.add_value(i)
+            self.assertEqual(0, buffer.get_first_value())
+        buffer.add_value(3)
+        self.assertEqual(1, buffer.get_first_value())
@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_processing_length_should_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
+
+    def test_moving_average_of_constant_samples(self):
+        self.indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i in range(self.BUFFER_LENGTH * 2):
+            self.indicator.add_sample(10)
+
+        self.assertAlmostEqual(10, self.indicator.current_value, 10)
+
+    def test_moving_average_updates_match_full_calculation(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5 + 3)
+        self.indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            self.assertAlmostEqual(self.indicator._indicator_calculation(), self.indicator.current_value, 8)
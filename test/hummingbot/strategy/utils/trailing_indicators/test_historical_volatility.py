@@ -66,3 +66,17 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_updates_match_full_calculation(self):
+        returns = np.random.normal(0, 0.1, 249)
+        samples = [100]
+        for r in returns:
+            samples.append(samples[-1] * np.exp(r))
+        self.indicator = HistoricalVolatilityIndicator(100, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            if i > 0:
+                self.assertAlmostEqual(np.sqrt(self.indicator._indicator_calculation()),
+                                       self.indicator.current_value,
+                                       8)
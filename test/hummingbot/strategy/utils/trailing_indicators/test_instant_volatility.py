@@ -20,3 +20,11 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_updates_match_full_calculation(self):
+        samples = np.random.normal(100, 10, 250)
+        self.indicator = InstantVolatilityIndicator(100, 1)
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            self.assertAlmostEqual(self.indicator._indicator_calculation(), self.indicator.current_value, 8)
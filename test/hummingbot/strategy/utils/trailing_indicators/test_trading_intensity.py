@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -256,3 +257,63 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def _make_trade(self, timestamp, price, amount):
+        return OrderBookTradeEvent(
+            trading_pair="COINALPHAHBOT",
+            timestamp=timestamp,
+            price=price,
+            amount=amount,
+            type=TradeType.SELL,
+        )
+
+    def _estimated_samples(self, indicator):
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit") as curve_fit_mock:
+            curve_fit_mock.return_value = ([2, 0.1], None)
+            indicator._estimate_intensity()
+        price_levels, lambdas = curve_fit_mock.call_args[0][1:3]
+        return dict(zip(price_levels.tolist(), lambdas.tolist()))
+
+    def test_trades_matched_with_last_quote_before_them(self):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        indicator.last_quotes = [{"timestamp": timestamp + 1, "price": 110},
+                                 {"timestamp": timestamp, "price": 90},
+                                 {"timestamp": timestamp - 1, "price": 80}]
+
+        indicator.register_trade(self._make_trade(timestamp + 0.5, 95, 1))
+        indicator.register_trade(self._make_trade(timestamp + 1.5, 115, 2))
+        indicator.register_trade(self._make_trade(timestamp + 1.5, 105, 3))
+        indicator.calculate(timestamp + 2)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        # Only the quotes from the latest quote matched with a trade are kept
+        self.assertEqual([timestamp + 2, timestamp + 1], [quote["timestamp"] for quote in indicator.last_quotes])
+        self.assertEqual({5.0: 6.0}, self._estimated_samples(indicator))
+
+        # The oldest sample leaves the buffer when a new one arrives
+        indicator.register_trade(self._make_trade(timestamp + 2.5, 99, 4))
+        indicator.calculate(timestamp + 3)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual({1.0: 4.0, 5.0: 5.0}, self._estimated_samples(indicator))
+
+    def test_intensity_not_estimated_again_if_samples_did_not_change(self):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        for price, amount in ((2, 1.8), (3, 1.6), (4, 1.5)):
+            indicator.register_trade(self._make_trade(timestamp + 1, price, amount))
+
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit") as curve_fit_mock:
+            curve_fit_mock.return_value = ([2, 0.1], None)
+            indicator.calculate(timestamp + 1)
+            indicator.calculate(timestamp + 2)
+            indicator.calculate(timestamp + 3)
+
+            self.assertEqual(1, curve_fit_mock.call_count)
+
+            indicator.register_trade(self._make_trade(timestamp + 3.5, 101, 1))
+            indicator.calculate(timestamp + 4)
+
+            self.assertEqual(2, curve_fit_mock.call_count)